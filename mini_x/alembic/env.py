@@ -21,6 +21,8 @@ if config.config_file_name is not None:
 
 from mini_x.infra.db.models.user import User  # noqa: F401, E402
 from mini_x.infra.db.models.blog import BlogPost  # noqa: F401, E402
+from mini_x.infra.db.models.follow import Follow  # noqa: F401, E402
+from mini_x.infra.db.models.timeline import TimelineEntry  # noqa: F401, E402
 
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
@@ -0,0 +1,37 @@
+"""add_users_posts_pulled
+
+Revision ID: 0f6d2b8e4a17
+Revises: e5b1c7d3a820
+Create Date: 2026-10-18 21:47:09.630281
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0f6d2b8e4a17"
+down_revision: Union[str, None] = "e5b1c7d3a820"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("posts_pulled", sa.Boolean(), server_default="false", nullable=False),
+    )
+    # The users whose follows the previous revision flagged.
+    op.execute(
+        sa.text(
+            "UPDATE users SET posts_pulled = true "
+            "WHERE EXISTS (SELECT 1 FROM follows "
+            "WHERE follows.followee_id = users.id AND follows.pulled)"
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "posts_pulled")
@@ -0,0 +1,39 @@
+"""add_blog_posts_user_created_at_index
+
+Revision ID: 1b201d13b8c5
+Revises: 6a04e2988aa9
+Create Date: 2026-10-18 09:12:41.503117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1b201d13b8c5"
+down_revision: Union[str, None] = "6a04e2988aa9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so the migration does not block writes to blog_posts.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_blog_posts_user_id_created_at_id",
+            "blog_posts",
+            ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_blog_posts_user_id_created_at_id",
+            table_name="blog_posts",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,79 @@
+"""create_follows_and_timeline_entries
+
+Revision ID: 4e7c2a9d1f30
+Revises: 1b201d13b8c5
+Create Date: 2026-10-18 11:02:17.284913
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e7c2a9d1f30"
+down_revision: Union[str, None] = "1b201d13b8c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # blog_posts was created without its primary key, which the timeline's
+    # foreign key needs. The index is built concurrently to not block writes.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "blog_posts_pkey",
+            "blog_posts",
+            ["id"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+    op.execute(
+        "ALTER TABLE blog_posts ADD CONSTRAINT blog_posts_pkey "
+        "PRIMARY KEY USING INDEX blog_posts_pkey"
+    )
+
+    # A constant default only touches the catalog, the table is not rewritten.
+    op.add_column(
+        "users",
+        sa.Column("follower_count", sa.Integer(), server_default="0", nullable=False),
+    )
+
+    op.create_table(
+        "follows",
+        sa.Column("follower_id", sa.UUID(), nullable=False),
+        sa.Column("followee_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=False), nullable=False),
+        sa.ForeignKeyConstraint(["follower_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["followee_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("follower_id", "followee_id"),
+    )
+    op.create_index(
+        "ix_follows_followee_id_follower_id",
+        "follows",
+        ["followee_id", "follower_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "timeline_entries",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("post_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=False), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["post_id"], ["blog_posts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "created_at", "post_id"),
+    )
+    op.create_index(
+        "ix_timeline_entries_post_id", "timeline_entries", ["post_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_timeline_entries_post_id", table_name="timeline_entries")
+    op.drop_table("timeline_entries")
+    op.drop_index("ix_follows_followee_id_follower_id", table_name="follows")
+    op.drop_table("follows")
+    op.drop_column("users", "follower_count")
+    op.drop_constraint("blog_posts_pkey", "blog_posts", type_="primary")
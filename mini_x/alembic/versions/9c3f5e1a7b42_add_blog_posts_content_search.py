@@ -0,0 +1,53 @@
+"""add_blog_posts_content_search
+
+Revision ID: 9c3f5e1a7b42
+Revises: 4e7c2a9d1f30
+Create Date: 2026-10-18 12:26:51.730264
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3f5e1a7b42"
+down_revision: Union[str, None] = "4e7c2a9d1f30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A stored generated column rewrites blog_posts once, under an exclusive lock.
+    # The expression is fixed here on purpose, later changes of
+    # POST_SEARCH_TEXT_CONFIG need a migration of their own.
+    op.add_column(
+        "blog_posts",
+        sa.Column(
+            "content_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('english'::regconfig, content)", persisted=True),
+            nullable=True,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_blog_posts_content_tsv",
+            "blog_posts",
+            ["content_tsv"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_blog_posts_content_tsv",
+            table_name="blog_posts",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("blog_posts", "content_tsv")
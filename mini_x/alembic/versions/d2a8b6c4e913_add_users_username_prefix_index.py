@@ -0,0 +1,40 @@
+"""add_users_username_prefix_index
+
+Revision ID: d2a8b6c4e913
+Revises: 9c3f5e1a7b42
+Create Date: 2026-10-18 13:04:17.215904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2a8b6c4e913"
+down_revision: Union[str, None] = "9c3f5e1a7b42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The unique index on username follows the database collation, which cannot
+    # serve prefix ranges, text_pattern_ops compares byte wise and can.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_username_pattern",
+            "users",
+            ["username"],
+            unique=False,
+            postgresql_ops={"username": "text_pattern_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_username_pattern",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,57 @@
+"""add_follows_pulled
+
+Revision ID: e5b1c7d3a820
+Revises: d2a8b6c4e913
+Create Date: 2026-10-18 16:21:42.508113
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b1c7d3a820"
+down_revision: Union[str, None] = "d2a8b6c4e913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# BLOG_TIMELINE_FAN_OUT_MAX_FOLLOWERS_DEFAULT at the time of this revision.
+_FAN_OUT_MAX_FOLLOWERS = 10_000
+
+
+def upgrade() -> None:
+    # A constant default, so adding the column does not rewrite the table.
+    op.add_column(
+        "follows",
+        sa.Column("pulled", sa.Boolean(), server_default="false", nullable=False),
+    )
+    # Flags the followees already over the default threshold, a deployment with
+    # another BLOG_TIMELINE_FAN_OUT_MAX_FOLLOWERS has to recompute them.
+    op.execute(
+        sa.text(
+            "UPDATE follows SET pulled = true FROM users "
+            "WHERE users.id = follows.followee_id "
+            "AND users.follower_count >= :max_followers"
+        ).bindparams(max_followers=_FAN_OUT_MAX_FOLLOWERS)
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_follows_follower_id_pulled",
+            "follows",
+            ["follower_id", "followee_id"],
+            unique=False,
+            postgresql_where=sa.text("pulled"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_follows_follower_id_pulled",
+            table_name="follows",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("follows", "pulled")
@@ -0,0 +1,92 @@
+import logging
+import random
+import time
+import uuid
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mini_x.constants import REQUEST_ID_HEADER
+from mini_x.logging_config import request_id_var
+
+logger = logging.getLogger("mini_x.access")
+
+_REQUEST_ID_HEADER = REQUEST_ID_HEADER.lower().encode()
+_MAX_REQUEST_ID_LENGTH = 128
+
+
+class AccessLogMiddleware:
+    """Tags every request with an id and logs it with its latency once answered.
+
+    The id comes from the X-Request-ID header if the client or proxy sent a
+    sane one, else it is generated. It is echoed in the response and attached to
+    every record logged while the request is handled. Successful requests are
+    logged at `sample_rate`, failed ones always.
+    """
+
+    def __init__(
+        self, app: ASGIApp, access_log: bool = True, sample_rate: float = 1.0
+    ) -> None:
+        self.app = app
+        self.access_log = access_log
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _request_id(scope)
+        token = request_id_var.set(request_id)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (_REQUEST_ID_HEADER, request_id.encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            if self.access_log and (
+                status_code >= 400 or random.random() < self.sample_rate
+            ):
+                self._log(scope, status_code, time.perf_counter() - started)
+            request_id_var.reset(token)
+
+    @staticmethod
+    def _log(scope: Scope, status_code: int, latency_seconds: float) -> None:
+        client = scope.get("client")
+        client_addr = f"{client[0]}:{client[1]}" if client else "-"
+        latency_ms = round(latency_seconds * 1000, 3)
+        logger.info(
+            '%s - "%s %s" %d %.1fms',
+            client_addr,
+            scope["method"],
+            scope["path"],
+            status_code,
+            latency_ms,
+            extra={
+                "client_addr": client_addr,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status_code,
+                "latency_ms": latency_ms,
+            },
+        )
+
+
+def _request_id(scope: Scope) -> str:
+    for name, value in scope["headers"]:
+        if name == _REQUEST_ID_HEADER:
+            request_id = value.decode("latin-1")
+            # It ends up in logs and headers, anything odd is replaced.
+            if len(request_id) <= _MAX_REQUEST_ID_LENGTH and request_id.isprintable():
+                return request_id
+            break
+    return uuid.uuid4().hex
@@ -0,0 +1,321 @@
+import os
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from fastapi import APIRouter, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mini_x.authentication.password_hasher import get_password_hasher
+from mini_x.authentication.token_cache import get_verified_token_cache
+from mini_x.constants import PROMETHEUS_MEDIA_TYPE
+from mini_x.infra.cache.memory import InMemoryCacheBackend
+from mini_x.infra.cache.ttl_cache import CacheStatus
+from mini_x.infra.db.query_stats import (
+    QueryStats,
+    get_query_metrics,
+    query_stats_scope,
+)
+from mini_x.infra.db.session import get_engine, get_pool_status
+from mini_x.metrics import Histogram, MetricsWriter
+from mini_x.repositories.blog.batching_blog import get_post_write_batcher
+from mini_x.repositories.user.cached_user import get_user_cache
+from mini_x.services.blog.post_cache import get_post_cache
+from mini_x.singletons import get_if_created
+
+# Requests that matched no route share one label, so that probing random paths
+# cannot grow the number of series.
+UNMATCHED_ROUTE = "unmatched"
+
+
+@dataclass
+class RouteMetrics:
+    requests: dict[int, int] = field(default_factory=dict)
+    duration: Histogram = field(default_factory=Histogram)
+    db_queries: int = 0
+    db_seconds: float = 0.0
+
+
+class HttpMetrics:
+    """Per route request metrics of this process.
+
+    Only touched from the event loop thread, so plain counters do without locks.
+    With several workers every process has its own, a scrape reports the worker
+    that answered it, labelled with its pid.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.routes: dict[tuple[str, str], RouteMetrics] = {}
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        seconds: float,
+        query_stats: QueryStats,
+    ) -> None:
+        route_metrics = self.routes.get((method, route))
+        if route_metrics is None:
+            route_metrics = self.routes[(method, route)] = RouteMetrics()
+
+        route_metrics.requests[status_code] = (
+            route_metrics.requests.get(status_code, 0) + 1
+        )
+        route_metrics.duration.observe(seconds)
+        route_metrics.db_queries += query_stats.count
+        route_metrics.db_seconds += query_stats.seconds
+
+
+@lru_cache
+def get_http_metrics() -> HttpMetrics:
+    return HttpMetrics()
+
+
+class MetricsMiddleware:
+    """Counts requests per route template, with their latency and DB queries."""
+
+    def __init__(self, app: ASGIApp, http_metrics: HttpMetrics | None = None) -> None:
+        self.app = app
+        self.http_metrics = http_metrics or get_http_metrics()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self.http_metrics.in_flight += 1
+        try:
+            with query_stats_scope() as query_stats:
+                await self.app(scope, receive, send_with_status)
+        finally:
+            self.http_metrics.in_flight -= 1
+            # Set by the router on a match, the path template keeps the label
+            # set small, unlike the raw path with its ids.
+            route = scope.get("route")
+            self.http_metrics.observe(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status_code,
+                time.perf_counter() - started,
+                query_stats,
+            )
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    # All metrics are per process and a scrape reaches any one worker, the pid
+    # keeps their series apart rather than mixing them into one that appears to
+    # reset. Sum over the worker label to aggregate.
+    writer = MetricsWriter(const_labels={"worker": str(os.getpid())})
+    _write_http_metrics(writer, get_http_metrics())
+    _write_db_metrics(writer)
+    _write_cache_metrics(writer)
+    _write_password_hasher_metrics(writer)
+    _write_post_write_batcher_metrics(writer)
+    return Response(writer.render(), media_type=PROMETHEUS_MEDIA_TYPE)
+
+
+def _write_http_metrics(writer: MetricsWriter, http_metrics: HttpMetrics) -> None:
+    routes = sorted(http_metrics.routes.items())
+    writer.counter(
+        "mini_x_http_requests_total",
+        "HTTP requests by route and status code.",
+        (
+            ({"method": method, "route": route, "status": str(status_code)}, count)
+            for (method, route), route_metrics in routes
+            for status_code, count in sorted(route_metrics.requests.items())
+        ),
+    )
+    writer.histogram(
+        "mini_x_http_request_duration_seconds",
+        "HTTP request latency, until the response is fully sent.",
+        (
+            ({"method": method, "route": route}, route_metrics.duration.snapshot())
+            for (method, route), route_metrics in routes
+        ),
+    )
+    writer.gauge(
+        "mini_x_http_requests_in_flight",
+        "HTTP requests being handled.",
+        [({}, http_metrics.in_flight)],
+    )
+    writer.counter(
+        "mini_x_http_db_queries_total",
+        "Database queries run by HTTP requests, by route.",
+        (
+            ({"method": method, "route": route}, route_metrics.db_queries)
+            for (method, route), route_metrics in routes
+        ),
+    )
+    writer.counter(
+        "mini_x_http_db_query_seconds_total",
+        "Time HTTP requests spent in database queries, by route.",
+        (
+            ({"method": method, "route": route}, route_metrics.db_seconds)
+            for (method, route), route_metrics in routes
+        ),
+    )
+
+
+def _write_db_metrics(writer: MetricsWriter) -> None:
+    query_metrics = get_query_metrics().get_status()
+    writer.histogram(
+        "mini_x_db_query_duration_seconds",
+        "Database query latency.",
+        [({}, query_metrics.duration)],
+    )
+    writer.counter(
+        "mini_x_db_query_errors_total",
+        "Database queries that raised.",
+        [({}, query_metrics.errors)],
+    )
+    writer.counter(
+        "mini_x_db_slow_queries_total",
+        "Database queries at least PG_SLOW_QUERY_SECONDS slow.",
+        [({}, query_metrics.slow_queries)],
+    )
+
+    if get_if_created(get_engine) is None:
+        return
+
+    pool = get_pool_status()
+    writer.gauge("mini_x_db_pool_size", "Pooled connections.", [({}, pool.size)])
+    writer.gauge(
+        "mini_x_db_pool_checked_out",
+        "Connections in use.",
+        [({}, pool.checked_out)],
+    )
+    writer.gauge(
+        "mini_x_db_pool_overflow",
+        "Connections open beyond the pool size.",
+        [({}, pool.overflow)],
+    )
+    writer.counter(
+        "mini_x_db_pool_checkouts_total",
+        "Connection checkouts.",
+        [({}, pool.checkouts)],
+    )
+    writer.counter(
+        "mini_x_db_pool_timeouts_total",
+        "Checkouts that timed out waiting for a connection.",
+        [({}, pool.timeouts)],
+    )
+    writer.histogram(
+        "mini_x_db_pool_wait_seconds",
+        "Time spent waiting for a connection.",
+        [({}, pool.wait_time)],
+    )
+
+
+def _write_cache_metrics(writer: MetricsWriter) -> None:
+    statuses: list[tuple[str, CacheStatus]] = []
+    user_cache = get_if_created(get_user_cache)
+    if user_cache is not None:
+        statuses.append(("user", user_cache.get_status()))
+    token_cache = get_if_created(get_verified_token_cache)
+    if token_cache is not None:
+        statuses.append(("token", token_cache.get_status()))
+
+    hits = [({"cache": name}, status.hits) for name, status in statuses]
+    misses = [({"cache": name}, status.misses) for name, status in statuses]
+    sizes = [({"cache": name}, status.size) for name, status in statuses]
+    errors = []
+
+    post_cache = get_if_created(get_post_cache)
+    if post_cache is not None:
+        post_status = post_cache.get_status()
+        hits.append(({"cache": "post"}, post_status.hits))
+        misses.append(({"cache": "post"}, post_status.misses))
+        errors.append(({"cache": "post"}, post_status.errors))
+        # Only the in-memory backend knows its size, Redis is shared anyway.
+        if isinstance(post_cache.backend, InMemoryCacheBackend):
+            sizes.append(({"cache": "post"}, post_cache.backend.get_status().size))
+
+    writer.counter("mini_x_cache_hits_total", "Cache hits.", hits)
+    writer.counter("mini_x_cache_misses_total", "Cache misses.", misses)
+    writer.counter(
+        "mini_x_cache_errors_total",
+        "Cache backend failures, also counted as misses.",
+        errors,
+    )
+    writer.gauge("mini_x_cache_entries", "Entries held by the cache.", sizes)
+
+
+def _write_password_hasher_metrics(writer: MetricsWriter) -> None:
+    password_hasher = get_if_created(get_password_hasher)
+    if password_hasher is None:
+        return
+
+    status = password_hasher.get_status()
+    writer.gauge(
+        "mini_x_password_hasher_pending",
+        "Password hash and verify calls queued or running.",
+        [({}, status.pending)],
+    )
+    writer.gauge(
+        "mini_x_password_hasher_max_pending",
+        "Calls allowed to be pending before new ones are rejected.",
+        [({}, status.max_pending)],
+    )
+    writer.counter(
+        "mini_x_password_hasher_completed_total",
+        "Completed password hash and verify calls.",
+        [({}, status.completed)],
+    )
+    writer.counter(
+        "mini_x_password_hasher_rejected_total",
+        "Calls rejected because too many were pending.",
+        [({}, status.rejected)],
+    )
+    writer.histogram(
+        "mini_x_password_hasher_queue_wait_seconds",
+        "Time calls waited for a hasher worker.",
+        [({}, status.queue_wait)],
+    )
+
+
+def _write_post_write_batcher_metrics(writer: MetricsWriter) -> None:
+    post_write_batcher = get_if_created(get_post_write_batcher)
+    if post_write_batcher is None:
+        return
+
+    status = post_write_batcher.get_status()
+    writer.gauge(
+        "mini_x_post_write_batcher_pending",
+        "Posts waiting for the next batch.",
+        [({}, status.pending)],
+    )
+    writer.counter(
+        "mini_x_post_write_batcher_batches_total",
+        "Batches written.",
+        [({}, status.batches)],
+    )
+    writer.counter(
+        "mini_x_post_write_batcher_posts_total",
+        "Posts written in batches.",
+        [({}, status.posts)],
+    )
+    writer.counter(
+        "mini_x_post_write_batcher_failed_posts_total",
+        "Posts whose write failed.",
+        [({}, status.failed_posts)],
+    )
+    writer.histogram(
+        "mini_x_post_write_batcher_batch_size",
+        "Posts per batch.",
+        [({}, status.batch_size)],
+    )
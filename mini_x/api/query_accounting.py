@@ -0,0 +1,89 @@
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mini_x.constants import DB_DUPLICATE_QUERIES_HEADER, DB_QUERIES_HEADER
+from mini_x.infra.db.query_stats import QueryStats, query_stats_scope
+
+logger = logging.getLogger(__name__)
+
+_DB_QUERIES_HEADER = DB_QUERIES_HEADER.lower().encode()
+_DB_DUPLICATE_QUERIES_HEADER = DB_DUPLICATE_QUERIES_HEADER.lower().encode()
+_LOGGED_STATEMENT_MAX_LENGTH = 500
+
+
+class QueryAccountingMiddleware:
+    """Counts the queries of every request and flags statements it repeats.
+
+    A request running one statement `repeated_query_warn_count` times or more is
+    logged as a likely N+1. With `debug_headers` the count and the time spent
+    are sent in the Server-Timing, X-DB-Queries and X-DB-Duplicate-Queries
+    headers. Those only cover queries run before the response starts, which is
+    all of them but for streamed bodies.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        debug_headers: bool = False,
+        repeated_query_warn_count: int | None = None,
+    ) -> None:
+        self.app = app
+        self.debug_headers = debug_headers
+        self.repeated_query_warn_count = repeated_query_warn_count
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with query_stats_scope() as query_stats:
+
+            async def send_with_query_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        *_debug_headers(query_stats),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(
+                    scope,
+                    receive,
+                    send_with_query_stats if self.debug_headers else send,
+                )
+            finally:
+                self._warn_repeated(scope, query_stats)
+
+    def _warn_repeated(self, scope: Scope, query_stats: QueryStats) -> None:
+        if self.repeated_query_warn_count is None:
+            return
+
+        most_repeated = query_stats.most_repeated()
+        if most_repeated is None or most_repeated[1] < self.repeated_query_warn_count:
+            return
+
+        statement, count = most_repeated
+        logger.warning(
+            "Likely N+1 in %s %s, statement ran %d times: %s",
+            scope["method"],
+            scope["path"],
+            count,
+            statement[:_LOGGED_STATEMENT_MAX_LENGTH],
+            extra={
+                "db_queries": query_stats.count,
+                "db_duplicate_queries": query_stats.duplicates,
+            },
+        )
+
+
+def _debug_headers(query_stats: QueryStats) -> list[tuple[bytes, bytes]]:
+    server_timing = (
+        f'db;dur={query_stats.seconds * 1000:.1f};desc="{query_stats.count} queries"'
+    )
+    return [
+        (b"server-timing", server_timing.encode()),
+        (_DB_QUERIES_HEADER, str(query_stats.count).encode()),
+        (_DB_DUPLICATE_QUERIES_HEADER, str(query_stats.duplicates).encode()),
+    ]
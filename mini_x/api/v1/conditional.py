@@ -0,0 +1,80 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable
+
+from fastapi import Request, Response, status
+
+from mini_x.api.v1.models.blog import BlogPostRead
+
+
+def post_etag(post: BlogPostRead) -> str:
+    return _strong_etag(f"{post.id}:{post.updated_at.isoformat()}")
+
+
+def post_page_etag(posts: Iterable[BlogPostRead], next_cursor: str | None) -> str:
+    return _strong_etag(
+        "|".join(f"{post.id}:{post.updated_at.isoformat()}" for post in posts)
+        + f"|{next_cursor}"
+    )
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None = None
+) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since in its absence, for a GET."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return if_none_match.strip() == "*" or etag in _parse_etags(if_none_match)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have a resolution of one second.
+    return _as_utc(last_modified).replace(microsecond=0) <= since
+
+
+def set_cache_headers(
+    response: Response,
+    etag: str,
+    cache_control: str,
+    last_modified: datetime | None = None,
+) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            _as_utc(last_modified), usegmt=True
+        )
+
+
+def not_modified_response(
+    etag: str, cache_control: str, last_modified: datetime | None = None
+) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_cache_headers(response, etag, cache_control, last_modified)
+    return response
+
+
+def _strong_etag(validator: str) -> str:
+    return '"' + hashlib.blake2b(validator.encode(), digest_size=16).hexdigest() + '"'
+
+
+def _parse_etags(header: str) -> set[str]:
+    # GET uses the weak comparison, so W/"x" matches "x".
+    return {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Timestamps are stored as naive UTC.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
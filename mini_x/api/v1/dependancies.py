@@ -1,20 +1,46 @@
 # TODO: This file might grow large and cause problem -> refactor it later!
 
-from typing import Annotated
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Annotated, AsyncContextManager, AsyncIterator, Callable
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mini_x.authentication.auth_handler import decode_access_token
+from mini_x.authentication.auth_handler import get_principal_from_token
+from mini_x.authentication.password_hasher import PasswordHasher, get_password_hasher
+from mini_x.authentication.principal import Principal
+from mini_x.authentication.token_cache import (
+    VerifiedTokenCache,
+    get_verified_token_cache,
+)
 from mini_x.constants import TOKEN_URL
-from mini_x.infra.db.session import get_session
+from mini_x.infra.db.session import get_session, run_after_commit, session_scope
+from mini_x.repositories.blog.batching_blog import (
+    BatchingBlogRepository,
+    PostWriteBatcher,
+    get_post_write_batcher,
+)
 from mini_x.repositories.blog.blog import BlogRepository
 from mini_x.repositories.blog.blog_abc import BlogRepositoryABC
+from mini_x.repositories.follow.follow import FollowRepository
+from mini_x.repositories.follow.follow_abc import FollowRepositoryABC
+from mini_x.repositories.timeline.backfill import (
+    TimelineBackfiller,
+    get_timeline_backfiller,
+)
+from mini_x.repositories.timeline.timeline import TimelineRepository
+from mini_x.repositories.timeline.timeline_abc import TimelineRepositoryABC
+from mini_x.repositories.user.cached_user import CachedUserRepository, get_user_cache
 from mini_x.repositories.user.user import UserRepository
 from mini_x.repositories.user.user_abc import UserRepositoryABC
 from mini_x.services.blog.blog_service import BlogService
+from mini_x.services.blog.post_cache import PostCache, get_post_cache
+from mini_x.services.timeline.timeline_service import TimelineService
 from mini_x.services.user.user_service import UserService
+from mini_x.settings.blog_settings import BlogSettings, get_blog_settings
+from mini_x.settings.cache_settings import CacheSettings, get_cache_settings
 from mini_x.settings.secrets_settings import get_secret_settings, SecretSettings
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=TOKEN_URL)
@@ -22,44 +48,120 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl=TOKEN_URL)
 
 def get_user_repository(
     session: Annotated[AsyncSession, Depends(get_session)],
+    cache_settings: Annotated[CacheSettings, Depends(get_cache_settings)],
 ) -> UserRepositoryABC:
-    return UserRepository(session)
+    user_repository = UserRepository(session)
+    if cache_settings.user_enabled:
+        return CachedUserRepository(
+            user_repository, get_user_cache(), partial(run_after_commit, session)
+        )
+    return user_repository
 
 
 def get_user_service(
     user_repo: Annotated[UserRepositoryABC, Depends(get_user_repository)],
     secret_settings: Annotated[SecretSettings, Depends(get_secret_settings)],
+    password_hasher: Annotated[PasswordHasher, Depends(get_password_hasher)],
 ) -> UserService:
-    return UserService(user_repo, secret_settings)
+    return UserService(user_repo, secret_settings, password_hasher)
 
 
 def get_blog_repository(
     session: Annotated[AsyncSession, Depends(get_session)],
+    blog_settings: Annotated[BlogSettings, Depends(get_blog_settings)],
+    post_write_batcher: Annotated[
+        PostWriteBatcher | None, Depends(get_post_write_batcher)
+    ],
 ) -> BlogRepositoryABC:
-    return BlogRepository(session)
+    blog_repository = BlogRepository(session, blog_settings.batch_create_copy_threshold)
+    if post_write_batcher is not None:
+        return BatchingBlogRepository(blog_repository, post_write_batcher)
+    return blog_repository
+
+
+def get_follow_repository(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> FollowRepositoryABC:
+    return FollowRepository(session)
+
+
+def get_timeline_repository(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> TimelineRepositoryABC:
+    return TimelineRepository(session)
+
+
+def get_timeline_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    timeline_repo: Annotated[TimelineRepositoryABC, Depends(get_timeline_repository)],
+    follow_repo: Annotated[FollowRepositoryABC, Depends(get_follow_repository)],
+    user_repo: Annotated[UserRepositoryABC, Depends(get_user_repository)],
+    backfiller: Annotated[TimelineBackfiller, Depends(get_timeline_backfiller)],
+    blog_settings: Annotated[BlogSettings, Depends(get_blog_settings)],
+) -> TimelineService:
+    return TimelineService(
+        timeline_repo,
+        follow_repo,
+        user_repo,
+        backfiller,
+        fan_out_max_followers=blog_settings.timeline_fan_out_max_followers,
+        fan_out_resume_followers=blog_settings.timeline_fan_out_resume_followers,
+        backfill_posts=blog_settings.timeline_backfill_posts,
+        after_commit=partial(run_after_commit, session),
+    )
 
 
 def get_blog_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
     blog_repo: Annotated[BlogRepositoryABC, Depends(get_blog_repository)],
-    user_service: Annotated[UserService, Depends(get_user_service)],
+    post_cache: Annotated[PostCache | None, Depends(get_post_cache)],
+    timeline_service: Annotated[TimelineService, Depends(get_timeline_service)],
+    post_write_batcher: Annotated[
+        PostWriteBatcher | None, Depends(get_post_write_batcher)
+    ],
 ) -> BlogService:
-    return BlogService(blog_repo, user_service)
+    return BlogService(
+        blog_repo,
+        post_cache,
+        timeline_service,
+        partial(run_after_commit, session),
+        created_post_fanned_out=post_write_batcher is not None,
+    )
+
+
+BlogServiceScope = Callable[[], AsyncContextManager[BlogService]]
 
 
-async def get_current_user_from_token(
+@asynccontextmanager
+async def _blog_service_scope() -> AsyncIterator[BlogService]:
+    async with session_scope() as session:
+        # Streams only read, the write batcher is of no use here.
+        yield BlogService(get_blog_repository(session, get_blog_settings(), None))
+
+
+def get_blog_service_scope() -> BlogServiceScope:
+    """For streaming responses, the request scoped session is closed before the
+    body is sent, so they open their own session while the body is produced.
+    """
+    return _blog_service_scope
+
+
+async def get_current_principal(
     token: Annotated[str, Depends(oauth2_scheme)],
     secret_settings: Annotated[SecretSettings, Depends(get_secret_settings)],
-) -> str:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    payload = decode_access_token(token, secret_settings)
-    if payload is None:
-        raise credentials_exception
-
-    username: str | None = payload.get("sub")
-    if username is None:
-        raise credentials_exception
-    return username
+    token_cache: Annotated[
+        VerifiedTokenCache | None, Depends(get_verified_token_cache)
+    ],
+) -> Principal:
+    """Identify the caller from the verified token alone, without a user query."""
+    if token_cache is not None:
+        principal = token_cache.get_principal(token, secret_settings)
+    else:
+        principal = get_principal_from_token(token, secret_settings)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return principal
@@ -1,7 +1,10 @@
+from datetime import datetime
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from mini_x.settings.blog_settings import get_blog_settings
+
 
 class BlogPostBase(BaseModel):
     content: str = Field(..., max_length=500)
@@ -15,13 +18,39 @@ class BlogPostUpdate(BlogPostBase):
     pass
 
 
+class BlogPostBatchCreate(BaseModel):
+    # Capped in the model, so an oversized batch is rejected while validating,
+    # before its items are.
+    items: list[BlogPostCreate] = Field(
+        ..., min_length=1, max_length=get_blog_settings().batch_create_max_items
+    )
+
+
 class BlogPostRead(BlogPostBase):
     id: UUID
     user_id: UUID
+    created_at: datetime
+    updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class BlogPostPage(BaseModel):
+    items: list[BlogPostRead]
+    # Opaque keyset cursor of the next page, None on the last page.
+    next_cursor: str | None = None
+
+
+class BlogPostBatchGet(BaseModel):
+    ids: list[UUID] = Field(..., min_length=1)
+
+
+class BlogPostBatch(BaseModel):
+    # In the order the ids were requested, duplicates are returned once.
+    items: list[BlogPostRead]
+    missing_ids: list[UUID]
+
+
 class BlogPostDelete(BaseModel):
     post_id: UUID
     message: str
@@ -29,3 +29,13 @@ class UserRead(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
+
+
+class UserSummary(BaseModel):
+    """What others may see of a user, e.g. in autocomplete results."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    username: str
+    full_name: str | None = None
@@ -0,0 +1,29 @@
+from typing import Any
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered to bytes by pydantic-core.
+
+    Besides plain JSON data it serializes pydantic models (and lists of them)
+    directly, without going through `jsonable_encoder` first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def model_response(
+    content: Any, status_code: int = status.HTTP_200_OK
+) -> FastJSONResponse:
+    """Return an already validated model (or list of models) as is.
+
+    FastAPI hands returned Response objects straight to the client, so the model
+    is serialized exactly once instead of being dumped, validated against the
+    `response_model` again and then encoded. Routes keep declaring
+    `response_model` for the OpenAPI schema.
+    """
+    return FastJSONResponse(content, status_code=status_code)
@@ -1,11 +1,13 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
 from mini_x.api.v1.dependancies import get_user_service
 from mini_x.api.v1.models.user import UserCreate, UserRead
-from mini_x.constants import TOKEN_URL
+from mini_x.api.v1.responses import model_response
+from mini_x.authentication.error import PasswordHashingOverloadedException
+from mini_x.constants import PASSWORD_HASHING_RETRY_AFTER_SECONDS, TOKEN_URL
 from mini_x.services.user.user_service import UserService
 
 router = APIRouter()
@@ -13,13 +15,15 @@ router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=TOKEN_URL)
 
 
-@router.post("/register", status_code=status.HTTP_201_CREATED)
+@router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
 async def register(
     user: UserCreate, user_service: UserService = Depends(get_user_service)
-) -> UserRead:
+) -> Response:
     try:
         registered_user = await user_service.register_user(user_create=user)
-        return registered_user
+        return model_response(registered_user, status_code=status.HTTP_201_CREATED)
+    except PasswordHashingOverloadedException as e:
+        raise _service_unavailable(e)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -29,12 +33,24 @@ async def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     user_service: UserService = Depends(get_user_service),
 ) -> dict[str, str]:
-    token = await user_service.login_user(
-        username=form_data.username, password=form_data.password
-    )
+    try:
+        token = await user_service.login_user(
+            username=form_data.username, password=form_data.password
+        )
+    except PasswordHashingOverloadedException as e:
+        raise _service_unavailable(e)
+
     if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
     return token
+
+
+def _service_unavailable(e: Exception) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(e),
+        headers={"Retry-After": str(PASSWORD_HASHING_RETRY_AFTER_SECONDS)},
+    )
@@ -1,20 +1,58 @@
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+
+from mini_x.api.v1.conditional import (
+    is_not_modified,
+    not_modified_response,
+    post_etag,
+    post_page_etag,
+    set_cache_headers,
+)
+from mini_x.api.v1.responses import model_response
 
 from mini_x.api.v1.dependancies import (
-    get_current_user_from_token,
+    BlogServiceScope,
+    get_current_principal,
     get_blog_service,
+    get_blog_service_scope,
+    get_timeline_service,
 )
 from mini_x.api.v1.models.blog import (
+    BlogPostBatch,
+    BlogPostBatchCreate,
+    BlogPostBatchGet,
     BlogPostRead,
     BlogPostUpdate,
     BlogPostCreate,
     BlogPostDelete,
 )
+from mini_x.authentication.principal import Principal
+from mini_x.constants import NDJSON_MEDIA_TYPE, NEXT_CURSOR_HEADER
 from mini_x.services.blog.blog_service import BlogService
-from mini_x.services.blog.error import BlogServiceUnAuthorizedException
+from mini_x.services.timeline.timeline_service import TimelineService
+from mini_x.services.blog.error import (
+    BlogServiceBatchTooLargeException,
+    BlogServiceInvalidCursorException,
+    BlogServiceInvalidSearchQueryException,
+    BlogServiceUnAuthorizedException,
+)
+from mini_x.settings.blog_settings import BlogSettings, get_blog_settings
+from mini_x.settings.http_cache_settings import (
+    HttpCacheSettings,
+    get_http_cache_settings,
+)
 
 router = APIRouter()
 
@@ -24,65 +62,241 @@ router = APIRouter()
 )
 async def create_post(
     post_data: BlogPostCreate,
-    user_from_token: Annotated[str, Depends(get_current_user_from_token)],
+    principal: Annotated[Principal, Depends(get_current_principal)],
     blog_service: Annotated[BlogService, Depends(get_blog_service)],
-):
+) -> Response:
     try:
-        return await blog_service.create_post(
-            post_data=post_data, user_from_token=user_from_token
+        post = await blog_service.create_post(post_data=post_data, principal=principal)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return model_response(post, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/posts/batch",
+    response_model=list[BlogPostRead],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_posts(
+    batch_create: BlogPostBatchCreate,
+    principal: Annotated[Principal, Depends(get_current_principal)],
+    blog_service: Annotated[BlogService, Depends(get_blog_service)],
+    blog_settings: Annotated[BlogSettings, Depends(get_blog_settings)],
+) -> Response:
+    """Create all posts in one transaction, or none if any of them is invalid."""
+    try:
+        posts = await blog_service.create_posts(
+            batch_create, principal, blog_settings.batch_create_max_items
         )
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+    return model_response(posts, status_code=status.HTTP_201_CREATED)
+
 
 @router.put("/posts/{post_id}", response_model=BlogPostRead)
 async def update_post(
     post_id: UUID,
     post_data: BlogPostUpdate,
-    user_from_token: Annotated[str, Depends(get_current_user_from_token)],
+    principal: Annotated[Principal, Depends(get_current_principal)],
     blog_service: Annotated[BlogService, Depends(get_blog_service)],
-):
+) -> Response:
     try:
-        return await blog_service.update_post(post_id, post_data, user_from_token)
+        post = await blog_service.update_post(post_id, post_data, principal)
     except BlogServiceUnAuthorizedException as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
+    return model_response(post)
 
-@router.delete("/posts/{post_id}")
+
+@router.delete("/posts/{post_id}", response_model=BlogPostDelete)
 async def delete_post(
     post_id: UUID,
-    user_from_token: Annotated[str, Depends(get_current_user_from_token)],
+    principal: Annotated[Principal, Depends(get_current_principal)],
     blog_service: Annotated[BlogService, Depends(get_blog_service)],
-) -> BlogPostDelete:
+) -> Response:
     try:
-        return await blog_service.delete_post(post_id, user_from_token)
+        deleted = await blog_service.delete_post(post_id, principal)
     except BlogServiceUnAuthorizedException as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
+    return model_response(deleted)
+
+
+@router.get("/timeline", response_model=list[BlogPostRead])
+async def read_home_timeline(
+    principal: Annotated[Principal, Depends(get_current_principal)],
+    timeline_service: Annotated[TimelineService, Depends(get_timeline_service)],
+    blog_settings: Annotated[BlogSettings, Depends(get_blog_settings)],
+    limit: int = Query(10, ge=1),
+    cursor: str | None = Query(
+        None, description="The X-Next-Cursor of the previous page."
+    ),
+) -> Response:
+    """Posts of the followed users and of the caller, newest first."""
+    try:
+        page = await timeline_service.get_home_timeline(
+            principal, limit, cursor, blog_settings.timeline_max_limit
+        )
+    except BlogServiceInvalidCursorException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    response = model_response(page.items)
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
+
 
 # In these routs provide the APIs to be publicly available for the internet.
-@router.get("/posts/{post_id}")
+@router.get("/posts", response_model=BlogPostBatch)
+async def read_posts(
+    ids: list[UUID] = Query(..., min_length=1),
+    blog_service: BlogService = Depends(get_blog_service),
+    blog_settings: BlogSettings = Depends(get_blog_settings),
+) -> Response:
+    return await _read_posts_by_ids(ids, blog_service, blog_settings)
+
+
+@router.post("/posts:batchGet", response_model=BlogPostBatch)
+async def batch_get_posts(
+    batch_get: BlogPostBatchGet,
+    blog_service: BlogService = Depends(get_blog_service),
+    blog_settings: BlogSettings = Depends(get_blog_settings),
+) -> Response:
+    """Same as GET /posts, for id lists too long for a query string."""
+    return await _read_posts_by_ids(batch_get.ids, blog_service, blog_settings)
+
+
+async def _read_posts_by_ids(
+    ids: list[UUID], blog_service: BlogService, blog_settings: BlogSettings
+) -> Response:
+    try:
+        batch = await blog_service.get_posts_by_ids(
+            ids, blog_settings.batch_get_max_ids
+        )
+    except BlogServiceBatchTooLargeException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return model_response(batch)
+
+
+@router.get("/posts/search", response_model=list[BlogPostRead])
+async def search_posts(
+    q: str = Query(..., min_length=1, description="Web search syntax."),
+    limit: int = Query(10, ge=1),
+    cursor: str | None = Query(
+        None, description="The X-Next-Cursor of the previous page."
+    ),
+    blog_service: BlogService = Depends(get_blog_service),
+    blog_settings: BlogSettings = Depends(get_blog_settings),
+) -> Response:
+    """Posts matching the query, most relevant first."""
+    try:
+        page = await blog_service.search_posts(
+            q,
+            limit,
+            cursor,
+            blog_settings.search_max_limit,
+            blog_settings.search_query_max_length,
+        )
+    except (
+        BlogServiceInvalidCursorException,
+        BlogServiceInvalidSearchQueryException,
+    ) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    response = model_response(page.items)
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
+
+
+@router.get("/posts/{post_id}", response_model=BlogPostRead)
 async def read_post(
-    post_id: UUID, blog_service: BlogService = Depends(get_blog_service)
-) -> BlogPostRead:
+    post_id: UUID,
+    request: Request,
+    blog_service: BlogService = Depends(get_blog_service),
+    http_cache_settings: HttpCacheSettings = Depends(get_http_cache_settings),
+) -> Response:
     try:
-        return await blog_service.get_post_by_id(post_id)
+        post = await blog_service.get_post_by_id(post_id)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
+    etag = post_etag(post)
+    cache_control = http_cache_settings.post_cache_control
+    if is_not_modified(request, etag, post.updated_at):
+        return not_modified_response(etag, cache_control, post.updated_at)
+
+    response = model_response(post)
+    set_cache_headers(response, etag, cache_control, post.updated_at)
+    return response
+
 
-@router.get("/users/{user_id}/posts")
+@router.get("/users/{user_id}/posts", response_model=list[BlogPostRead])
 async def read_posts_by_user(
     user_id: UUID,
+    request: Request,
     offset: int = Query(0, ge=0),
     limit: int = Query(10, ge=1),
+    cursor: str | None = Query(
+        None, description="The X-Next-Cursor of the previous page, replaces offset."
+    ),
     blog_service: BlogService = Depends(get_blog_service),
-) -> list[BlogPostRead]:
+    http_cache_settings: HttpCacheSettings = Depends(get_http_cache_settings),
+) -> Response:
     try:
-        return await blog_service.get_posts_by_user_id(user_id, offset, limit)
+        page = await blog_service.get_posts_by_user_id(user_id, offset, limit, cursor)
+    except BlogServiceInvalidCursorException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    etag = post_page_etag(page.items, page.next_cursor)
+    cache_control = http_cache_settings.post_list_cache_control
+    # The cursor is part of the ETag, so a 304 also vouches for the cached cursor.
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, cache_control)
+
+    response = model_response(page.items)
+    set_cache_headers(response, etag, cache_control)
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+
+    return response
+
+
+@router.get(
+    "/users/{user_id}/posts:export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def export_posts_by_user(
+    user_id: UUID,
+    blog_service_scope: BlogServiceScope = Depends(get_blog_service_scope),
+    blog_settings: BlogSettings = Depends(get_blog_settings),
+) -> StreamingResponse:
+    """Stream all posts of the user, newest first, one JSON object per line."""
+    return StreamingResponse(
+        _export_posts(user_id, blog_service_scope, blog_settings.export_batch_size),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+async def _export_posts(
+    user_id: UUID, blog_service_scope: BlogServiceScope, batch_size: int
+) -> AsyncIterator[bytes]:
+    async with blog_service_scope() as blog_service:
+        lines: list[bytes] = []
+        async for post in blog_service.stream_posts_by_user_id(user_id, batch_size):
+            lines.append(to_json(post) + b"\n")
+            if len(lines) >= batch_size:
+                yield b"".join(lines)
+                lines.clear()
+        if lines:
+            yield b"".join(lines)
@@ -0,0 +1,30 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response, status
+
+from mini_x.api.v1.models.health import HealthStatus
+from mini_x.api.v1.responses import model_response
+from mini_x.readiness import Readiness, get_readiness
+
+router = APIRouter()
+
+
+@router.get("/live", response_model=HealthStatus)
+async def live() -> Response:
+    """The process serves requests, whatever the state of its dependencies."""
+    return model_response(HealthStatus(status="ok"))
+
+
+@router.get(
+    "/ready",
+    response_model=HealthStatus,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": HealthStatus}},
+)
+async def ready(readiness: Annotated[Readiness, Depends(get_readiness)]) -> Response:
+    """200 once the database pool is warm, 503 before that and while stopping."""
+    if not readiness.ready:
+        return model_response(
+            HealthStatus(status="unavailable"),
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    return model_response(HealthStatus(status="ready"))
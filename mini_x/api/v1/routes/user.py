@@ -1,22 +1,42 @@
+import logging
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from mini_x.api.v1.dependancies import get_current_user_from_token, get_user_service
-from mini_x.api.v1.models.user import UserRead, UserUpdate
+from mini_x.api.v1.dependancies import (
+    get_current_principal,
+    get_timeline_service,
+    get_user_service,
+)
+from mini_x.api.v1.models.user import UserRead, UserSummary, UserUpdate
+from mini_x.api.v1.responses import model_response
+from mini_x.authentication.principal import Principal
+from mini_x.constants import (
+    USER_SEARCH_LIMIT_DEFAULT,
+    USER_SEARCH_MAX_LIMIT,
+    USER_SEARCH_PREFIX_MAX_LENGTH,
+)
+from mini_x.services.timeline.error import (
+    TimelineServiceException,
+    TimelineServiceUserNotFoundException,
+)
+from mini_x.services.timeline.timeline_service import TimelineService
 from mini_x.services.user.error import UserServiceUnAuthorizedException
 from mini_x.services.user.user_service import UserService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
-@router.get("/me")
+@router.get("/me", response_model=UserRead)
 async def read_users_me(
-    user_from_token: Annotated[str, Depends(get_current_user_from_token)],
+    principal: Annotated[Principal, Depends(get_current_principal)],
     user_service: Annotated[UserService, Depends(get_user_service)],
-) -> UserRead:
+) -> Response:
     try:
-        current_user = await user_service.get_current_user(user_from_token)
+        current_user = await user_service.get_current_user(principal)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -24,20 +44,18 @@ async def read_users_me(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return current_user
+    return model_response(current_user)
 
 
-@router.put("/me")
+@router.put("/me", response_model=UserRead)
 async def update_user_me(
     user_update: UserUpdate,
-    user_from_token: Annotated[str, Depends(get_current_user_from_token)],
+    principal: Annotated[Principal, Depends(get_current_principal)],
     user_service: Annotated[UserService, Depends(get_user_service)],
-) -> UserRead:
+) -> Response:
     try:
-        updated_user = await user_service.update_user_profile(
-            user_from_token, user_update
-        )
-        return updated_user
+        updated_user = await user_service.update_user_profile(principal, user_update)
+        return model_response(updated_user)
     except UserServiceUnAuthorizedException as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -46,7 +64,42 @@ async def update_user_me(
         )
 
     except Exception as e:
-        import logging
+        logger.info(str(e))
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.get("/search", response_model=list[UserSummary])
+async def search_users(
+    principal: Annotated[Principal, Depends(get_current_principal)],
+    user_service: Annotated[UserService, Depends(get_user_service)],
+    prefix: str = Query(..., min_length=1, max_length=USER_SEARCH_PREFIX_MAX_LENGTH),
+    limit: int = Query(USER_SEARCH_LIMIT_DEFAULT, ge=1, le=USER_SEARCH_MAX_LIMIT),
+) -> Response:
+    """Users whose username starts with the prefix, case sensitive, by username."""
+    return model_response(await user_service.search_users(prefix, limit))
 
-        logging.info(str(e))
+
+@router.post("/{user_id}/follow", status_code=status.HTTP_204_NO_CONTENT)
+async def follow_user(
+    user_id: UUID,
+    principal: Annotated[Principal, Depends(get_current_principal)],
+    timeline_service: Annotated[TimelineService, Depends(get_timeline_service)],
+) -> None:
+    try:
+        await timeline_service.follow(principal, user_id)
+    except TimelineServiceUserNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except TimelineServiceException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.delete("/{user_id}/follow", status_code=status.HTTP_204_NO_CONTENT)
+async def unfollow_user(
+    user_id: UUID,
+    principal: Annotated[Principal, Depends(get_current_principal)],
+    timeline_service: Annotated[TimelineService, Depends(get_timeline_service)],
+) -> None:
+    try:
+        await timeline_service.unfollow(principal, user_id)
+    except TimelineServiceUserNotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,8 +1,18 @@
 from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
 
 import jwt
 from passlib.context import CryptContext
+from pydantic import ValidationError
 
+from mini_x.authentication.principal import Principal
+from mini_x.constants import (
+    ACCESS_TOKEN_USER_ID_CLAIM,
+    ACCESS_TOKEN_USERNAME_CLAIM,
+    ACCESS_TOKEN_VERSION,
+    ACCESS_TOKEN_VERSION_CLAIM,
+)
 from mini_x.settings.secrets_settings import SecretSettings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -28,16 +38,32 @@ def create_access_token(
         expire = datetime.utcnow() + timedelta(
             minutes=secret_settings.access_token_expire_minutes
         )
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, ACCESS_TOKEN_VERSION_CLAIM: ACCESS_TOKEN_VERSION})
     encoded_jwt = jwt.encode(
         to_encode, secret_settings.key, algorithm=secret_settings.algorithm
     )
     return encoded_jwt
 
 
+def create_user_access_token(
+    user_id: UUID,
+    username: str,
+    secret_settings: SecretSettings,
+    expires_delta: timedelta | None = None,
+) -> str:
+    return create_access_token(
+        data={
+            ACCESS_TOKEN_USERNAME_CLAIM: username,
+            ACCESS_TOKEN_USER_ID_CLAIM: str(user_id),
+        },
+        secret_settings=secret_settings,
+        expires_delta=expires_delta,
+    )
+
+
 def decode_access_token(
     token: str, secret_settings: SecretSettings
-) -> dict[str, str] | None:
+) -> dict[str, Any] | None:
     try:
         payload = jwt.decode(
             token, secret_settings.key, algorithms=[secret_settings.algorithm]
@@ -48,3 +74,29 @@ def decode_access_token(
         return None
     except jwt.PyJWTError:
         return None
+
+
+def get_principal_from_token(
+    token: str, secret_settings: SecretSettings
+) -> Principal | None:
+    payload = decode_access_token(token, secret_settings)
+    if payload is None:
+        return None
+
+    return get_principal_from_payload(payload)
+
+
+def get_principal_from_payload(payload: dict[str, Any]) -> Principal | None:
+    # Tokens from an older claims version may lack the user id, make them log in.
+    if payload.get(ACCESS_TOKEN_VERSION_CLAIM) != ACCESS_TOKEN_VERSION:
+        return None
+
+    try:
+        return Principal.model_validate(
+            {
+                "user_id": payload.get(ACCESS_TOKEN_USER_ID_CLAIM),
+                "username": payload.get(ACCESS_TOKEN_USERNAME_CLAIM),
+            }
+        )
+    except ValidationError:
+        return None
@@ -0,0 +1,5 @@
+from mini_x.errors import MiniXException
+
+
+class PasswordHashingOverloadedException(MiniXException):
+    pass
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, TypeVar
+
+from mini_x.authentication.auth_handler import get_password_hash, verify_password
+from mini_x.authentication.error import PasswordHashingOverloadedException
+from mini_x.metrics import Histogram, HistogramSnapshot
+from mini_x.settings.password_hashing_settings import (
+    PasswordHashingExecutor,
+    get_password_hashing_settings,
+)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PasswordHasherStatus:
+    pending: int
+    max_pending: int
+    completed: int
+    rejected: int
+    queue_wait: HistogramSnapshot
+
+
+def _timed_call(fn: Callable[..., T], *args: str) -> tuple[float, T]:
+    # Runs in the worker, the start time tells how long the call sat in the queue.
+    # time.monotonic is system wide on Linux, so it also holds for process pools.
+    return time.monotonic(), fn(*args)
+
+
+class PasswordHasher:
+    """Runs bcrypt off the event loop on a bounded executor.
+
+    At most `max_pending` calls may be queued or running, further calls are
+    rejected right away instead of piling up behind a login burst.
+    """
+
+    def __init__(self, executor: Executor, max_pending: int) -> None:
+        self._executor = executor
+        self._max_pending = max_pending
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._queue_wait = Histogram()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def get_status(self) -> PasswordHasherStatus:
+        return PasswordHasherStatus(
+            pending=self._pending,
+            max_pending=self._max_pending,
+            completed=self._completed,
+            rejected=self._rejected,
+            queue_wait=self._queue_wait.snapshot(),
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, fn: Callable[..., T], *args: str) -> T:
+        if self._pending >= self._max_pending:
+            self._rejected += 1
+            raise PasswordHashingOverloadedException(
+                "Too many concurrent password checks, try again later."
+            )
+
+        loop = asyncio.get_running_loop()
+        submitted_at = time.monotonic()
+        future = self._executor.submit(_timed_call, fn, *args)
+        self._pending += 1
+        # Released when the job is done rather than when the caller stops waiting:
+        # a cancelled caller, e.g. a client that went away, leaves a running job
+        # behind that still occupies the executor.
+        future.add_done_callback(lambda _: self._release_from_worker(loop))
+
+        started_at, result = await asyncio.wrap_future(future)
+
+        self._queue_wait.observe(started_at - submitted_at)
+        self._completed += 1
+        return result
+
+    def _release_from_worker(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Done callbacks run in the thread that finished the job, the counter is
+        # only touched on the event loop.
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            # The loop is closed, e.g. jobs cancelled by a late shutdown.
+            pass
+
+    def _release(self) -> None:
+        self._pending -= 1
+
+
+@lru_cache
+def get_password_hasher() -> PasswordHasher:
+    settings = get_password_hashing_settings()
+
+    executor: Executor
+    if settings.executor == PasswordHashingExecutor.PROCESS:
+        executor = ProcessPoolExecutor(max_workers=settings.workers)
+    else:
+        executor = ThreadPoolExecutor(
+            max_workers=settings.workers, thread_name_prefix="password-hasher"
+        )
+
+    return PasswordHasher(executor, settings.max_pending)
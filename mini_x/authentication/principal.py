@@ -0,0 +1,12 @@
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class Principal(BaseModel):
+    """The authenticated user as asserted by a verified access token."""
+
+    model_config = ConfigDict(frozen=True)
+
+    user_id: UUID
+    username: str
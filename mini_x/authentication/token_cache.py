@@ -0,0 +1,87 @@
+import hashlib
+import time
+from functools import lru_cache
+from typing import Callable
+
+from mini_x.authentication.auth_handler import (
+    decode_access_token,
+    get_principal_from_payload,
+)
+from mini_x.authentication.principal import Principal
+from mini_x.infra.cache.ttl_cache import CacheStatus, TTLCache
+from mini_x.settings.cache_settings import get_cache_settings
+from mini_x.settings.secrets_settings import SecretSettings
+
+
+class VerifiedTokenCache:
+    """Remembers the principal of tokens whose signature was already verified.
+
+    Entries are keyed by a digest of the token together with the signing key and
+    algorithm, so raw bearer tokens are never held and a rotated key never matches
+    an old entry. An entry lives until the token's `exp`, capped by `ttl_seconds`.
+    Tokens that fail verification are not cached.
+    """
+
+    def __init__(
+        self,
+        cache: TTLCache[bytes, Principal],
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._cache = cache
+        self._ttl_seconds = ttl_seconds
+        # `exp` is wall clock time, unlike the monotonic clock of the cache.
+        self._clock = clock
+
+    def get_principal(
+        self, token: str, secret_settings: SecretSettings
+    ) -> Principal | None:
+        key = self._key(token, secret_settings)
+        principal = self._cache.get(key)
+        if principal is not None:
+            return principal
+
+        payload = decode_access_token(token, secret_settings)
+        if payload is None:
+            return None
+
+        principal = get_principal_from_payload(payload)
+        if principal is None:
+            return None
+
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            ttl_seconds = min(exp - self._clock(), self._ttl_seconds)
+            if ttl_seconds > 0:
+                self._cache.set(key, principal, ttl_seconds)
+
+        return principal
+
+    def flush(self) -> None:
+        """Drop every entry, e.g. after rotating the signing key."""
+        self._cache.clear()
+
+    def get_status(self) -> CacheStatus:
+        return self._cache.get_status()
+
+    @staticmethod
+    def _key(token: str, secret_settings: SecretSettings) -> bytes:
+        digest = hashlib.blake2b(digest_size=32)
+        for part in (secret_settings.algorithm, secret_settings.key, token):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.digest()
+
+
+@lru_cache
+def get_verified_token_cache() -> VerifiedTokenCache | None:
+    settings = get_cache_settings()
+    if not settings.token_enabled:
+        return None
+
+    return VerifiedTokenCache(
+        TTLCache(
+            max_size=settings.token_max_size, ttl_seconds=settings.token_ttl_seconds
+        ),
+        ttl_seconds=settings.token_ttl_seconds,
+    )
@@ -1,11 +1,29 @@
 TOKEN_URL = "/api/v1/auth/login"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+REQUEST_ID_HEADER = "X-Request-ID"
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DB_QUERIES_HEADER = "X-DB-Queries"
+DB_DUPLICATE_QUERIES_HEADER = "X-DB-Duplicate-Queries"
 
 # APP Settings
 SERVER_HOST_DEFAULT = "localhost"
 SERVER_PORT_DEFAULT = 8000
 LOG_LEVEL_DEFAULT = "DEBUG"
 ENABLE_ACCESS_LOG_DEFAULT = True
+LOG_FORMAT_DEFAULT = "text"
+ACCESS_LOG_SAMPLE_RATE_DEFAULT = 1.0
+# Records waiting for the log writer thread, further ones are dropped.
+LOG_QUEUE_MAX_SIZE = 10_000
+ENABLE_METRICS_DEFAULT = True
+ENABLE_DEBUG_HEADERS_DEFAULT = False
 ENABLE_RELOAD_DEFAULT = False
+SERVER_WORKERS_DEFAULT = 1
+SERVER_LOOP_DEFAULT = "auto"
+SERVER_HTTP_DEFAULT = "auto"
+SERVER_KEEP_ALIVE_SECONDS_DEFAULT = 5
+SERVER_BACKLOG_DEFAULT = 2048
+SERVER_GRACEFUL_SHUTDOWN_SECONDS_DEFAULT = 30
 
 # PG Settings
 PG_ENV_PREFIX = "PG_"
@@ -14,8 +32,82 @@ PG_PASSWORD_DEFAULT = "postgres"
 PG_HOST_DEFAULT = "localhost"
 PG_PORT_DEFAULT = 5432
 PG_DATABASE_DEFAULT = "postgres"
+PG_POOL_SIZE_DEFAULT = 5
+PG_MAX_OVERFLOW_DEFAULT = 10
+PG_POOL_TIMEOUT_SECONDS_DEFAULT = 30.0
+PG_POOL_RECYCLE_SECONDS_DEFAULT = 1800
+PG_POOL_PRE_PING_DEFAULT = False
+PG_ECHO_DEFAULT = False
+PG_WARM_UP_CONNECTIONS_DEFAULT = 5
+PG_WARM_UP_RETRY_SECONDS_DEFAULT = 2.0
+PG_SLOW_QUERY_SECONDS_DEFAULT = 0.5
+PG_REPEATED_QUERY_WARN_COUNT_DEFAULT = 10
+PG_CONNECTION_BUDGET_DEFAULT = None
+
+# User search, limits of GET /users/search
+USER_SEARCH_LIMIT_DEFAULT = 10
+USER_SEARCH_MAX_LIMIT = 20
+USER_SEARCH_PREFIX_MAX_LENGTH = 50
 
 # Secret Settings
 SECRET_ENV_PREFIX = "SECRET_"
 SECRET_ALGORITHM_DEFAULT = "HS256"
 SECRET_ACCESS_TOKEN_EXPIRE_MINUTES_DEFAULT = 30
+
+# Access token claims, bump the version whenever the claims change shape so
+# tokens issued before are rejected instead of misread.
+ACCESS_TOKEN_VERSION = 1
+ACCESS_TOKEN_USERNAME_CLAIM = "sub"
+ACCESS_TOKEN_USER_ID_CLAIM = "uid"
+ACCESS_TOKEN_VERSION_CLAIM = "ver"
+
+# Password Hashing Settings
+PASSWORD_HASHING_ENV_PREFIX = "PASSWORD_HASHING_"
+PASSWORD_HASHING_EXECUTOR_DEFAULT = "thread"
+PASSWORD_HASHING_WORKERS_DEFAULT = 4
+PASSWORD_HASHING_MAX_PENDING_DEFAULT = 64
+PASSWORD_HASHING_RETRY_AFTER_SECONDS = 1
+
+# Cache Settings
+CACHE_ENV_PREFIX = "CACHE_"
+CACHE_USER_ENABLED_DEFAULT = False
+CACHE_USER_MAX_SIZE_DEFAULT = 10_000
+CACHE_USER_TTL_SECONDS_DEFAULT = 30.0
+CACHE_TOKEN_ENABLED_DEFAULT = True
+CACHE_TOKEN_MAX_SIZE_DEFAULT = 10_000
+CACHE_TOKEN_TTL_SECONDS_DEFAULT = 300.0
+CACHE_POST_ENABLED_DEFAULT = True
+CACHE_POST_BACKEND_DEFAULT = "memory"
+CACHE_POST_MAX_SIZE_DEFAULT = 10_000
+CACHE_POST_TTL_SECONDS_DEFAULT = 60.0
+CACHE_REDIS_HOST_DEFAULT = "localhost"
+CACHE_REDIS_PORT_DEFAULT = 6379
+CACHE_REDIS_DB_DEFAULT = 0
+CACHE_REDIS_POOL_SIZE_DEFAULT = 8
+CACHE_REDIS_TIMEOUT_SECONDS_DEFAULT = 0.5
+
+# HTTP Cache Settings
+HTTP_CACHE_ENV_PREFIX = "HTTP_CACHE_"
+HTTP_CACHE_POST_CACHE_CONTROL_DEFAULT = "public, max-age=30"
+HTTP_CACHE_POST_LIST_CACHE_CONTROL_DEFAULT = "public, no-cache"
+
+# Text search configuration of blog_posts.content_tsv, part of the generated
+# column's expression, changing it needs a migration.
+POST_SEARCH_TEXT_CONFIG = "english"
+
+# Blog Settings
+BLOG_ENV_PREFIX = "BLOG_"
+BLOG_EXPORT_BATCH_SIZE_DEFAULT = 500
+BLOG_BATCH_GET_MAX_IDS_DEFAULT = 100
+BLOG_BATCH_CREATE_MAX_ITEMS_DEFAULT = 10_000
+BLOG_BATCH_CREATE_COPY_THRESHOLD_DEFAULT = 1_000
+BLOG_WRITE_BATCHING_ENABLED_DEFAULT = False
+BLOG_WRITE_BATCH_WINDOW_SECONDS_DEFAULT = 0.003
+BLOG_WRITE_BATCH_MAX_SIZE_DEFAULT = 100
+BLOG_TIMELINE_FAN_OUT_MAX_FOLLOWERS_DEFAULT = 10_000
+BLOG_TIMELINE_FAN_OUT_RESUME_FOLLOWERS_DEFAULT = 9_000
+BLOG_TIMELINE_BACKFILL_POSTS_DEFAULT = 50
+BLOG_TIMELINE_BACKFILL_BATCH_SIZE_DEFAULT = 500
+BLOG_TIMELINE_MAX_LIMIT_DEFAULT = 100
+BLOG_SEARCH_MAX_LIMIT_DEFAULT = 50
+BLOG_SEARCH_QUERY_MAX_LENGTH_DEFAULT = 200
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class CacheBackendABC(ABC):
+    """Byte oriented key value cache that callers may share across processes."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,19 @@
+from mini_x.infra.cache.backend_abc import CacheBackendABC
+from mini_x.infra.cache.ttl_cache import CacheStatus, TTLCache
+
+
+class InMemoryCacheBackend(CacheBackendABC):
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self._cache: TTLCache[str, bytes] = TTLCache(max_size, ttl_seconds)
+
+    async def get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._cache.set(key, value, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        self._cache.pop(key)
+
+    def get_status(self) -> CacheStatus:
+        return self._cache.get_status()
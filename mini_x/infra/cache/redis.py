@@ -0,0 +1,155 @@
+import asyncio
+
+from mini_x.errors import MiniXException
+from mini_x.infra.cache.backend_abc import CacheBackendABC
+
+RedisReply = bytes | int | list["RedisReply"] | None
+
+
+class RedisError(MiniXException):
+    pass
+
+
+class RedisConnectionError(RedisError):
+    """The connection broke or fell out of sync, it must not be reused."""
+
+
+class _RedisConnection:
+    """A single connection speaking RESP2, enough for GET/SET/DEL and AUTH/SELECT."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+
+    async def execute(self, *args: bytes) -> RedisReply:
+        request = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            request.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        try:
+            self._writer.write(b"".join(request))
+            await self._writer.drain()
+            return await self._read_reply()
+        except (EOFError, ConnectionError) as e:
+            # EOFError covers IncompleteReadError, raised when the server closed
+            # the connection, e.g. an idle one, before or while replying.
+            raise RedisConnectionError(f"Connection lost: {e!r}") from e
+        except (ValueError, asyncio.LimitOverrunError) as e:
+            # A length or integer that does not parse, the stream is out of sync.
+            raise RedisConnectionError(f"Malformed reply: {e!r}") from e
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except OSError:
+            pass
+
+    async def _read_reply(self) -> RedisReply:
+        line = await self._reader.readuntil(b"\r\n")
+        kind, payload = line[:1], line[1:-2]
+
+        if kind == b"+":
+            return payload
+        if kind == b"-":
+            raise RedisError(payload.decode(errors="replace"))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length == -1:
+                return None
+            data = await self._reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(payload)
+            if length == -1:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+
+        # The reply stream is out of sync, the connection must not be reused.
+        raise ConnectionError(f"Unexpected reply from server: {line!r}")
+
+
+class RedisCacheBackend(CacheBackendABC):
+    """Cache backend for any server speaking the Redis protocol (Redis, Valkey, ...).
+
+    Keeps up to `pool_size` connections open, a connection that failed mid command
+    is dropped rather than reused since its reply stream is out of sync.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        db: int = 0,
+        password: str | None = None,
+        pool_size: int = 4,
+        timeout_seconds: float = 1.0,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._db = db
+        self._password = password
+        self._timeout_seconds = timeout_seconds
+        self._idle: asyncio.LifoQueue[_RedisConnection] = asyncio.LifoQueue()
+        self._slots = asyncio.Semaphore(pool_size)
+
+    async def get(self, key: str) -> bytes | None:
+        reply = await self._execute(b"GET", key.encode())
+        return reply if isinstance(reply, bytes) else None
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        ttl_milliseconds = max(int(ttl_seconds * 1000), 1)
+        await self._execute(
+            b"SET", key.encode(), value, b"PX", str(ttl_milliseconds).encode()
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._execute(b"DEL", key.encode())
+
+    async def close(self) -> None:
+        while not self._idle.empty():
+            await self._idle.get_nowait().close()
+
+    async def _execute(self, *args: bytes) -> RedisReply:
+        async with self._slots:
+            if self._idle.empty():
+                connection = await self._connect()
+            else:
+                connection = self._idle.get_nowait()
+
+            try:
+                reply = await asyncio.wait_for(
+                    connection.execute(*args), self._timeout_seconds
+                )
+            except RedisConnectionError:
+                await connection.close()
+                raise
+            except RedisError:
+                # An error reply is complete, the connection is still usable.
+                self._idle.put_nowait(connection)
+                raise
+            except BaseException:
+                await connection.close()
+                raise
+
+            self._idle.put_nowait(connection)
+            return reply
+
+    async def _connect(self) -> _RedisConnection:
+        # The handshake is bounded too, a server that accepts but never answers
+        # would otherwise hold the slot.
+        return await asyncio.wait_for(self._open_connection(), self._timeout_seconds)
+
+    async def _open_connection(self) -> _RedisConnection:
+        reader, writer = await asyncio.open_connection(self._host, self._port)
+        connection = _RedisConnection(reader, writer)
+        try:
+            if self._password:
+                await connection.execute(b"AUTH", self._password.encode())
+            if self._db:
+                await connection.execute(b"SELECT", str(self._db).encode())
+        except BaseException:
+            await connection.close()
+            raise
+        return connection
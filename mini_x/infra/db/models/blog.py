@@ -1,10 +1,11 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, ForeignKey, DateTime
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, String, ForeignKey, DateTime, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
+from mini_x.constants import POST_SEARCH_TEXT_CONFIG
 from mini_x.infra.db.base import Base
 
 
@@ -31,4 +32,26 @@ class BlogPost(Base):
         nullable=False,
     )
 
+    # Maintained by Postgres, deferred so entity loads do not carry it around.
+    content_tsv = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"to_tsvector('{POST_SEARCH_TEXT_CONFIG}'::regconfig, content)",
+                persisted=True,
+            ),
+        )
+    )
+
     author = relationship("User", back_populates="posts")
+
+    __table_args__ = (
+        # Serves the keyset pagination of a user's posts, newest first.
+        Index(
+            "ix_blog_posts_user_id_created_at_id",
+            user_id,
+            created_at.desc(),
+            id.desc(),
+        ),
+        Index("ix_blog_posts_content_tsv", content_tsv, postgresql_using="gin"),
+    )
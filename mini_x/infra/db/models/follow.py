@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    PrimaryKeyConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from mini_x.infra.db.base import Base
+
+
+class Follow(Base):
+    __tablename__ = "follows"
+
+    follower_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    followee_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    created_at = Column(
+        DateTime(timezone=False), default=datetime.utcnow, nullable=False
+    )
+    # The followee's posts are read at timeline time, see User.posts_pulled. Set
+    # for all of the followee's follows along with it, so timeline reads need not
+    # look up the followees. Cleared follower by follower in the background.
+    pulled = Column(Boolean, default=False, server_default="false", nullable=False)
+
+    __table_args__ = (
+        # Who a user follows.
+        PrimaryKeyConstraint(follower_id, followee_id),
+        # Who follows a user, read by the timeline fan-out.
+        Index("ix_follows_followee_id_follower_id", followee_id, follower_id),
+        # The pulled followees of a user, read by every home timeline.
+        Index(
+            "ix_follows_follower_id_pulled",
+            follower_id,
+            followee_id,
+            postgresql_where=pulled,
+        ),
+    )
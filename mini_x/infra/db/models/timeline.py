@@ -0,0 +1,28 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID
+
+from mini_x.infra.db.base import Base
+
+
+class TimelineEntry(Base):
+    """A post materialized into the home timeline of one of its author's followers."""
+
+    __tablename__ = "timeline_entries"
+
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    post_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("blog_posts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # The post's created_at, copied so the timeline is ordered by its own index.
+    created_at = Column(DateTime(timezone=False), nullable=False)
+
+    __table_args__ = (
+        # A timeline page is one range scan of this key, newest first.
+        PrimaryKeyConstraint(user_id, created_at, post_id),
+        # Serves the cascade when a post is deleted.
+        Index("ix_timeline_entries_post_id", post_id),
+    )
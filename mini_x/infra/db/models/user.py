@@ -1,7 +1,15 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, DateTime, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    Column,
+    String,
+    DateTime,
+    Index,
+    Integer,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -14,6 +22,12 @@ class User(Base):
     __table_args__ = (
         UniqueConstraint("username", name="uq_user_username"),
         UniqueConstraint("email", name="uq_user_email"),
+        # Serves username prefix searches, see UserRepository.search_by_username.
+        Index(
+            "ix_users_username_pattern",
+            "username",
+            postgresql_ops={"username": "text_pattern_ops"},
+        ),
     )
 
     id = Column(
@@ -31,6 +45,13 @@ class User(Base):
     zip_code = Column(String, nullable=True, index=True)
     city = Column(String, nullable=True, index=True)
     country = Column(String, nullable=True, index=True)
+    # Maintained on follow and unfollow, decides whether posts are fanned out.
+    follower_count = Column(Integer, default=0, server_default="0", nullable=False)
+    # Too many followers to fan out to, the posts are read at timeline time. Set
+    # and cleared at different counts, see BlogSettings.
+    posts_pulled = Column(
+        Boolean, default=False, server_default="false", nullable=False
+    )
     created_at = Column(
         DateTime(timezone=False), default=datetime.utcnow, nullable=False
     )
@@ -0,0 +1,86 @@
+import time
+from dataclasses import dataclass
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from mini_x.metrics import Histogram, HistogramSnapshot
+
+
+@dataclass(frozen=True)
+class PoolStatus:
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_time: HistogramSnapshot
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    pool_size: int
+    max_overflow: int
+
+
+def worker_pool_limits(
+    pool_size: int, max_overflow: int, connection_budget: int | None, workers: int
+) -> PoolLimits:
+    """Fit a worker's pool into its even share of the connection budget.
+
+    The share goes to the persistent pool first, overflow only gets what is left.
+    """
+    if connection_budget is None:
+        return PoolLimits(pool_size, max_overflow)
+
+    share = connection_budget // workers
+    if share < 1:
+        raise ValueError(
+            f"A connection budget of {connection_budget} cannot serve {workers} "
+            "workers, each needs at least one connection."
+        )
+
+    worker_pool_size = min(pool_size, share)
+    return PoolLimits(
+        pool_size=worker_pool_size,
+        max_overflow=min(max_overflow, share - worker_pool_size),
+    )
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long callers wait for a connection.
+
+    Pool saturation otherwise only shows up as request latency, so every checkout
+    is timed and failed checkouts (pool timeouts) are counted.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_time = Histogram()
+        self.checkouts = 0
+        self.timeouts = 0
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        self.wait_time.observe(time.perf_counter() - started)
+        self.checkouts += 1
+        return connection
+
+    def get_status(self) -> PoolStatus:
+        return PoolStatus(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            # SQLAlchemy reports overflow relative to pool_size, i.e. negative
+            # until the pool is full.
+            overflow=max(self.overflow(), 0),
+            checkouts=self.checkouts,
+            timeouts=self.timeouts,
+            wait_time=self.wait_time.snapshot(),
+        )
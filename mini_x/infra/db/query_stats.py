@@ -0,0 +1,140 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from mini_x.metrics import Histogram, HistogramSnapshot
+from mini_x.settings.pg_database_settings import get_pg_database_settings
+
+logger = logging.getLogger(__name__)
+
+_STARTED_AT = "mini_x_query_started_at"
+# Logged statements are cut, the parameters are never logged.
+_LOGGED_STATEMENT_MAX_LENGTH = 500
+
+
+@dataclass
+class QueryStats:
+    """Queries run on behalf of one request."""
+
+    count: int = 0
+    seconds: float = 0.0
+    # Times each statement ran. Statements are SQLAlchemy's cached strings, so
+    # counting them costs a dict update per query.
+    statements: dict[str, int] = field(default_factory=dict)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def add(self, other: "QueryStats") -> None:
+        self.count += other.count
+        self.seconds += other.seconds
+        for statement, count in other.statements.items():
+            self.statements[statement] = self.statements.get(statement, 0) + count
+
+    @property
+    def duplicates(self) -> int:
+        """Runs of statements beyond their first, with other parameters or not."""
+        return self.count - len(self.statements)
+
+    def most_repeated(self) -> tuple[str, int] | None:
+        if not self.statements:
+            return None
+        return max(self.statements.items(), key=lambda item: item[1])
+
+
+@dataclass(frozen=True)
+class QueryMetricsStatus:
+    errors: int
+    slow_queries: int
+    duration: HistogramSnapshot
+
+
+# SQLAlchemy runs the engine events in a greenlet that shares the caller's
+# context, so they see the stats of the enclosing query_stats_scope.
+query_stats_var: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def query_stats_scope() -> Iterator[QueryStats]:
+    """Count the queries run within, they also count for any enclosing scope."""
+    query_stats = QueryStats()
+    parent = query_stats_var.get()
+    token = query_stats_var.set(query_stats)
+    try:
+        yield query_stats
+    finally:
+        query_stats_var.reset(token)
+        if parent is not None:
+            parent.add(query_stats)
+
+
+class QueryMetrics:
+    """Process wide query timings, fed by the engine's cursor events.
+
+    The async engine runs its events on the event loop thread, so plain counters
+    do without locks. Queries slower than `slow_query_seconds` are logged.
+    """
+
+    def __init__(self, slow_query_seconds: float | None = None) -> None:
+        self.slow_query_seconds = slow_query_seconds
+        self.errors = 0
+        self.slow_queries = 0
+        self.duration = Histogram()
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_execute)
+        event.listen(sync_engine, "handle_error", self._handle_error)
+
+    def get_status(self) -> QueryMetricsStatus:
+        return QueryMetricsStatus(
+            errors=self.errors,
+            slow_queries=self.slow_queries,
+            duration=self.duration.snapshot(),
+        )
+
+    @staticmethod
+    def _before_execute(conn: Connection, *args: Any) -> None:
+        conn.info.setdefault(_STARTED_AT, []).append(time.perf_counter())
+
+    def _after_execute(
+        self, conn: Connection, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        seconds = time.perf_counter() - conn.info[_STARTED_AT].pop()
+        self.duration.observe(seconds)
+
+        if self.slow_query_seconds is not None and seconds >= self.slow_query_seconds:
+            self.slow_queries += 1
+            logger.warning(
+                "Slow query (%.1fms): %s",
+                seconds * 1000,
+                statement[:_LOGGED_STATEMENT_MAX_LENGTH],
+                extra={"query_ms": round(seconds * 1000, 3)},
+            )
+
+        query_stats = query_stats_var.get()
+        if query_stats is not None:
+            query_stats.record(statement, seconds)
+
+    def _handle_error(self, context: ExceptionContext) -> None:
+        self.errors += 1
+        if context.connection is not None:
+            started_at = context.connection.info.get(_STARTED_AT)
+            if started_at:
+                started_at.pop()
+
+
+@lru_cache
+def get_query_metrics() -> QueryMetrics:
+    return QueryMetrics(get_pg_database_settings().slow_query_seconds)
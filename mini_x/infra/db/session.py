@@ -1,4 +1,8 @@
-from typing import AsyncIterator
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Awaitable, Callable, cast
 
 from sqlalchemy.engine import URL
 from sqlalchemy.ext.asyncio import (
@@ -8,25 +12,138 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
 )
 
+from mini_x.infra.db.query_stats import get_query_metrics
+from mini_x.infra.db.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolStatus,
+    worker_pool_limits,
+)
+from mini_x.settings.app_settings import get_app_settings
 from mini_x.settings.pg_database_settings import get_pg_database_settings
 
-pg_settings = get_pg_database_settings()
+logger = logging.getLogger(__name__)
 
-url = URL.create(
-    "postgresql+asyncpg",
-    username=pg_settings.username,
-    password=pg_settings.password.get_secret_value(),
-    host=pg_settings.host,
-    port=pg_settings.port,
-    database=pg_settings.database_name,
-)
+AfterCommitHook = Callable[[], Awaitable[None]]
+# Registers a hook to run once the request's transaction committed.
+AfterCommit = Callable[[AfterCommitHook], None]
 
-engine: AsyncEngine = create_async_engine(url=url, echo=True)
-async_session = async_sessionmaker(
-    bind=engine, expire_on_commit=False, class_=AsyncSession
-)
+_AFTER_COMMIT_HOOKS = "mini_x_after_commit_hooks"
+
+
+@lru_cache
+def get_engine() -> AsyncEngine:
+    """The process wide engine, created on first use rather than on import.
+
+    Every worker process creates its own engine, and with it its own pool.
+    """
+    pg_settings = get_pg_database_settings()
+    pool_limits = worker_pool_limits(
+        pg_settings.pool_size,
+        pg_settings.max_overflow,
+        pg_settings.connection_budget,
+        get_app_settings().get_worker_count(),
+    )
+
+    url = URL.create(
+        "postgresql+asyncpg",
+        username=pg_settings.username,
+        password=pg_settings.password.get_secret_value(),
+        host=pg_settings.host,
+        port=pg_settings.port,
+        database=pg_settings.database_name,
+    )
+    engine = create_async_engine(
+        url=url,
+        echo=pg_settings.echo,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=pool_limits.pool_size,
+        max_overflow=pool_limits.max_overflow,
+        pool_timeout=pg_settings.pool_timeout_seconds,
+        pool_recycle=pg_settings.pool_recycle_seconds,
+        pool_pre_ping=pg_settings.pool_pre_ping,
+    )
+    get_query_metrics().instrument(engine)
+    return engine
+
+
+@lru_cache
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=get_engine(), expire_on_commit=False, class_=AsyncSession
+    )
+
+
+def get_pool_status() -> PoolStatus:
+    return cast(InstrumentedAsyncAdaptedQueuePool, get_engine().pool).get_status()
+
+
+async def warm_up_pool(
+    connections: int, prime: Callable[[AsyncSession], Awaitable[None]]
+) -> None:
+    """Open up to `connections` pooled connections and run `prime` on each.
+
+    The connections are held until all are open, or the pool would hand the same
+    one out again. Only pool_size connections stay pooled, so no more are opened.
+    """
+    engine = get_engine()
+    pool = cast(InstrumentedAsyncAdaptedQueuePool, engine.pool)
+    connections = min(connections, pool.size())
+    if connections < 1:
+        return
+
+    all_open = asyncio.Barrier(connections)
+
+    async def open_connection() -> None:
+        async with engine.connect() as connection:
+            async with AsyncSession(bind=connection) as session:
+                await prime(session)
+            await all_open.wait()
+
+    # A task group, so that one failed connection cancels the ones waiting.
+    async with asyncio.TaskGroup() as task_group:
+        for _ in range(connections):
+            task_group.create_task(open_connection())
+
+
+async def dispose_engine() -> None:
+    """Close all pooled connections, a later use creates a new engine."""
+    if get_engine.cache_info().currsize == 0:
+        return
+
+    await get_engine().dispose()
+    get_sessionmaker.cache_clear()
+    get_engine.cache_clear()
+
+
+def run_after_commit(session: AsyncSession, hook: AfterCommitHook) -> None:
+    """Run `hook` once the session's transaction committed, never on a rollback.
+
+    For side effects others must not observe before the data is visible to
+    them, such as cache invalidation.
+    """
+    session.info.setdefault(_AFTER_COMMIT_HOOKS, []).append(hook)
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """Open a session with a single transaction, committed on a clean exit."""
+    async with get_sessionmaker()() as session:
+        async with session.begin():
+            yield session
+
+        for hook in session.info.pop(_AFTER_COMMIT_HOOKS, ()):
+            try:
+                await hook()
+            except Exception:
+                # The transaction is committed, the hooks cannot fail it anymore.
+                logger.exception("After commit hook failed")
 
 
 async def get_session() -> AsyncIterator[AsyncSession]:
-    async with async_session() as session:
+    """Yield a session whose single transaction spans the whole request.
+
+    Repositories join this transaction instead of opening their own, it is
+    committed once the handler returns and rolled back if it raises.
+    """
+    async with session_scope() as session:
         yield session
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import uuid
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mini_x.authentication.password_hasher import get_password_hasher
+from mini_x.infra.db.session import dispose_engine, warm_up_pool
+from mini_x.readiness import Readiness, get_readiness
+from mini_x.repositories.blog.batching_blog import get_post_write_batcher
+from mini_x.repositories.blog.blog import BlogRepository
+from mini_x.repositories.timeline.backfill import get_timeline_backfiller
+from mini_x.repositories.user.user import UserRepository
+from mini_x.services.blog.post_cache import get_post_cache
+from mini_x.singletons import get_if_created
+from mini_x.settings.pg_database_settings import (
+    PGDatabaseSettings,
+    get_pg_database_settings,
+)
+
+logger = logging.getLogger(__name__)
+
+# Never a real row, the primed statements only have to be planned and run.
+_NO_ID = uuid.UUID(int=0)
+
+
+async def prime_statements(session: AsyncSession) -> None:
+    """Run the statements of the hottest reads once on a fresh connection.
+
+    They go through the repositories so that they match the requests' statements:
+    SQLAlchemy caches the compiled SQL per engine, asyncpg the prepared statement
+    per connection.
+    """
+    user_repository = UserRepository(session)
+    await user_repository.get_by_id(_NO_ID)
+    await user_repository.get_by_username("")
+
+    blog_repository = BlogRepository(session)
+    await blog_repository.get_post_by_id(_NO_ID)
+    await blog_repository.get_posts_by_ids([_NO_ID])
+    await blog_repository.get_posts_by_user_id(_NO_ID)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    readiness = get_readiness()
+    # In the background, so that a database that is not up yet delays readiness
+    # instead of failing the start.
+    warm_up = asyncio.create_task(_warm_up(readiness, get_pg_database_settings()))
+    try:
+        yield
+    finally:
+        readiness.set_ready(False)
+        warm_up.cancel()
+        # Awaited, a warm-up caught opening connections would otherwise race
+        # the disposal, or create a new engine after it.
+        with suppress(asyncio.CancelledError):
+            await warm_up
+        await _close_resources()
+
+
+async def _warm_up(readiness: Readiness, pg_settings: PGDatabaseSettings) -> None:
+    while True:
+        try:
+            await warm_up_pool(pg_settings.warm_up_connections, prime_statements)
+        except Exception as e:
+            logger.warning(
+                "Database warm-up failed, retrying in %.1fs: %s",
+                pg_settings.warm_up_retry_seconds,
+                e,
+            )
+            await asyncio.sleep(pg_settings.warm_up_retry_seconds)
+        else:
+            logger.info("Database warm-up done, ready for traffic.")
+            readiness.set_ready(True)
+            return
+
+
+async def _close_resources() -> None:
+    # The batcher first, its pending posts are written through the engine.
+    post_write_batcher = get_if_created(get_post_write_batcher)
+    if post_write_batcher is not None:
+        await post_write_batcher.close()
+
+    timeline_backfiller = get_if_created(get_timeline_backfiller)
+    if timeline_backfiller is not None:
+        await timeline_backfiller.close()
+
+    post_cache = get_if_created(get_post_cache)
+    if post_cache is not None:
+        await post_cache.backend.close()
+
+    await dispose_engine()
+
+    password_hasher = get_if_created(get_password_hasher)
+    if password_hasher is not None:
+        password_hasher.shutdown()
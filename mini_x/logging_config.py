@@ -1,68 +1,121 @@
+import atexit
+import copy
+import json
 import logging
 import logging.config
+import queue
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from mini_x.constants import LOG_QUEUE_MAX_SIZE
+from mini_x.settings.app_settings import AppSettings, LogFormat
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(request_id)s - %(message)s"
+
+# Set per request by the access log middleware, "-" outside of requests.
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+# Attributes every LogRecord has, anything else was passed in `extra`.
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", logging.INFO, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "request_id"}
 
 LOGGING_CONFIG = {
     "version": 1,
     "disable_existing_loggers": False,
-    "formatters": {
-        "default": {
-            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        },
-        "uvicorn": {
-            "()": "uvicorn.logging.AccessFormatter",
-            "format": "%(asctime)s - %(client_addr)s - %(levelname)s - %(request_line)s - %(status_code)s",
-            "use_colors": None,
-        },
-    },
-    "handlers": {
-        "default": {
-            "level": "INFO",
-            "formatter": "default",
-            "class": "logging.StreamHandler",
-        },
-        "uvicorn.access": {
-            "level": "INFO",
-            "formatter": "uvicorn",
-            "class": "logging.StreamHandler",
-        },
-    },
     "loggers": {
-        "": {
-            "handlers": ["default"],
-            "level": "INFO",
-        },
-        "uvicorn": {
-            "handlers": ["default"],
-            "level": "INFO",
-            "propagate": False,
-        },
-        "uvicorn.error": {
-            "handlers": ["default"],
-            "level": "INFO",
-            "propagate": False,
-        },
-        "uvicorn.access": {
-            "handlers": ["uvicorn.access"],
-            "level": "INFO",
-            "propagate": False,
-        },
-        "sqlalchemy": {
-            "handlers": ["default"],
-            "level": "WARNING",
-            "propagate": False,
-        },
-        "sqlalchemy.engine": {
-            "handlers": ["default"],
-            "level": "WARNING",
-            "propagate": False,
-        },
+        "": {"level": "INFO"},
+        # Records propagate to the root logger's queue handler. uvicorn's own
+        # access log is off, AccessLogMiddleware logs requests instead.
+        "uvicorn": {"level": "INFO"},
+        "uvicorn.error": {"level": "INFO"},
+        "sqlalchemy": {"level": "WARNING"},
+        "sqlalchemy.engine": {"level": "WARNING"},
     },
 }
 
 
-def setup_logging():
+class RequestIdFilter(logging.Filter):
+    # Runs in the caller before the record is queued, while the request's context
+    # is still current.
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Drops records when the queue is full rather than blocking the event loop."""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # QueueHandler.prepare formats the record, traceback included, in the
+        # caller. Only the arguments are merged here, they may change once the
+        # caller moves on. The exception is formatted by the listener thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, fields passed in `extra` become keys."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        entry.update(
+            (key, value)
+            for key, value in record.__dict__.items()
+            if key not in _RECORD_ATTRIBUTES
+        )
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def setup_logging(app_settings: AppSettings) -> None:
+    """Route all records through a queue, written to stderr by a listener thread.
+
+    Loggers only enqueue, so formatting and the blocking write happen off the
+    event loop.
+    """
+    root_logger = logging.getLogger()
+    if any(isinstance(handler, QueueHandler) for handler in root_logger.handlers):
+        # Already set up, e.g. before uvicorn imported this module by name.
+        return
+
     logging.config.dictConfig(LOGGING_CONFIG)
-    # TODO: Ahhh can't disable sqlalchemy logs :(
-    logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
-    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
-    logging.getLogger("sqlalchemy.engine.Engine").setLevel(logging.WARNING)
+
+    stream_handler = logging.StreamHandler()
+    if app_settings.log_format == LogFormat.JSON:
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(LOG_QUEUE_MAX_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+
+    root_logger.handlers = [queue_handler]
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    # Writes what is still queued before the process exits.
+    atexit.register(listener.stop)
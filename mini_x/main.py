@@ -1,15 +1,35 @@
 import uvicorn
 from fastapi import FastAPI
 
-from mini_x.api import router
+from mini_x.api import metrics, router
+from mini_x.api.access_log import AccessLogMiddleware
+from mini_x.api.query_accounting import QueryAccountingMiddleware
+from mini_x.api.v1.responses import FastJSONResponse
+from mini_x.infra.db.pool import worker_pool_limits
+from mini_x.lifespan import lifespan
 from mini_x.logging_config import setup_logging
 from mini_x.settings.app_settings import get_app_settings
-
-setup_logging()
+from mini_x.settings.pg_database_settings import get_pg_database_settings
 
 app_settings = get_app_settings()
 
-app = FastAPI()
+setup_logging(app_settings)
+
+app = FastAPI(default_response_class=FastJSONResponse, lifespan=lifespan)
+# Innermost, so that the request's query counts add up into the metrics ones.
+app.add_middleware(
+    QueryAccountingMiddleware,
+    debug_headers=app_settings.enable_debug_headers,
+    repeated_query_warn_count=get_pg_database_settings().repeated_query_warn_count,
+)
+if app_settings.enable_metrics:
+    app.add_middleware(metrics.MetricsMiddleware)
+    app.include_router(metrics.router)
+app.add_middleware(
+    AccessLogMiddleware,
+    access_log=app_settings.enable_access_log,
+    sample_rate=app_settings.access_log_sample_rate,
+)
 
 app.include_router(router, prefix="/api/v1")
 
@@ -20,13 +40,36 @@ async def root():
 
 
 def main() -> None:
+    workers = app_settings.get_worker_count()
+    pg_settings = get_pg_database_settings()
+    # Raises for a connection budget the workers cannot share, here rather than
+    # in every worker's first use of the engine.
+    worker_pool_limits(
+        pg_settings.pool_size,
+        pg_settings.max_overflow,
+        pg_settings.connection_budget,
+        workers,
+    )
+
+    # With more than one worker uvicorn runs as a supervisor that forks the
+    # workers onto the shared socket, restarts any that die, and passes SIGTERM
+    # on so that each one drains its in-flight requests before exiting.
     uvicorn.run(
         "mini_x.main:app",
         host=app_settings.server_host,
         port=app_settings.server_port,
         log_level=app_settings.log_level.lower(),
-        access_log=app_settings.enable_access_log,
+        # Logging is set up by setup_logging, requests are logged by
+        # AccessLogMiddleware.
+        log_config=None,
+        access_log=False,
         reload=app_settings.enable_reload,
+        workers=workers,
+        loop=app_settings.server_loop.value,
+        http=app_settings.server_http.value,
+        timeout_keep_alive=app_settings.server_keep_alive_seconds,
+        backlog=app_settings.server_backlog,
+        timeout_graceful_shutdown=app_settings.server_graceful_shutdown_seconds,
     )
 
 
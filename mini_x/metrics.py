@@ -0,0 +1,122 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+# Upper bounds in seconds, tuned for waits that should normally stay sub-millisecond.
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    buckets: tuple[float, ...]
+    # Non-cumulative counts, one per bucket plus a trailing +Inf bucket.
+    counts: tuple[int, ...]
+    count: int
+    sum: float
+
+
+class Histogram:
+    """Fixed-bucket histogram, updated from the event loop thread only."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            buckets=self._buckets,
+            counts=tuple(self._counts),
+            count=self._count,
+            sum=self._sum,
+        )
+
+
+Labels = dict[str, str]
+
+
+class MetricsWriter:
+    """Renders metrics in the Prometheus text exposition format (version 0.0.4).
+
+    `const_labels` are added to every sample.
+    """
+
+    def __init__(self, const_labels: Labels | None = None) -> None:
+        self._lines: list[str] = []
+        self._const_labels = const_labels or {}
+
+    def counter(
+        self, name: str, help_text: str, samples: Iterable[tuple[Labels, float]]
+    ) -> None:
+        self._header(name, help_text, "counter")
+        for labels, value in samples:
+            self._sample(name, labels, value)
+
+    def gauge(
+        self, name: str, help_text: str, samples: Iterable[tuple[Labels, float]]
+    ) -> None:
+        self._header(name, help_text, "gauge")
+        for labels, value in samples:
+            self._sample(name, labels, value)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        samples: Iterable[tuple[Labels, HistogramSnapshot]],
+    ) -> None:
+        self._header(name, help_text, "histogram")
+        for labels, snapshot in samples:
+            # Exposed buckets are cumulative, the snapshot's are not.
+            cumulative = 0
+            for bound, count in zip(snapshot.buckets, snapshot.counts):
+                cumulative += count
+                self._sample(
+                    f"{name}_bucket", {**labels, "le": repr(bound)}, cumulative
+                )
+            self._sample(f"{name}_bucket", {**labels, "le": "+Inf"}, snapshot.count)
+            self._sample(f"{name}_sum", labels, snapshot.sum)
+            self._sample(f"{name}_count", labels, snapshot.count)
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+    def _header(self, name: str, help_text: str, metric_type: str) -> None:
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {metric_type}")
+
+    def _sample(self, name: str, labels: Labels, value: float) -> None:
+        if self._const_labels:
+            labels = {**labels, **self._const_labels}
+        if labels:
+            rendered = ",".join(
+                f'{key}="{_escape_label_value(value)}"' for key, value in labels.items()
+            )
+            self._lines.append(f"{name}{{{rendered}}} {value}")
+        else:
+            self._lines.append(f"{name} {value}")
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
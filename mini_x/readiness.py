@@ -0,0 +1,20 @@
+from functools import lru_cache
+
+
+class Readiness:
+    """Whether this process should get traffic: warmed up and not shutting down."""
+
+    def __init__(self) -> None:
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def set_ready(self, ready: bool) -> None:
+        self._ready = ready
+
+
+@lru_cache
+def get_readiness() -> Readiness:
+    return Readiness()
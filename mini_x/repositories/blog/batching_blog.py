@@ -0,0 +1,235 @@
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import AsyncContextManager, AsyncIterator, Callable, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mini_x.infra.db.models.blog import BlogPost
+from mini_x.infra.db.session import session_scope
+from mini_x.metrics import Histogram, HistogramSnapshot
+from mini_x.repositories.blog.blog import BlogRepository, NewPostRow
+from mini_x.repositories.blog.blog_abc import (
+    BlogPostRow,
+    BlogPostSearchRow,
+    BlogRepositoryABC,
+)
+from mini_x.repositories.timeline.timeline import TimelineRepository
+from mini_x.settings.blog_settings import get_blog_settings
+
+logger = logging.getLogger(__name__)
+
+SessionScope = Callable[[], AsyncContextManager[AsyncSession]]
+
+BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+@dataclass(frozen=True)
+class PostWriteBatcherStatus:
+    pending: int
+    batches: int
+    posts: int
+    failed_posts: int
+    batch_size: HistogramSnapshot
+
+
+class PostWriteBatcher:
+    """Coalesces concurrent post inserts into one multi-row INSERT (group commit).
+
+    Inserts are collected for up to `window_seconds`, or until `max_batch_size`
+    are pending, and written in one transaction of their own. Each caller is
+    resolved once its row is committed. If a batch fails its rows are retried one
+    by one, so a bad row only fails its own caller.
+
+    With `fan_out` the posts are fanned out to the timelines in the same
+    transaction, so no post is committed without its timeline entries.
+    """
+
+    def __init__(
+        self,
+        session_scope: SessionScope,
+        window_seconds: float,
+        max_batch_size: int,
+        fan_out: bool = False,
+    ) -> None:
+        self._session_scope = session_scope
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._fan_out = fan_out
+        self._pending: list[tuple[NewPostRow, asyncio.Future[None]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._writes: set[asyncio.Task[None]] = set()
+        self._batches = 0
+        self._posts = 0
+        self._failed_posts = 0
+        self._batch_size = Histogram(buckets=BATCH_SIZE_BUCKETS)
+
+    async def create_post(self, user_id: uuid.UUID, content: str) -> BlogPostRow:
+        loop = asyncio.get_running_loop()
+        row = NewPostRow.new(user_id, content, datetime.utcnow())
+        written: asyncio.Future[None] = loop.create_future()
+        self._pending.append((row, written))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window_seconds, self._flush)
+
+        # Shielded, a caller that goes away does not take the batch down with it;
+        # its row is still written.
+        await asyncio.shield(written)
+        return row
+
+    def get_status(self) -> PostWriteBatcherStatus:
+        return PostWriteBatcherStatus(
+            pending=len(self._pending),
+            batches=self._batches,
+            posts=self._posts,
+            failed_posts=self._failed_posts,
+            batch_size=self._batch_size.snapshot(),
+        )
+
+    async def close(self) -> None:
+        """Write what is pending and wait for all batches in flight."""
+        self._flush()
+        await asyncio.gather(*self._writes, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        write = asyncio.create_task(self._write(batch))
+        self._writes.add(write)
+        write.add_done_callback(self._writes.discard)
+
+    async def _write(
+        self, batch: list[tuple[NewPostRow, asyncio.Future[None]]]
+    ) -> None:
+        try:
+            await self._insert([row for row, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                self._fail(batch, e)
+                return
+            logger.warning("Batched insert of %d posts failed: %s", len(batch), e)
+            for entry in batch:
+                await self._write([entry])
+            return
+
+        self._batches += 1
+        self._posts += len(batch)
+        self._batch_size.observe(len(batch))
+        for _, written in batch:
+            if not written.done():
+                written.set_result(None)
+
+    def _fail(
+        self, batch: list[tuple[NewPostRow, asyncio.Future[None]]], e: Exception
+    ) -> None:
+        self._failed_posts += len(batch)
+        for _, written in batch:
+            if not written.done():
+                written.set_exception(e)
+
+    async def _insert(self, rows: Sequence[NewPostRow]) -> None:
+        async with self._session_scope() as session:
+            await BlogRepository(session).insert_rows(rows)
+            if not self._fan_out:
+                return
+
+            rows_by_author: dict[uuid.UUID, list[NewPostRow]] = {}
+            for row in rows:
+                rows_by_author.setdefault(row.user_id, []).append(row)
+            timeline_repository = TimelineRepository(session)
+            for author_id, author_rows in rows_by_author.items():
+                await timeline_repository.fan_out_posts(author_id, author_rows)
+
+
+class BatchingBlogRepository(BlogRepositoryABC):
+    """Sends `create_post` through a `PostWriteBatcher`, everything else through
+    the wrapped repository.
+
+    A batched post is committed in the batcher's own transaction, together with
+    its fan-out, not in the request's session. It is visible to other requests
+    once `create_post` returns and is not rolled back with the request, so a
+    request failing afterwards answers with an error for a post that exists.
+    """
+
+    def __init__(
+        self, blog_repository: BlogRepositoryABC, batcher: PostWriteBatcher
+    ) -> None:
+        self._blog_repository = blog_repository
+        self._batcher = batcher
+
+    async def create_post(self, user_id: uuid.UUID, content: str) -> BlogPostRow:
+        return await self._batcher.create_post(user_id, content)
+
+    async def create_posts(
+        self, user_id: uuid.UUID, contents: Sequence[str]
+    ) -> Sequence[BlogPostRow]:
+        return await self._blog_repository.create_posts(user_id, contents)
+
+    async def get_post_by_id(self, post_id: uuid.UUID) -> BlogPost | None:
+        return await self._blog_repository.get_post_by_id(post_id)
+
+    async def get_posts_by_ids(
+        self, post_ids: Sequence[uuid.UUID]
+    ) -> Sequence[BlogPostRow]:
+        return await self._blog_repository.get_posts_by_ids(post_ids)
+
+    async def get_posts_by_user_id(
+        self,
+        user_id: uuid.UUID,
+        offset: int = 0,
+        limit: int = 10,
+        after: tuple[datetime, uuid.UUID] | None = None,
+    ) -> Sequence[BlogPostRow]:
+        return await self._blog_repository.get_posts_by_user_id(
+            user_id, offset, limit, after
+        )
+
+    def stream_posts_by_user_id(
+        self, user_id: uuid.UUID, batch_size: int
+    ) -> AsyncIterator[BlogPostRow]:
+        return self._blog_repository.stream_posts_by_user_id(user_id, batch_size)
+
+    async def search_posts(
+        self,
+        query: str,
+        limit: int = 10,
+        after: tuple[float, uuid.UUID] | None = None,
+    ) -> Sequence[BlogPostSearchRow]:
+        return await self._blog_repository.search_posts(query, limit, after)
+
+    async def update_post(
+        self, post_id: uuid.UUID, user_id: uuid.UUID, content: str
+    ) -> BlogPost | None:
+        return await self._blog_repository.update_post(post_id, user_id, content)
+
+    async def delete_post(self, post_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        return await self._blog_repository.delete_post(post_id, user_id)
+
+    async def get_post_owner_id(self, post_id: uuid.UUID) -> uuid.UUID | None:
+        return await self._blog_repository.get_post_owner_id(post_id)
+
+
+@lru_cache
+def get_post_write_batcher() -> PostWriteBatcher | None:
+    settings = get_blog_settings()
+    if not settings.write_batching_enabled:
+        return None
+
+    return PostWriteBatcher(
+        session_scope,
+        window_seconds=settings.write_batch_window_seconds,
+        max_batch_size=settings.write_batch_max_size,
+        fan_out=True,
+    )
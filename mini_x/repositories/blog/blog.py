@@ -1,68 +1,221 @@
 import uuid
-from typing import Sequence
+from datetime import datetime
+from typing import AsyncIterator, NamedTuple, Sequence
 
+from sqlalchemy import (
+    REAL,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
+from mini_x.constants import (
+    BLOG_BATCH_CREATE_COPY_THRESHOLD_DEFAULT,
+    POST_SEARCH_TEXT_CONFIG,
+)
 from mini_x.infra.db.models.blog import BlogPost
-from mini_x.repositories.blog.blog_abc import BlogRepositoryABC
+from mini_x.repositories.blog.blog_abc import (
+    BlogPostRow,
+    BlogPostSearchRow,
+    BlogRepositoryABC,
+)
+
+# Only what BlogPostRead needs, selected as columns the rows skip the identity map
+# and attribute instrumentation of full entities.
+_POST_READ_COLUMNS = (
+    BlogPost.id,
+    BlogPost.user_id,
+    BlogPost.content,
+    BlogPost.created_at,
+    BlogPost.updated_at,
+)
+
+
+class NewPostRow(NamedTuple):
+    """A post to insert, with the values the database would otherwise default."""
+
+    # Field names double as the blog_posts column names for INSERT and COPY.
+    id: uuid.UUID
+    user_id: uuid.UUID
+    content: str
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def new(cls, user_id: uuid.UUID, content: str, now: datetime) -> "NewPostRow":
+        return cls(uuid.uuid4(), user_id, content, now, now)
 
 
 class BlogRepository(BlogRepositoryABC):
-    def __init__(self, db_session: AsyncSession):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        copy_threshold: int = BLOG_BATCH_CREATE_COPY_THRESHOLD_DEFAULT,
+    ):
         self._session = db_session
+        self._copy_threshold = copy_threshold
+
+    async def create_post(self, user_id: uuid.UUID, content: str) -> BlogPostRow:
+        row = NewPostRow.new(user_id, content, datetime.utcnow())
+        await self.insert_rows([row])
+        return row
 
-    async def create_post(self, user_id: uuid.UUID, content: str) -> BlogPost:
-        post = BlogPost(user_id=user_id, content=content)
+    async def create_posts(
+        self, user_id: uuid.UUID, contents: Sequence[str]
+    ) -> Sequence[BlogPostRow]:
+        now = datetime.utcnow()
+        rows = [NewPostRow.new(user_id, content, now) for content in contents]
+        await self.insert_rows(rows)
+        return rows
 
-        async with self._session.begin():
-            self._session.add(post)
-            return post
+    async def insert_rows(self, rows: Sequence[NewPostRow]) -> None:
+        # Ids and timestamps are generated by the caller, so the rows are known
+        # without reading them back and COPY, which cannot return rows, is an
+        # option.
+        if len(rows) >= self._copy_threshold:
+            await self._copy_posts(rows)
+        else:
+            # RETURNING has SQLAlchemy batch the rows into multi-row INSERTs
+            # ("insertmanyvalues"), without it asyncpg runs one INSERT per row.
+            await self._session.execute(
+                insert(BlogPost).returning(BlogPost.id),
+                [row._asdict() for row in rows],
+            )
 
     async def get_post_by_id(self, post_id: uuid.UUID) -> BlogPost | None:
-        async with self._session.begin():
-            result = await self._session.execute(
-                select(BlogPost)
-                .where(BlogPost.id == post_id)
-                .options(selectinload(BlogPost.author))
+        result = await self._session.execute(
+            select(BlogPost).where(BlogPost.id == post_id)
+        )
+        return result.scalars().first()
+
+    async def get_posts_by_ids(
+        self, post_ids: Sequence[uuid.UUID]
+    ) -> Sequence[BlogPostRow]:
+        # A single array parameter, unlike IN the statement is the same for any
+        # number of ids.
+        result = await self._session.execute(
+            select(*_POST_READ_COLUMNS).where(
+                BlogPost.id
+                == any_(
+                    bindparam(
+                        "post_ids", list(post_ids), type_=ARRAY(UUID(as_uuid=True))
+                    )
+                )
             )
-            return result.scalars().first()
+        )
+        return result.all()
 
     async def get_posts_by_user_id(
-        self, user_id: uuid.UUID, offset: int = 0, limit: int = 10
-    ) -> Sequence[BlogPost]:
-        async with self._session.begin():
-            result = await self._session.execute(
-                select(BlogPost)
-                .where(BlogPost.user_id == user_id)
-                .options(selectinload(BlogPost.author))
-                .offset(offset)
-                .limit(limit)
-            )
-            return result.scalars().all()
+        self,
+        user_id: uuid.UUID,
+        offset: int = 0,
+        limit: int = 10,
+        after: tuple[datetime, uuid.UUID] | None = None,
+    ) -> Sequence[BlogPostRow]:
+        query = (
+            select(*_POST_READ_COLUMNS)
+            .where(BlogPost.user_id == user_id)
+            .order_by(BlogPost.created_at.desc(), BlogPost.id.desc())
+            .limit(limit)
+        )
 
-    async def update_post(self, post_id: uuid.UUID, content: str) -> BlogPost | None:
-        async with self._session.begin():
-            post = await self._get_post_by_id(post_id)
+        if after is not None:
+            # Row value comparison, a range scan on ix_blog_posts_user_id_created_at_id
+            query = query.where(tuple_(BlogPost.created_at, BlogPost.id) < after)
+        else:
+            query = query.offset(offset)
 
-            if not post:
-                return None
+        result = await self._session.execute(query)
+        return result.all()
 
-            post.content = content  # type: ignore[assignment]
-            await self._session.merge(post)
-            return post
+    async def stream_posts_by_user_id(
+        self, user_id: uuid.UUID, batch_size: int
+    ) -> AsyncIterator[BlogPostRow]:
+        result = await self._session.stream(
+            select(*_POST_READ_COLUMNS)
+            .where(BlogPost.user_id == user_id)
+            .order_by(BlogPost.created_at.desc(), BlogPost.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for row in result:
+            yield row
+
+    async def search_posts(
+        self,
+        query: str,
+        limit: int = 10,
+        after: tuple[float, uuid.UUID] | None = None,
+    ) -> Sequence[BlogPostSearchRow]:
+        # The GIN index on content_tsv serves `@@` with any tsquery. The config is
+        # the generated column's so that query terms are stemmed like the posts,
+        # another one would still use the index but miss matches.
+        ts_query = func.websearch_to_tsquery(
+            literal(POST_SEARCH_TEXT_CONFIG, type_=REGCONFIG), query
+        )
+        rank = func.ts_rank(BlogPost.content_tsv, ts_query, type_=REAL)
+
+        statement = (
+            select(*_POST_READ_COLUMNS, rank.label("rank"))
+            .where(BlogPost.content_tsv.op("@@")(ts_query))
+            .order_by(rank.desc(), BlogPost.id.desc())
+            .limit(limit)
+        )
 
-    async def delete_post(self, post_id: uuid.UUID) -> None:
-        async with self._session.begin():
-            post = await self._get_post_by_id(post_id)
+        if after is not None:
+            # ts_rank is a real, the cursor rank is cast back so that the row
+            # value comparison does not lose the last post to float rounding.
+            after_rank, after_id = after
+            statement = statement.where(
+                tuple_(rank, BlogPost.id)
+                < tuple_(cast(after_rank, REAL), literal(after_id, BlogPost.id.type))
+            )
 
-            if post:
-                await self._session.delete(post)
+        result = await self._session.execute(statement)
+        return result.all()
 
-    async def _get_post_by_id(self, post_id: uuid.UUID) -> BlogPost | None:
+    async def update_post(
+        self, post_id: uuid.UUID, user_id: uuid.UUID, content: str
+    ) -> BlogPost | None:
         result = await self._session.execute(
-            select(BlogPost).where(BlogPost.id == post_id)
+            update(BlogPost)
+            .where(BlogPost.id == post_id, BlogPost.user_id == user_id)
+            .values(content=content)
+            .returning(BlogPost)
+        )
+        return result.scalars().first()
+
+    async def delete_post(self, post_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        result = await self._session.execute(
+            delete(BlogPost)
+            .where(BlogPost.id == post_id, BlogPost.user_id == user_id)
+            .returning(BlogPost.id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def get_post_owner_id(self, post_id: uuid.UUID) -> uuid.UUID | None:
+        result = await self._session.execute(
+            select(BlogPost.user_id).where(BlogPost.id == post_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def _copy_posts(self, rows: Sequence[NewPostRow]) -> None:
+        # SQLAlchemy's asyncpg adapter only begins its transaction with the first
+        # statement it runs, a COPY sent to the driver before that would commit on
+        # its own. Starting it here keeps the COPY in the session's transaction.
+        await self._session.execute(select(literal(1)))
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+            BlogPost.__tablename__,
+            records=rows,
+            columns=NewPostRow._fields,
         )
-        post = result.scalars().first()
-        return post
@@ -1,29 +1,109 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import Sequence
+from datetime import datetime
+from typing import AsyncIterator, Protocol, Sequence
 
 from mini_x.infra.db.models.blog import BlogPost
 
 
+class BlogPostRow(Protocol):
+    """A post as plain column values, e.g. a result row, not an ORM entity."""
+
+    @property
+    def id(self) -> uuid.UUID: ...
+
+    @property
+    def user_id(self) -> uuid.UUID: ...
+
+    @property
+    def content(self) -> str: ...
+
+    @property
+    def created_at(self) -> datetime: ...
+
+    @property
+    def updated_at(self) -> datetime: ...
+
+
+class BlogPostSearchRow(BlogPostRow, Protocol):
+    @property
+    def rank(self) -> float: ...
+
+
 class BlogRepositoryABC(ABC):
     @abstractmethod
-    async def create_post(self, user_id: uuid.UUID, content: str) -> BlogPost:
+    async def create_post(self, user_id: uuid.UUID, content: str) -> BlogPostRow:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_posts(
+        self, user_id: uuid.UUID, contents: Sequence[str]
+    ) -> Sequence[BlogPostRow]:
+        """Create one post per content in a single statement, in the given order."""
         raise NotImplementedError
 
     @abstractmethod
     async def get_post_by_id(self, post_id: uuid.UUID) -> BlogPost | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_posts_by_ids(
+        self, post_ids: Sequence[uuid.UUID]
+    ) -> Sequence[BlogPostRow]:
+        """Return the existing posts among `post_ids`, in no particular order."""
+        raise NotImplementedError
+
     @abstractmethod
     async def get_posts_by_user_id(
-        self, user_id: uuid.UUID, offset: int = 0, limit: int = 10
-    ) -> Sequence[BlogPost]:
+        self,
+        user_id: uuid.UUID,
+        offset: int = 0,
+        limit: int = 10,
+        after: tuple[datetime, uuid.UUID] | None = None,
+    ) -> Sequence[BlogPostRow]:
+        """Return the user's posts, newest first, as plain column rows.
+
+        When `after` holds the (created_at, id) of a previously returned post the
+        page starts right after it and `offset` is ignored.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_posts_by_user_id(
+        self, user_id: uuid.UUID, batch_size: int
+    ) -> AsyncIterator[BlogPostRow]:
+        """Yield all of the user's posts, newest first, from a server side cursor.
+
+        At most `batch_size` rows are held in memory at a time.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search_posts(
+        self,
+        query: str,
+        limit: int = 10,
+        after: tuple[float, uuid.UUID] | None = None,
+    ) -> Sequence[BlogPostSearchRow]:
+        """Return the posts matching the web search style `query`, best first.
+
+        When `after` holds the (rank, id) of a previously returned post the page
+        starts right after it.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_post(
+        self, post_id: uuid.UUID, user_id: uuid.UUID, content: str
+    ) -> BlogPost | None:
+        """Update the post only if it is owned by `user_id`, else return None."""
         raise NotImplementedError
 
     @abstractmethod
-    async def update_post(self, post_id: uuid.UUID, content: str) -> BlogPost | None:
+    async def delete_post(self, post_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        """Delete the post only if it is owned by `user_id`, return if it was."""
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_post(self, post_id: uuid.UUID) -> None:
+    async def get_post_owner_id(self, post_id: uuid.UUID) -> uuid.UUID | None:
         raise NotImplementedError
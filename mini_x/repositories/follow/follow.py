@@ -0,0 +1,104 @@
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import delete, literal, not_, select, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mini_x.infra.db.models.follow import Follow
+from mini_x.infra.db.models.user import User
+from mini_x.repositories.follow.follow_abc import Followee, FollowRepositoryABC
+
+
+class FollowRepository(FollowRepositoryABC):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def follow(self, follower_id: UUID, followee_id: UUID) -> Followee | None:
+        # Selecting the followee from users makes a missing one insert nothing,
+        # instead of failing on the foreign key.
+        result = await self._session.execute(
+            insert(Follow)
+            .from_select(
+                [Follow.follower_id, Follow.followee_id],
+                select(literal(follower_id, PG_UUID(as_uuid=True)), User.id).where(
+                    User.id == followee_id
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(Follow.followee_id)
+        )
+        if result.scalar_one_or_none() is None:
+            return None
+
+        return await self._change_follower_count(followee_id, 1)
+
+    async def unfollow(self, follower_id: UUID, followee_id: UUID) -> Followee | None:
+        result = await self._session.execute(
+            delete(Follow)
+            .where(Follow.follower_id == follower_id, Follow.followee_id == followee_id)
+            .returning(Follow.followee_id)
+        )
+        if result.scalar_one_or_none() is None:
+            return None
+
+        return await self._change_follower_count(followee_id, -1)
+
+    async def set_pulled(
+        self, followee_id: UUID, pulled: bool, follower_id: UUID | None = None
+    ) -> None:
+        statement = update(Follow).where(Follow.followee_id == followee_id)
+        if follower_id is not None:
+            statement = statement.where(Follow.follower_id == follower_id)
+        await self._session.execute(
+            statement.values(pulled=pulled).execution_options(synchronize_session=False)
+        )
+
+    async def set_posts_pulled(self, user_id: UUID, pulled: bool) -> None:
+        await self._session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(posts_pulled=pulled, updated_at=User.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def unpull_follows(self, followee_id: UUID, limit: int) -> Sequence[UUID]:
+        pulled_follows = (
+            select(Follow.follower_id)
+            .where(Follow.followee_id == followee_id, Follow.pulled)
+            .limit(limit)
+        )
+        # Checked in the statement, the followee may have become too large again
+        # since the job started.
+        posts_pulled = (
+            select(User.posts_pulled).where(User.id == followee_id).scalar_subquery()
+        )
+        result = await self._session.execute(
+            update(Follow)
+            .where(
+                Follow.followee_id == followee_id,
+                Follow.follower_id.in_(pulled_follows),
+                Follow.pulled,
+                not_(posts_pulled),
+            )
+            .values(pulled=False)
+            .returning(Follow.follower_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalars().all()
+
+    async def _change_follower_count(self, user_id: UUID, delta: int) -> Followee:
+        # The row lock serializes concurrent follows, each sees its own count and
+        # the flag as the previous one left it, so exactly one of them switches.
+        result = await self._session.execute(
+            update(User)
+            .where(User.id == user_id)
+            # A follower is not a profile change, keep updated_at as it is.
+            .values(
+                follower_count=User.follower_count + delta,
+                updated_at=User.updated_at,
+            )
+            .returning(User.follower_count, User.posts_pulled)
+            .execution_options(synchronize_session=False)
+        )
+        return Followee(*result.one())
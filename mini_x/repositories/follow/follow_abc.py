@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import NamedTuple, Sequence
+from uuid import UUID
+
+
+class Followee(NamedTuple):
+    follower_count: int
+    posts_pulled: bool
+
+
+class FollowRepositoryABC(ABC):
+    @abstractmethod
+    async def follow(self, follower_id: UUID, followee_id: UUID) -> Followee | None:
+        """Follow the user and count the follower, returns the followee's new
+        follower count and whether its posts are pulled, or None if no follow
+        was added.
+
+        Nothing is added if the follow exists already or the followee does not.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def unfollow(self, follower_id: UUID, followee_id: UUID) -> Followee | None:
+        """Remove the follow and uncount the follower, returns the followee as
+        `follow` does, or None if there was no follow.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_pulled(
+        self, followee_id: UUID, pulled: bool, follower_id: UUID | None = None
+    ) -> None:
+        """Flag the follows of the followee as pulled at timeline time or not.
+
+        Only the follower's follow if given, else all of the followee's.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_posts_pulled(self, user_id: UUID, pulled: bool) -> None:
+        """Switch between fanning out the user's posts and pulling them."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def unpull_follows(self, followee_id: UUID, limit: int) -> Sequence[UUID]:
+        """Clear the pulled flag of up to `limit` follows of the followee, returns
+        their followers.
+
+        Nothing is cleared while the followee's posts are pulled.
+        """
+        raise NotImplementedError
@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from functools import lru_cache
+from typing import AsyncContextManager, Callable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mini_x.infra.db.session import session_scope
+from mini_x.repositories.follow.follow import FollowRepository
+from mini_x.repositories.timeline.timeline import TimelineRepository
+from mini_x.settings.blog_settings import get_blog_settings
+
+logger = logging.getLogger(__name__)
+
+SessionScope = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+class TimelineBackfiller:
+    """Hands an author's followers back from pulling the author's posts to the
+    fan-out, in the background.
+
+    Each batch of `batch_size` followers has its follows unflagged and the
+    author's latest `backfill_posts` copied into its timelines in a transaction
+    of its own. A follower reads the author's posts from blog_posts until its
+    follow is unflagged, so no post goes missing meanwhile, and a job lost with
+    the process only leaves followers pulling.
+    """
+
+    def __init__(
+        self, session_scope: SessionScope, batch_size: int, backfill_posts: int
+    ) -> None:
+        self._session_scope = session_scope
+        self._batch_size = batch_size
+        self._backfill_posts = backfill_posts
+        self._jobs: set[asyncio.Task[None]] = set()
+
+    def schedule(self, author_id: UUID) -> None:
+        job = asyncio.create_task(self._backfill(author_id))
+        self._jobs.add(job)
+        job.add_done_callback(self._jobs.discard)
+
+    async def close(self) -> None:
+        """Stop the jobs in flight, their followers keep pulling."""
+        for job in self._jobs:
+            job.cancel()
+        await asyncio.gather(*self._jobs, return_exceptions=True)
+
+    async def _backfill(self, author_id: UUID) -> None:
+        try:
+            while await self._backfill_batch(author_id) == self._batch_size:
+                pass
+        except Exception as e:
+            logger.warning("Timeline backfill of %s failed: %s", author_id, e)
+
+    async def _backfill_batch(self, author_id: UUID) -> int:
+        async with self._session_scope() as session:
+            follower_ids = await FollowRepository(session).unpull_follows(
+                author_id, self._batch_size
+            )
+            if follower_ids and self._backfill_posts:
+                await TimelineRepository(session).add_author_posts_to_followers(
+                    author_id, follower_ids, self._backfill_posts
+                )
+        return len(follower_ids)
+
+
+@lru_cache
+def get_timeline_backfiller() -> TimelineBackfiller:
+    settings = get_blog_settings()
+    return TimelineBackfiller(
+        session_scope,
+        batch_size=settings.timeline_backfill_batch_size,
+        backfill_posts=settings.timeline_backfill_posts,
+    )
@@ -0,0 +1,206 @@
+from datetime import datetime
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import (
+    DateTime,
+    bindparam,
+    column,
+    delete,
+    func,
+    literal,
+    not_,
+    select,
+    true,
+    tuple_,
+    union,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mini_x.infra.db.models.blog import BlogPost
+from mini_x.infra.db.models.follow import Follow
+from mini_x.infra.db.models.timeline import TimelineEntry
+from mini_x.infra.db.models.user import User
+from mini_x.repositories.blog.blog_abc import BlogPostRow
+from mini_x.repositories.timeline.timeline_abc import TimelineRepositoryABC
+
+_POST_READ_COLUMNS = (
+    BlogPost.id,
+    BlogPost.user_id,
+    BlogPost.content,
+    BlogPost.created_at,
+    BlogPost.updated_at,
+)
+
+
+class TimelineRepository(TimelineRepositoryABC):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def fan_out_posts(
+        self, author_id: UUID, posts: Sequence[BlogPostRow]
+    ) -> None:
+        new_posts = func.unnest(
+            bindparam(
+                "post_ids",
+                [post.id for post in posts],
+                type_=ARRAY(PG_UUID(as_uuid=True)),
+            ),
+            bindparam(
+                "created_ats",
+                [post.created_at for post in posts],
+                type_=ARRAY(DateTime(timezone=False)),
+            ),
+        ).table_valued(
+            column("post_id", PG_UUID(as_uuid=True)),
+            column("created_at", DateTime(timezone=False)),
+        )
+        author_posts_pulled = (
+            select(User.posts_pulled).where(User.id == author_id).scalar_subquery()
+        )
+        recipients = union_all(
+            select(literal(author_id, PG_UUID(as_uuid=True)).label("user_id")),
+            select(Follow.follower_id.label("user_id")).where(
+                Follow.followee_id == author_id,
+                not_(author_posts_pulled),
+            ),
+        ).subquery()
+
+        # One INSERT ... SELECT, the followers are never sent to the application.
+        await self._session.execute(
+            insert(TimelineEntry)
+            .from_select(
+                [
+                    TimelineEntry.user_id,
+                    TimelineEntry.post_id,
+                    TimelineEntry.created_at,
+                ],
+                select(
+                    recipients.c.user_id, new_posts.c.post_id, new_posts.c.created_at
+                ).join_from(recipients, new_posts, true()),
+            )
+            .on_conflict_do_nothing()
+        )
+
+    async def add_author_posts(
+        self, user_id: UUID, author_id: UUID, limit: int
+    ) -> None:
+        await self._session.execute(
+            insert(TimelineEntry)
+            .from_select(
+                [
+                    TimelineEntry.user_id,
+                    TimelineEntry.post_id,
+                    TimelineEntry.created_at,
+                ],
+                select(
+                    literal(user_id, PG_UUID(as_uuid=True)),
+                    BlogPost.id,
+                    BlogPost.created_at,
+                )
+                .where(BlogPost.user_id == author_id)
+                .order_by(BlogPost.created_at.desc(), BlogPost.id.desc())
+                .limit(limit),
+            )
+            .on_conflict_do_nothing()
+        )
+
+    async def add_author_posts_to_followers(
+        self, author_id: UUID, follower_ids: Sequence[UUID], limit: int
+    ) -> None:
+        followers = func.unnest(
+            bindparam(
+                "follower_ids",
+                list(follower_ids),
+                type_=ARRAY(PG_UUID(as_uuid=True)),
+            )
+        ).table_valued(column("follower_id", PG_UUID(as_uuid=True)))
+        latest_posts = (
+            select(BlogPost.id, BlogPost.created_at)
+            .where(BlogPost.user_id == author_id)
+            .order_by(BlogPost.created_at.desc(), BlogPost.id.desc())
+            .limit(limit)
+            .subquery()
+        )
+        await self._session.execute(
+            insert(TimelineEntry)
+            .from_select(
+                [
+                    TimelineEntry.user_id,
+                    TimelineEntry.post_id,
+                    TimelineEntry.created_at,
+                ],
+                select(
+                    followers.c.follower_id,
+                    latest_posts.c.id,
+                    latest_posts.c.created_at,
+                ).join_from(followers, latest_posts, true()),
+            )
+            .on_conflict_do_nothing()
+        )
+
+    async def remove_author_posts(self, user_id: UUID, author_id: UUID) -> None:
+        await self._session.execute(
+            delete(TimelineEntry)
+            .where(
+                TimelineEntry.user_id == user_id,
+                TimelineEntry.post_id == BlogPost.id,
+                BlogPost.user_id == author_id,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_home_timeline(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: tuple[datetime, UUID] | None,
+    ) -> Sequence[BlogPostRow]:
+        # A range scan of the user's timeline key, joined to the posts by id.
+        materialized = (
+            select(*_POST_READ_COLUMNS)
+            .join_from(TimelineEntry, BlogPost, TimelineEntry.post_id == BlogPost.id)
+            .where(TimelineEntry.user_id == user_id)
+            .order_by(TimelineEntry.created_at.desc(), TimelineEntry.post_id.desc())
+            .limit(limit)
+        )
+        # Followed accounts too large to fan out, usually none. Only the flagged
+        # follows are read, from a partial index, not everyone the user follows.
+        pulled_authors = (
+            select(Follow.followee_id)
+            .where(Follow.follower_id == user_id, Follow.pulled)
+            .subquery()
+        )
+        # The latest posts of each pulled author on their own, a short range scan
+        # of (user_id, created_at) per author instead of merging all of their
+        # posts.
+        author_posts = (
+            select(*_POST_READ_COLUMNS)
+            .where(BlogPost.user_id == pulled_authors.c.followee_id)
+            .order_by(BlogPost.created_at.desc(), BlogPost.id.desc())
+            .limit(limit)
+        )
+
+        if after is not None:
+            materialized = materialized.where(
+                tuple_(TimelineEntry.created_at, TimelineEntry.post_id) < after
+            )
+            author_posts = author_posts.where(
+                tuple_(BlogPost.created_at, BlogPost.id) < after
+            )
+
+        latest_author_posts = author_posts.lateral()
+        pulled = select(latest_author_posts).join_from(
+            pulled_authors, latest_author_posts, true()
+        )
+
+        # UNION drops posts that were fanned out before their author grew large.
+        merged = union(materialized, pulled).subquery()
+        result = await self._session.execute(
+            select(merged)
+            .order_by(merged.c.created_at.desc(), merged.c.id.desc())
+            .limit(limit)
+        )
+        return result.all()
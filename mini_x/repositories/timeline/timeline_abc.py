@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Sequence
+from uuid import UUID
+
+from mini_x.repositories.blog.blog_abc import BlogPostRow
+
+
+class TimelineRepositoryABC(ABC):
+    @abstractmethod
+    async def fan_out_posts(
+        self, author_id: UUID, posts: Sequence[BlogPostRow]
+    ) -> None:
+        """Add the author's new posts to the author's own timeline, and to those
+        of the followers unless the author's posts are pulled.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_author_posts(
+        self, user_id: UUID, author_id: UUID, limit: int
+    ) -> None:
+        """Backfill the user's timeline with the author's latest posts."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_author_posts_to_followers(
+        self, author_id: UUID, follower_ids: Sequence[UUID], limit: int
+    ) -> None:
+        """Backfill the timelines of the given followers with the author's latest
+        posts.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_author_posts(self, user_id: UUID, author_id: UUID) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_home_timeline(
+        self,
+        user_id: UUID,
+        limit: int,
+        after: tuple[datetime, UUID] | None,
+    ) -> Sequence[BlogPostRow]:
+        """Return the user's timeline, newest first, after the (created_at, id) of
+        a previously returned post.
+
+        Posts of followees flagged as pulled are not fanned out, they are read
+        from blog_posts instead.
+        """
+        raise NotImplementedError
@@ -0,0 +1,106 @@
+from functools import lru_cache
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import inspect
+
+from mini_x.infra.cache.ttl_cache import TTLCache
+from mini_x.infra.db.models.user import User
+from mini_x.infra.db.session import AfterCommit
+from mini_x.repositories.user.user_abc import UserRepositoryABC, UserSummaryRow
+from mini_x.settings.cache_settings import get_cache_settings
+
+# Users are cached by id, usernames only map to the id so that dropping the id
+# entry invalidates both lookups.
+UserCacheKey = tuple[str, UUID | str]
+UserCache = TTLCache[UserCacheKey, User | UUID]
+
+_BY_ID = "id"
+_BY_USERNAME = "username"
+
+
+class CachedUserRepository(UserRepositoryABC):
+    """Serves id and username lookups from a process wide cache.
+
+    Cached users are detached copies, so they stay readable after the session that
+    loaded them is gone. Every write through this repository invalidates the user,
+    and with `after_commit` once more when the transaction committed.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepositoryABC,
+        cache: UserCache,
+        after_commit: AfterCommit | None = None,
+    ) -> None:
+        self._user_repository = user_repository
+        self._cache = cache
+        self._after_commit = after_commit
+
+    async def get_by_id(self, user_id: UUID) -> User | None:
+        user = self._get_cached(user_id)
+        if user is None:
+            user = await self._user_repository.get_by_id(user_id)
+            self._store(user)
+        return user
+
+    async def get_by_username(self, username: str) -> User | None:
+        user_id = self._cache.get((_BY_USERNAME, username))
+        user = self._get_cached(user_id) if isinstance(user_id, UUID) else None
+        if user is None:
+            user = await self._user_repository.get_by_username(username)
+            self._store(user)
+        return user
+
+    async def get_by_email(self, email: str) -> User | None:
+        return await self._user_repository.get_by_email(email)
+
+    async def search_by_username(
+        self, prefix: str, limit: int
+    ) -> Sequence[UserSummaryRow]:
+        return await self._user_repository.search_by_username(prefix, limit)
+
+    async def create_user(self, user: User) -> User | None:
+        # Misses are not cached, so there is nothing to invalidate for a new user.
+        return await self._user_repository.create_user(user)
+
+    async def update_user(self, user_id: UUID, values: dict[str, Any]) -> User | None:
+        user = await self._user_repository.update_user(user_id, values)
+        self.invalidate(user_id)
+        if self._after_commit is not None:
+            # Until the commit, concurrent reads still load and cache the old
+            # user, so it is dropped again once the update is visible.
+            async def invalidate_committed() -> None:
+                self.invalidate(user_id)
+
+            self._after_commit(invalidate_committed)
+        return user
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._cache.pop((_BY_ID, user_id))
+
+    def _get_cached(self, user_id: UUID) -> User | None:
+        user = self._cache.get((_BY_ID, user_id))
+        return user if isinstance(user, User) else None
+
+    def _store(self, user: User | None) -> None:
+        # Misses are not cached, registration relies on seeing new users at once.
+        if user is None:
+            return
+
+        detached = User(
+            **{
+                attribute.key: getattr(user, attribute.key)
+                for attribute in inspect(User).column_attrs
+            }
+        )
+        self._cache.set((_BY_ID, detached.id), detached)  # type: ignore[arg-type]
+        self._cache.set((_BY_USERNAME, detached.username), detached.id)  # type: ignore[arg-type]
+
+
+@lru_cache
+def get_user_cache() -> UserCache:
+    settings = get_cache_settings()
+    return TTLCache(
+        max_size=settings.user_max_size, ttl_seconds=settings.user_ttl_seconds
+    )
@@ -1,10 +1,14 @@
+import sys
+from typing import Any, Sequence
 from uuid import UUID
 
+from sqlalchemy import inspect, text, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from mini_x.infra.db.models.user import User
-from mini_x.repositories.user.user_abc import UserRepositoryABC
+from mini_x.repositories.user.user_abc import UserRepositoryABC, UserSummaryRow
 
 
 class UserRepository(UserRepositoryABC):
@@ -12,26 +16,67 @@ class UserRepository(UserRepositoryABC):
         self._session = session
 
     async def get_by_id(self, user_id: UUID) -> User | None:
-        async with self._session.begin():
-            result = await self._session.execute(
-                select(User).filter(User.id == user_id)
-            )
-            return result.scalars().first()
+        result = await self._session.execute(select(User).filter(User.id == user_id))
+        return result.scalars().first()
 
     async def get_by_username(self, username: str) -> User | None:
-        async with self._session.begin():
-            result = await self._session.execute(
-                select(User).filter(User.username == username)
-            )
-            return result.scalars().first()
+        result = await self._session.execute(
+            select(User).filter(User.username == username)
+        )
+        return result.scalars().first()
 
     async def get_by_email(self, email: str) -> User | None:
-        async with self._session.begin():
-            result = await self._session.execute(
-                select(User).filter(User.email == email)
-            )
-            return result.scalars().first()
-
-    async def upsert(self, user: User) -> None:
-        async with self._session.begin():
-            await self._session.merge(user)
+        result = await self._session.execute(select(User).filter(User.email == email))
+        return result.scalars().first()
+
+    async def search_by_username(
+        self, prefix: str, limit: int
+    ) -> Sequence[UserSummaryRow]:
+        # A byte wise range, [prefix, upper bound), instead of LIKE: it needs no
+        # escaping and, unlike LIKE with a bound parameter, is an index range
+        # scan on ix_users_username_pattern in generic plans too. text_pattern_ops
+        # orders by bytes and UTF-8 keeps the code point order.
+        query = (
+            select(User.id, User.username, User.full_name)
+            .where(User.username.op("~>=~")(prefix))
+            # The operator class' own order, so the index scan stops after limit.
+            .order_by(text("users.username USING ~<~"))
+            .limit(limit)
+        )
+        upper_bound = prefix_upper_bound(prefix)
+        if upper_bound is not None:
+            query = query.where(User.username.op("~<~")(upper_bound))
+
+        result = await self._session.execute(query)
+        return result.all()
+
+    async def create_user(self, user: User) -> User | None:
+        values = {
+            attribute.key: getattr(user, attribute.key)
+            for attribute in inspect(User).column_attrs
+            if getattr(user, attribute.key) is not None
+        }
+        # uq_user_username and uq_user_email decide, no SELECT ahead of the INSERT.
+        result = await self._session.execute(
+            insert(User).values(values).on_conflict_do_nothing().returning(User)
+        )
+        return result.scalars().first()
+
+    async def update_user(self, user_id: UUID, values: dict[str, Any]) -> User | None:
+        result = await self._session.execute(
+            update(User).where(User.id == user_id).values(values).returning(User)
+        )
+        return result.scalars().first()
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    """The least string above every string starting with `prefix`, if any."""
+    while prefix:
+        last = ord(prefix[-1]) + 1
+        if 0xD800 <= last <= 0xDFFF:
+            # Surrogates cannot be encoded, the next code point is U+E000.
+            last = 0xE000
+        if last <= sys.maxunicode:
+            return prefix[:-1] + chr(last)
+        prefix = prefix[:-1]
+    return None
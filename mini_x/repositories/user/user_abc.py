@@ -1,9 +1,23 @@
 from abc import ABC, abstractmethod
+from typing import Any, Protocol, Sequence
 from uuid import UUID
 
 from mini_x.infra.db.models.user import User
 
 
+class UserSummaryRow(Protocol):
+    """The public part of a user as plain column values."""
+
+    @property
+    def id(self) -> UUID: ...
+
+    @property
+    def username(self) -> str: ...
+
+    @property
+    def full_name(self) -> str | None: ...
+
+
 class UserRepositoryABC(ABC):
     @abstractmethod
     async def get_by_id(self, user_id: UUID) -> User | None:
@@ -18,5 +32,21 @@ class UserRepositoryABC(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def upsert(self, user: User) -> None:
+    async def search_by_username(
+        self, prefix: str, limit: int
+    ) -> Sequence[UserSummaryRow]:
+        """Return up to `limit` users whose username starts with `prefix`.
+
+        The match is case sensitive, users are ordered by username.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_user(self, user: User) -> User | None:
+        """Insert the user, returns None if the username or email is taken."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_user(self, user_id: UUID, values: dict[str, Any]) -> User | None:
+        """Update the given columns, returns None if the user does not exist."""
         raise NotImplementedError
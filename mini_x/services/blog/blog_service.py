@@ -1,78 +1,228 @@
+from typing import AsyncIterator, NoReturn, Sequence
 from uuid import UUID
 
 from mini_x.api.v1.models.blog import (
+    BlogPostBatchCreate,
     BlogPostCreate,
     BlogPostRead,
     BlogPostUpdate,
     BlogPostDelete,
+    BlogPostPage,
+    BlogPostBatch,
 )
-from mini_x.repositories.blog.blog_abc import BlogRepositoryABC
+from mini_x.authentication.principal import Principal
+from mini_x.infra.db.session import AfterCommit
+from mini_x.repositories.blog.blog_abc import BlogPostRow, BlogRepositoryABC
+from mini_x.services.blog.cursor import (
+    decode_post_cursor,
+    decode_search_cursor,
+    encode_post_cursor,
+    encode_search_cursor,
+)
+from mini_x.services.blog.post_cache import PostCache
+from mini_x.services.blog.rows import post_read_from_row
+from mini_x.services.timeline.timeline_service import TimelineService
 from mini_x.services.blog.error import (
+    BlogServiceBatchTooLargeException,
     BlogServiceException,
+    BlogServiceInvalidSearchQueryException,
     BlogServiceUnAuthorizedException,
 )
-from mini_x.services.user.user_service import UserService
 
 
 class BlogService:
     def __init__(
-        self, blog_repository: BlogRepositoryABC, user_service: UserService
+        self,
+        blog_repository: BlogRepositoryABC,
+        post_cache: PostCache | None = None,
+        timeline_service: TimelineService | None = None,
+        after_commit: AfterCommit | None = None,
+        created_post_fanned_out: bool = False,
     ) -> None:
         self._blog_repository = blog_repository
-        self._user_service = user_service
+        self._post_cache = post_cache
+        self._timeline_service = timeline_service
+        self._after_commit = after_commit
+        # The repository's create_post fans out in its own transaction, as the
+        # write batcher does.
+        self._created_post_fanned_out = created_post_fanned_out
 
     async def create_post(
-        self, post_data: BlogPostCreate, user_from_token: str
+        self, post_data: BlogPostCreate, principal: Principal
     ) -> BlogPostRead:
-        current_user = await self._user_service.get_current_user(user_from_token)
-
         post = await self._blog_repository.create_post(
-            current_user.id, post_data.content
+            principal.user_id, post_data.content
         )
-        return BlogPostRead.from_orm(post)
+        if not self._created_post_fanned_out:
+            await self._fan_out_posts(principal.user_id, [post])
+        return post_read_from_row(post)
+
+    async def create_posts(
+        self, batch_create: BlogPostBatchCreate, principal: Principal, max_items: int
+    ) -> list[BlogPostRead]:
+        if len(batch_create.items) > max_items:
+            raise BlogServiceBatchTooLargeException(
+                f"At most {max_items} posts can be created at once."
+            )
+
+        posts = await self._blog_repository.create_posts(
+            principal.user_id, [post_data.content for post_data in batch_create.items]
+        )
+        await self._fan_out_posts(principal.user_id, posts)
+        return [post_read_from_row(post) for post in posts]
 
     async def get_post_by_id(self, post_id: UUID) -> BlogPostRead:
+        if self._post_cache is not None:
+            cached_post = await self._post_cache.get(post_id)
+            if cached_post is not None:
+                return cached_post
+
         post = await self._blog_repository.get_post_by_id(post_id)
 
         if post is None:
             raise BlogServiceException(f"Post {post_id} not found.")
 
-        return BlogPostRead.from_orm(post)
+        post_read = BlogPostRead.from_orm(post)
+        if self._post_cache is not None:
+            await self._post_cache.set(post_read)
+        return post_read
+
+    async def get_posts_by_ids(
+        self, post_ids: list[UUID], max_ids: int
+    ) -> BlogPostBatch:
+        requested_ids = list(dict.fromkeys(post_ids))
+        if len(requested_ids) > max_ids:
+            raise BlogServiceBatchTooLargeException(
+                f"At most {max_ids} posts can be fetched at once."
+            )
+
+        posts = {
+            post.id: post
+            for post in await self._blog_repository.get_posts_by_ids(requested_ids)
+        }
+
+        return BlogPostBatch.model_construct(
+            items=[
+                post_read_from_row(posts[post_id])
+                for post_id in requested_ids
+                if post_id in posts
+            ],
+            missing_ids=[post_id for post_id in requested_ids if post_id not in posts],
+        )
 
     async def get_posts_by_user_id(
-        self, user_id: UUID, offset: int = 0, limit: int = 10
-    ):
-        posts = await self._blog_repository.get_posts_by_user_id(user_id, offset, limit)
-        return [BlogPostRead.from_orm(post) for post in posts]
+        self,
+        user_id: UUID,
+        offset: int = 0,
+        limit: int = 10,
+        cursor: str | None = None,
+    ) -> BlogPostPage:
+        after = decode_post_cursor(cursor) if cursor else None
+
+        # One extra row tells whether there is a next page.
+        posts = await self._blog_repository.get_posts_by_user_id(
+            user_id, offset, limit + 1, after
+        )
 
-    async def update_post(
-        self, post_id: UUID, post_data: BlogPostUpdate, user_from_token: str
-    ) -> BlogPostRead:
-        current_user = await self._user_service.get_current_user(user_from_token)
-        post = await self.get_post_by_id(post_id)
+        next_cursor = None
+        if len(posts) > limit:
+            posts = posts[:limit]
+            last_post = posts[-1]
+            next_cursor = encode_post_cursor(last_post.created_at, last_post.id)
+
+        return BlogPostPage.model_construct(
+            items=[post_read_from_row(post) for post in posts],
+            next_cursor=next_cursor,
+        )
 
-        if post.user_id != current_user.id:
-            raise BlogServiceUnAuthorizedException(
-                "Not authorized user to update this post"
+    async def search_posts(
+        self,
+        query: str,
+        limit: int = 10,
+        cursor: str | None = None,
+        max_limit: int = 50,
+        max_query_length: int = 200,
+    ) -> BlogPostPage:
+        query = query.strip()
+        if not query or len(query) > max_query_length:
+            raise BlogServiceInvalidSearchQueryException(
+                f"Search query must have 1 to {max_query_length} characters."
             )
 
+        limit = min(limit, max_limit)
+        after = decode_search_cursor(cursor) if cursor else None
+
+        # One extra row tells whether there is a next page.
+        posts = await self._blog_repository.search_posts(query, limit + 1, after)
+
+        next_cursor = None
+        if len(posts) > limit:
+            posts = posts[:limit]
+            last_post = posts[-1]
+            next_cursor = encode_search_cursor(last_post.rank, last_post.id)
+
+        return BlogPostPage.model_construct(
+            items=[post_read_from_row(post) for post in posts],
+            next_cursor=next_cursor,
+        )
+
+    async def stream_posts_by_user_id(
+        self, user_id: UUID, batch_size: int
+    ) -> AsyncIterator[BlogPostRead]:
+        async for post in self._blog_repository.stream_posts_by_user_id(
+            user_id, batch_size
+        ):
+            yield post_read_from_row(post)
+
+    async def update_post(
+        self, post_id: UUID, post_data: BlogPostUpdate, principal: Principal
+    ) -> BlogPostRead:
         updated_post = await self._blog_repository.update_post(
-            post_id, post_data.content
+            post_id, principal.user_id, post_data.content
         )
 
         if updated_post is None:
-            raise BlogServiceException(f"Post {post_id} not found.")
+            await self._raise_not_owned_post(
+                post_id, "Not authorized user to update this post"
+            )
 
+        await self._invalidate_cached_post(post_id)
         return BlogPostRead.from_orm(updated_post)
 
-    async def delete_post(self, post_id: UUID, user_from_token: str) -> BlogPostDelete:
-        current_user = await self._user_service.get_current_user(user_from_token)
-        post = await self.get_post_by_id(post_id)
+    async def delete_post(self, post_id: UUID, principal: Principal) -> BlogPostDelete:
+        deleted = await self._blog_repository.delete_post(post_id, principal.user_id)
 
-        if post.user_id != current_user.id:
-            raise BlogServiceUnAuthorizedException(
-                "Not authorized user to update this post"
+        if not deleted:
+            await self._raise_not_owned_post(
+                post_id, "Not authorized user to delete this post"
             )
 
-        await self._blog_repository.delete_post(post_id)
+        await self._invalidate_cached_post(post_id)
         return BlogPostDelete(post_id=post_id, message="Post successfully deleted")
+
+    async def _fan_out_posts(
+        self, author_id: UUID, posts: Sequence[BlogPostRow]
+    ) -> None:
+        if self._timeline_service is not None:
+            await self._timeline_service.fan_out_posts(author_id, posts)
+
+    async def _invalidate_cached_post(self, post_id: UUID) -> None:
+        post_cache = self._post_cache
+        if post_cache is None:
+            return
+
+        # Invalidated before the commit, a concurrent read could cache the old
+        # row again for the whole TTL.
+        if self._after_commit is not None:
+            self._after_commit(lambda: post_cache.invalidate(post_id))
+        else:
+            await post_cache.invalidate(post_id)
+
+    async def _raise_not_owned_post(self, post_id: UUID, message: str) -> NoReturn:
+        # The ownership-checked write matched no row, only now find out why.
+        owner_id = await self._blog_repository.get_post_owner_id(post_id)
+
+        if owner_id is None:
+            raise BlogServiceException(f"Post {post_id} not found.")
+
+        raise BlogServiceUnAuthorizedException(message)
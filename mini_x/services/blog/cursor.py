@@ -0,0 +1,49 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from mini_x.services.blog.error import BlogServiceInvalidCursorException
+
+
+def encode_post_cursor(created_at: datetime, post_id: UUID) -> str:
+    """Encode the keyset position after a post as an opaque, URL safe string."""
+    return _encode([created_at.isoformat(), str(post_id)])
+
+
+def decode_post_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, post_id = _decode(cursor)
+        position = datetime.fromisoformat(created_at), UUID(post_id)
+    except (ValueError, TypeError, AttributeError) as e:
+        raise BlogServiceInvalidCursorException("Invalid cursor.") from e
+
+    # created_at columns are naive UTC, the driver refuses to compare them with an
+    # aware datetime.
+    if position[0].tzinfo is not None:
+        raise BlogServiceInvalidCursorException("Invalid cursor.")
+    return position
+
+
+def encode_search_cursor(rank: float, post_id: UUID) -> str:
+    """Encode the position after a search hit, ordered by rank then id."""
+    return _encode([rank, str(post_id)])
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, UUID]:
+    try:
+        rank, post_id = _decode(cursor)
+        return float(rank), UUID(post_id)
+    except (ValueError, TypeError, AttributeError) as e:
+        raise BlogServiceInvalidCursorException("Invalid cursor.") from e
+
+
+def _encode(position: list) -> str:
+    raw = json.dumps(position, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> Any:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
@@ -7,3 +7,15 @@ class BlogServiceException(MiniXException):
 
 class BlogServiceUnAuthorizedException(MiniXException):
     pass
+
+
+class BlogServiceInvalidCursorException(MiniXException):
+    pass
+
+
+class BlogServiceBatchTooLargeException(MiniXException):
+    pass
+
+
+class BlogServiceInvalidSearchQueryException(MiniXException):
+    pass
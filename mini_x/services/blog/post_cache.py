@@ -0,0 +1,116 @@
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from mini_x.api.v1.models.blog import BlogPostRead
+from mini_x.infra.cache.backend_abc import CacheBackendABC
+from mini_x.infra.cache.memory import InMemoryCacheBackend
+from mini_x.infra.cache.redis import RedisCacheBackend, RedisError
+from mini_x.settings.cache_settings import CacheBackend, get_cache_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PostCacheStatus:
+    hits: int
+    misses: int
+    # Backend failures, also counted as misses.
+    errors: int
+
+
+class PostCache:
+    """Read-through cache of serialized `BlogPostRead` payloads.
+
+    The cache is an optimization only, backend failures are logged and treated
+    as misses so that reads fall back to the database.
+    """
+
+    def __init__(self, backend: CacheBackendABC, ttl_seconds: float) -> None:
+        self._backend = backend
+        self._ttl_seconds = ttl_seconds
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    @property
+    def backend(self) -> CacheBackendABC:
+        return self._backend
+
+    async def get(self, post_id: UUID) -> BlogPostRead | None:
+        try:
+            payload = await self._backend.get(self._key(post_id))
+        except (OSError, TimeoutError, RedisError) as e:
+            logger.warning("Post cache read failed: %s", e)
+            self._errors += 1
+            self._misses += 1
+            return None
+
+        if payload is None:
+            self._misses += 1
+            return None
+
+        try:
+            post = BlogPostRead.model_validate_json(payload)
+        except ValidationError:
+            # Written by a release with a different BlogPostRead shape.
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return post
+
+    def get_status(self) -> PostCacheStatus:
+        return PostCacheStatus(
+            hits=self._hits, misses=self._misses, errors=self._errors
+        )
+
+    async def set(self, post: BlogPostRead) -> None:
+        try:
+            await self._backend.set(
+                self._key(post.id), post.model_dump_json().encode(), self._ttl_seconds
+            )
+        except (OSError, TimeoutError, RedisError) as e:
+            logger.warning("Post cache write failed: %s", e)
+
+    async def invalidate(self, post_id: UUID) -> None:
+        try:
+            await self._backend.delete(self._key(post_id))
+        except (OSError, TimeoutError, RedisError) as e:
+            # The entry stays stale for at most the TTL.
+            logger.warning("Post cache invalidation failed: %s", e)
+
+    @staticmethod
+    def _key(post_id: UUID) -> str:
+        return f"mini_x:post:{post_id}"
+
+
+@lru_cache
+def get_post_cache() -> PostCache | None:
+    settings = get_cache_settings()
+    if not settings.post_enabled:
+        return None
+
+    backend: CacheBackendABC
+    if settings.post_backend == CacheBackend.REDIS:
+        backend = RedisCacheBackend(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+            password=(
+                settings.redis_password.get_secret_value()
+                if settings.redis_password
+                else None
+            ),
+            pool_size=settings.redis_pool_size,
+            timeout_seconds=settings.redis_timeout_seconds,
+        )
+    else:
+        backend = InMemoryCacheBackend(
+            max_size=settings.post_max_size, ttl_seconds=settings.post_ttl_seconds
+        )
+
+    return PostCache(backend, settings.post_ttl_seconds)
@@ -0,0 +1,14 @@
+from mini_x.api.v1.models.blog import BlogPostRead
+from mini_x.repositories.blog.blog_abc import BlogPostRow
+
+
+def post_read_from_row(post: BlogPostRow) -> BlogPostRead:
+    # The rows come straight from typed columns, validating them again would
+    # only cost CPU.
+    return BlogPostRead.model_construct(
+        id=post.id,
+        user_id=post.user_id,
+        content=post.content,
+        created_at=post.created_at,
+        updated_at=post.updated_at,
+    )
@@ -0,0 +1,9 @@
+from mini_x.errors import MiniXException
+
+
+class TimelineServiceException(MiniXException):
+    pass
+
+
+class TimelineServiceUserNotFoundException(MiniXException):
+    pass
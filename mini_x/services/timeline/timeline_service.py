@@ -0,0 +1,127 @@
+from functools import partial
+from typing import Sequence
+from uuid import UUID
+
+from mini_x.api.v1.models.blog import BlogPostPage
+from mini_x.authentication.principal import Principal
+from mini_x.infra.db.session import AfterCommit
+from mini_x.repositories.blog.blog_abc import BlogPostRow
+from mini_x.repositories.follow.follow_abc import FollowRepositoryABC
+from mini_x.repositories.timeline.backfill import TimelineBackfiller
+from mini_x.repositories.timeline.timeline_abc import TimelineRepositoryABC
+from mini_x.repositories.user.user_abc import UserRepositoryABC
+from mini_x.services.blog.cursor import decode_post_cursor, encode_post_cursor
+from mini_x.services.blog.rows import post_read_from_row
+from mini_x.services.timeline.error import (
+    TimelineServiceException,
+    TimelineServiceUserNotFoundException,
+)
+
+
+class TimelineService:
+    """Follows and home timelines, materialized by fanning out new posts.
+
+    Posts of an author reaching `fan_out_max_followers` are pulled at timeline
+    time instead, until the author drops below `fan_out_resume_followers`.
+    """
+
+    def __init__(
+        self,
+        timeline_repository: TimelineRepositoryABC,
+        follow_repository: FollowRepositoryABC,
+        user_repository: UserRepositoryABC,
+        backfiller: TimelineBackfiller,
+        fan_out_max_followers: int,
+        fan_out_resume_followers: int,
+        backfill_posts: int,
+        after_commit: AfterCommit | None = None,
+    ) -> None:
+        self._timeline_repository = timeline_repository
+        self._follow_repository = follow_repository
+        self._user_repository = user_repository
+        self._backfiller = backfiller
+        self._fan_out_max_followers = fan_out_max_followers
+        self._fan_out_resume_followers = fan_out_resume_followers
+        self._backfill_posts = backfill_posts
+        self._after_commit = after_commit
+
+    async def follow(self, principal: Principal, user_id: UUID) -> None:
+        if user_id == principal.user_id:
+            raise TimelineServiceException("Users cannot follow themselves.")
+
+        followee = await self._follow_repository.follow(principal.user_id, user_id)
+        if followee is None:
+            # Already following is fine, only a missing user is an error.
+            await self._ensure_user_exists(user_id)
+            return
+
+        # Pulled posts are read at timeline time and need no backfill.
+        if followee.posts_pulled:
+            await self._follow_repository.set_pulled(user_id, True, principal.user_id)
+            return
+        if followee.follower_count >= self._fan_out_max_followers:
+            await self._follow_repository.set_posts_pulled(user_id, True)
+            await self._follow_repository.set_pulled(user_id, True)
+            return
+
+        if self._backfill_posts:
+            await self._timeline_repository.add_author_posts(
+                principal.user_id, user_id, self._backfill_posts
+            )
+
+    async def unfollow(self, principal: Principal, user_id: UUID) -> None:
+        followee = await self._follow_repository.unfollow(principal.user_id, user_id)
+        if followee is None:
+            await self._ensure_user_exists(user_id)
+            return
+
+        await self._timeline_repository.remove_author_posts(principal.user_id, user_id)
+
+        if (
+            followee.posts_pulled
+            and followee.follower_count < self._fan_out_resume_followers
+        ):
+            # New posts are fanned out from now on, the followers are switched
+            # over and backfilled in the background, once this is committed.
+            await self._follow_repository.set_posts_pulled(user_id, False)
+            if self._after_commit is not None:
+                self._after_commit(partial(self._schedule_backfill, user_id))
+            else:
+                await self._schedule_backfill(user_id)
+
+    async def fan_out_posts(
+        self, author_id: UUID, posts: Sequence[BlogPostRow]
+    ) -> None:
+        await self._timeline_repository.fan_out_posts(author_id, posts)
+
+    async def get_home_timeline(
+        self,
+        principal: Principal,
+        limit: int = 10,
+        cursor: str | None = None,
+        max_limit: int = 100,
+    ) -> BlogPostPage:
+        limit = min(limit, max_limit)
+        after = decode_post_cursor(cursor) if cursor else None
+
+        # One extra row tells whether there is a next page.
+        posts = await self._timeline_repository.get_home_timeline(
+            principal.user_id, limit + 1, after
+        )
+
+        next_cursor = None
+        if len(posts) > limit:
+            posts = posts[:limit]
+            next_cursor = encode_post_cursor(posts[-1].created_at, posts[-1].id)
+
+        return BlogPostPage.model_construct(
+            items=[post_read_from_row(post) for post in posts],
+            next_cursor=next_cursor,
+        )
+
+    async def _schedule_backfill(self, author_id: UUID) -> None:
+        self._backfiller.schedule(author_id)
+
+    async def _ensure_user_exists(self, user_id: UUID) -> None:
+        if await self._user_repository.get_by_id(user_id) is None:
+            raise TimelineServiceUserNotFoundException(f"User {user_id} not found.")
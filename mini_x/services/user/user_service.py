@@ -1,13 +1,11 @@
 import uuid
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NoReturn
 
-from mini_x.api.v1.models.user import UserCreate, UserRead, UserUpdate
-from mini_x.authentication.auth_handler import (
-    get_password_hash,
-    verify_password,
-    create_access_token,
-)
+from mini_x.api.v1.models.user import UserCreate, UserRead, UserSummary, UserUpdate
+from mini_x.authentication.auth_handler import create_user_access_token
+from mini_x.authentication.password_hasher import PasswordHasher
+from mini_x.authentication.principal import Principal
 from mini_x.infra.db.models.user import User
 from mini_x.repositories.user.user_abc import UserRepositoryABC
 from mini_x.services.user.error import (
@@ -22,23 +20,19 @@ if TYPE_CHECKING:
 
 class UserService:
     def __init__(
-        self, user_repository: "UserRepositoryABC", secret_settings: SecretSettings
+        self,
+        user_repository: "UserRepositoryABC",
+        secret_settings: SecretSettings,
+        password_hasher: PasswordHasher,
     ) -> None:
         self._user_repository = user_repository
         self._secret_settings = secret_settings
+        self._password_hasher = password_hasher
 
     async def register_user(self, user_create: UserCreate) -> UserRead:
-        existing_email = await self._user_repository.get_by_email(user_create.email)
-        if existing_email:
-            raise UserServiceException(
-                f"Email '{existing_email}' is already registered"
-            )
-
-        existing_user = await self._user_repository.get_by_username(user_create.email)
-        if existing_user:
-            raise UserServiceException(f"User '{existing_user}' is already registered")
-
-        hashed_password = get_password_hash(user_create.password.get_secret_value())
+        hashed_password = await self._password_hasher.hash(
+            user_create.password.get_secret_value()
+        )
         new_user = User(
             id=uuid.uuid4(),
             username=user_create.username,
@@ -50,13 +44,17 @@ class UserService:
             city=user_create.city,
             country=user_create.country,
         )
-        await self._user_repository.upsert(new_user)
+        created_user = await self._user_repository.create_user(new_user)
+        if created_user is None:
+            await self._raise_registration_conflict(user_create)
 
-        return UserRead.from_orm(new_user)
+        return UserRead.from_orm(created_user)
 
     async def authenticate_user(self, username: str, password: str) -> User | None:
         user = await self._user_repository.get_by_username(username)
-        if not user or not verify_password(password, str(user.hashed_password)):
+        if not user or not await self._password_hasher.verify(
+            password, str(user.hashed_password)
+        ):
             return None
         return user
 
@@ -72,41 +70,60 @@ class UserService:
         access_token_expires = timedelta(
             minutes=self._secret_settings.access_token_expire_minutes
         )
-        access_token = create_access_token(
-            data={"sub": user.username},
+        access_token = create_user_access_token(
+            user_id=user.id,  # type: ignore[arg-type]
+            username=str(user.username),
             secret_settings=self._secret_settings,
             expires_delta=access_token_expires,
         )
         return {"access_token": access_token, "token_type": "bearer"}
 
     async def update_user_profile(
-        self, user_from_token: str, user_update: UserUpdate
+        self, principal: Principal, user_update: UserUpdate
     ) -> UserRead:
-        user = await self._validate_user_from_token(user_from_token)
-
-        updated_user = User(
-            id=user.id,
-            full_name=user_update.full_name or user.full_name,
-            street_address=user_update.street_address or user.street_address,
-            zip_code=user_update.zip_code or user.zip_code,
-            city=user_update.city or user.city,
-            country=user_update.country or user.country,
-            created_at=user.created_at,
+        # Empty fields keep their current value.
+        values = {
+            field: value for field, value in user_update.model_dump().items() if value
+        }
+        if not values:
+            return await self.get_current_user(principal)
+
+        updated_user = await self._user_repository.update_user(
+            principal.user_id, values
         )
-
-        await self._user_repository.upsert(updated_user)
-
-        updated_user = await self._user_repository.get_by_id(user.id)  # type: ignore
+        if updated_user is None:
+            raise UserServiceUnAuthorizedException("Not Authorized user.")
 
         return UserRead.from_orm(updated_user)
 
-    async def get_current_user(self, user_from_token: str) -> UserRead:
-        user = await self._validate_user_from_token(user_from_token)
+    async def search_users(self, prefix: str, limit: int) -> list[UserSummary]:
+        rows = await self._user_repository.search_by_username(prefix, limit)
+        # Typed columns of the users table, no need to validate them again.
+        return [
+            UserSummary.model_construct(
+                id=row.id, username=row.username, full_name=row.full_name
+            )
+            for row in rows
+        ]
+
+    async def get_current_user(self, principal: Principal) -> UserRead:
+        user = await self._get_principal_user(principal)
 
         return UserRead.from_orm(user)
 
-    async def _validate_user_from_token(self, user_from_token: str) -> User:
-        user = await self.get_username(user_from_token)
+    async def _get_principal_user(self, principal: Principal) -> User:
+        # The account may have been removed since the token was issued.
+        user = await self._user_repository.get_by_id(principal.user_id)
         if user is None:
             raise UserServiceUnAuthorizedException("Not Authorized user.")
         return user
+
+    async def _raise_registration_conflict(self, user_create: UserCreate) -> NoReturn:
+        # Only reached on a conflict, tells which unique constraint was hit.
+        if await self._user_repository.get_by_email(user_create.email):
+            raise UserServiceException(
+                f"Email '{user_create.email}' is already registered"
+            )
+        raise UserServiceException(
+            f"User '{user_create.username}' is already registered"
+        )
@@ -1,16 +1,32 @@
+import math
+import os
 from enum import Enum
 from functools import lru_cache
+from pathlib import Path
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 from mini_x.constants import (
     LOG_LEVEL_DEFAULT,
     ENABLE_ACCESS_LOG_DEFAULT,
+    LOG_FORMAT_DEFAULT,
+    ACCESS_LOG_SAMPLE_RATE_DEFAULT,
+    ENABLE_METRICS_DEFAULT,
+    ENABLE_DEBUG_HEADERS_DEFAULT,
     ENABLE_RELOAD_DEFAULT,
     SERVER_HOST_DEFAULT,
     SERVER_PORT_DEFAULT,
+    SERVER_WORKERS_DEFAULT,
+    SERVER_LOOP_DEFAULT,
+    SERVER_HTTP_DEFAULT,
+    SERVER_KEEP_ALIVE_SECONDS_DEFAULT,
+    SERVER_BACKLOG_DEFAULT,
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS_DEFAULT,
 )
 
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
 
 class LogLevel(str, Enum):
     TRACE = "TRACE"
@@ -21,13 +37,91 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+class LogFormat(str, Enum):
+    TEXT = "text"
+    JSON = "json"
+
+
+class EventLoop(str, Enum):
+    # auto picks uvloop when it is installed.
+    AUTO = "auto"
+    ASYNCIO = "asyncio"
+    UVLOOP = "uvloop"
+
+
+class HttpProtocol(str, Enum):
+    # auto picks httptools when it is installed.
+    AUTO = "auto"
+    H11 = "h11"
+    HTTPTOOLS = "httptools"
+
+
 class AppSettings(BaseSettings):
     server_host: str = SERVER_HOST_DEFAULT
     server_port: int = SERVER_PORT_DEFAULT
     log_level: LogLevel = LogLevel(LOG_LEVEL_DEFAULT)
+    log_format: LogFormat = LogFormat(LOG_FORMAT_DEFAULT)
 
     enable_access_log: bool = ENABLE_ACCESS_LOG_DEFAULT
+    # Share of successful (below 400) requests that are access logged, failed
+    # ones always are.
+    access_log_sample_rate: float = Field(
+        default=ACCESS_LOG_SAMPLE_RATE_DEFAULT, ge=0, le=1
+    )
     enable_reload: bool = ENABLE_RELOAD_DEFAULT
+    # Serves GET /metrics in the Prometheus text format.
+    enable_metrics: bool = ENABLE_METRICS_DEFAULT
+    # Adds Server-Timing, X-DB-Queries and X-DB-Duplicate-Queries to responses.
+    # They disclose internals, keep it off in production.
+    enable_debug_headers: bool = ENABLE_DEBUG_HEADERS_DEFAULT
+
+    # Worker processes forked by the supervisor, 0 means one per usable CPU, as
+    # limited by the CPU affinity and a container's CPU quota. Ignored with
+    # reload.
+    server_workers: int = Field(default=SERVER_WORKERS_DEFAULT, ge=0)
+    server_loop: EventLoop = EventLoop(SERVER_LOOP_DEFAULT)
+    server_http: HttpProtocol = HttpProtocol(SERVER_HTTP_DEFAULT)
+    # Keep it above the idle timeout of the load balancer in front, or it may
+    # reuse connections the server is closing.
+    server_keep_alive_seconds: int = Field(
+        default=SERVER_KEEP_ALIVE_SECONDS_DEFAULT, ge=1
+    )
+    # Pending connections the kernel queues for accept(), capped by somaxconn.
+    server_backlog: int = Field(default=SERVER_BACKLOG_DEFAULT, ge=1)
+    # On SIGTERM, in-flight requests get this long to finish before being cut.
+    server_graceful_shutdown_seconds: int = Field(
+        default=SERVER_GRACEFUL_SHUTDOWN_SECONDS_DEFAULT, ge=0
+    )
+
+    def get_worker_count(self) -> int:
+        if self.enable_reload:
+            return 1
+        if self.server_workers:
+            return self.server_workers
+        # The CPUs this process may run on, e.g. a container's cpuset, rather
+        # than all of the host's. A CPU quota (docker --cpus) does not show in
+        # the affinity, it caps the count separately.
+        cpus = len(os.sched_getaffinity(0))
+        cpu_limit = get_cgroup_cpu_limit()
+        return cpus if cpu_limit is None else min(cpus, cpu_limit)
+
+
+def get_cgroup_cpu_limit(cgroup_root: Path = CGROUP_ROOT) -> int | None:
+    """CPUs granted by the cgroup's CPU quota, rounded up, None without a quota."""
+    try:
+        # cgroup v2, "<quota> <period>" or "max <period>".
+        quota, period = (cgroup_root / "cpu.max").read_text().split()
+    except (OSError, ValueError):
+        try:
+            # cgroup v1, a quota of -1 means none.
+            quota = (cgroup_root / "cpu" / "cpu.cfs_quota_us").read_text().strip()
+            period = (cgroup_root / "cpu" / "cpu.cfs_period_us").read_text().strip()
+        except OSError:
+            return None
+
+    if quota in ("max", "-1"):
+        return None
+    return max(math.ceil(int(quota) / int(period)), 1)
 
 
 @lru_cache
@@ -0,0 +1,88 @@
+from functools import lru_cache
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from mini_x.constants import (
+    BLOG_ENV_PREFIX,
+    BLOG_EXPORT_BATCH_SIZE_DEFAULT,
+    BLOG_BATCH_GET_MAX_IDS_DEFAULT,
+    BLOG_BATCH_CREATE_MAX_ITEMS_DEFAULT,
+    BLOG_BATCH_CREATE_COPY_THRESHOLD_DEFAULT,
+    BLOG_WRITE_BATCHING_ENABLED_DEFAULT,
+    BLOG_WRITE_BATCH_WINDOW_SECONDS_DEFAULT,
+    BLOG_WRITE_BATCH_MAX_SIZE_DEFAULT,
+    BLOG_TIMELINE_FAN_OUT_MAX_FOLLOWERS_DEFAULT,
+    BLOG_TIMELINE_FAN_OUT_RESUME_FOLLOWERS_DEFAULT,
+    BLOG_TIMELINE_BACKFILL_POSTS_DEFAULT,
+    BLOG_TIMELINE_BACKFILL_BATCH_SIZE_DEFAULT,
+    BLOG_TIMELINE_MAX_LIMIT_DEFAULT,
+    BLOG_SEARCH_MAX_LIMIT_DEFAULT,
+    BLOG_SEARCH_QUERY_MAX_LENGTH_DEFAULT,
+)
+
+
+class BlogSettings(BaseSettings):
+    # Rows fetched per round trip by the export cursor, and posts per chunk of
+    # the streamed response. Bounds the export's memory, whatever the post count.
+    export_batch_size: int = Field(default=BLOG_EXPORT_BATCH_SIZE_DEFAULT, ge=1)
+    # Most ids a single multi-get may ask for.
+    batch_get_max_ids: int = Field(default=BLOG_BATCH_GET_MAX_IDS_DEFAULT, ge=1)
+    # Most posts a single bulk create may hold, batches of at least the threshold
+    # are written with COPY instead of a multi-row INSERT.
+    batch_create_max_items: int = Field(
+        default=BLOG_BATCH_CREATE_MAX_ITEMS_DEFAULT, ge=1
+    )
+    batch_create_copy_threshold: int = Field(
+        default=BLOG_BATCH_CREATE_COPY_THRESHOLD_DEFAULT, ge=1
+    )
+
+    # Group commit of single post creations: inserts arriving within the window,
+    # up to the max size, are written as one multi-row INSERT and one commit.
+    # The batch commits the posts and their timeline fan-out on its own, outside
+    # the request's transaction: a request failing after that still leaves its
+    # post created.
+    write_batching_enabled: bool = BLOG_WRITE_BATCHING_ENABLED_DEFAULT
+    write_batch_window_seconds: float = Field(
+        default=BLOG_WRITE_BATCH_WINDOW_SECONDS_DEFAULT, gt=0
+    )
+    write_batch_max_size: int = Field(default=BLOG_WRITE_BATCH_MAX_SIZE_DEFAULT, ge=1)
+
+    # Posts of users with fewer followers are copied into their followers' home
+    # timelines when written, posts of accounts reaching it are read at timeline
+    # time. They are fanned out again only once the count drops below the lower
+    # resume value, so an account hovering around the threshold does not switch
+    # back and forth. Accounts are switched on their next follow or unfollow
+    # after changing either.
+    timeline_fan_out_max_followers: int = Field(
+        default=BLOG_TIMELINE_FAN_OUT_MAX_FOLLOWERS_DEFAULT, ge=1
+    )
+    timeline_fan_out_resume_followers: int = Field(
+        default=BLOG_TIMELINE_FAN_OUT_RESUME_FOLLOWERS_DEFAULT, ge=0
+    )
+    # Latest posts of a followed user copied into the follower's timeline, on
+    # follow and, in the background and this many followers per transaction,
+    # when the user's posts are fanned out again.
+    timeline_backfill_posts: int = Field(
+        default=BLOG_TIMELINE_BACKFILL_POSTS_DEFAULT, ge=0
+    )
+    timeline_backfill_batch_size: int = Field(
+        default=BLOG_TIMELINE_BACKFILL_BATCH_SIZE_DEFAULT, ge=1
+    )
+    # Each pulled author contributes up to a page of posts to the merge, so
+    # timeline pages are capped.
+    timeline_max_limit: int = Field(default=BLOG_TIMELINE_MAX_LIMIT_DEFAULT, ge=1)
+
+    # Every match is ranked before the page is cut, so search pages are capped
+    # tighter than plain listings, as are queries.
+    search_max_limit: int = Field(default=BLOG_SEARCH_MAX_LIMIT_DEFAULT, ge=1)
+    search_query_max_length: int = Field(
+        default=BLOG_SEARCH_QUERY_MAX_LENGTH_DEFAULT, ge=1
+    )
+
+    model_config = SettingsConfigDict(env_prefix=BLOG_ENV_PREFIX)
+
+
+@lru_cache
+def get_blog_settings() -> BlogSettings:
+    return BlogSettings()
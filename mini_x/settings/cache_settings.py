@@ -0,0 +1,68 @@
+from enum import Enum
+from functools import lru_cache
+
+from pydantic import Field, SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from mini_x.constants import (
+    CACHE_ENV_PREFIX,
+    CACHE_USER_ENABLED_DEFAULT,
+    CACHE_USER_MAX_SIZE_DEFAULT,
+    CACHE_USER_TTL_SECONDS_DEFAULT,
+    CACHE_TOKEN_ENABLED_DEFAULT,
+    CACHE_TOKEN_MAX_SIZE_DEFAULT,
+    CACHE_TOKEN_TTL_SECONDS_DEFAULT,
+    CACHE_POST_ENABLED_DEFAULT,
+    CACHE_POST_BACKEND_DEFAULT,
+    CACHE_POST_MAX_SIZE_DEFAULT,
+    CACHE_POST_TTL_SECONDS_DEFAULT,
+    CACHE_REDIS_HOST_DEFAULT,
+    CACHE_REDIS_PORT_DEFAULT,
+    CACHE_REDIS_DB_DEFAULT,
+    CACHE_REDIS_POOL_SIZE_DEFAULT,
+    CACHE_REDIS_TIMEOUT_SECONDS_DEFAULT,
+)
+
+
+class CacheBackend(str, Enum):
+    MEMORY = "memory"
+    REDIS = "redis"
+
+
+class CacheSettings(BaseSettings):
+    # Caches are per process, with several workers a write only invalidates the
+    # local copy and the others may serve stale entries for up to the TTL.
+    user_enabled: bool = CACHE_USER_ENABLED_DEFAULT
+    user_max_size: int = Field(default=CACHE_USER_MAX_SIZE_DEFAULT, ge=1)
+    user_ttl_seconds: float = Field(default=CACHE_USER_TTL_SECONDS_DEFAULT, gt=0)
+
+    # Verified access tokens, the TTL caps how long a cached token outlives a key
+    # rotation that did not flush the cache; entries never outlive `exp`.
+    token_enabled: bool = CACHE_TOKEN_ENABLED_DEFAULT
+    token_max_size: int = Field(default=CACHE_TOKEN_MAX_SIZE_DEFAULT, ge=1)
+    token_ttl_seconds: float = Field(default=CACHE_TOKEN_TTL_SECONDS_DEFAULT, gt=0)
+
+    # Posts are invalidated once the write committed. The memory backend is per
+    # process like the caches above, with several workers the others serve the
+    # old post until the TTL expires. The redis backend is shared across workers
+    # and hosts, so invalidation reaches all of them.
+    post_enabled: bool = CACHE_POST_ENABLED_DEFAULT
+    post_backend: CacheBackend = CacheBackend(CACHE_POST_BACKEND_DEFAULT)
+    post_max_size: int = Field(default=CACHE_POST_MAX_SIZE_DEFAULT, ge=1)
+    post_ttl_seconds: float = Field(default=CACHE_POST_TTL_SECONDS_DEFAULT, gt=0)
+
+    redis_host: str = CACHE_REDIS_HOST_DEFAULT
+    redis_port: int = CACHE_REDIS_PORT_DEFAULT
+    redis_db: int = CACHE_REDIS_DB_DEFAULT
+    redis_password: SecretStr | None = None
+    redis_pool_size: int = Field(default=CACHE_REDIS_POOL_SIZE_DEFAULT, ge=1)
+    redis_timeout_seconds: float = Field(
+        default=CACHE_REDIS_TIMEOUT_SECONDS_DEFAULT, gt=0
+    )
+
+    model_config = SettingsConfigDict(env_prefix=CACHE_ENV_PREFIX)
+
+
+@lru_cache
+def get_cache_settings() -> CacheSettings:
+    return CacheSettings()
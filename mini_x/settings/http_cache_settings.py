@@ -0,0 +1,23 @@
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from mini_x.constants import (
+    HTTP_CACHE_ENV_PREFIX,
+    HTTP_CACHE_POST_CACHE_CONTROL_DEFAULT,
+    HTTP_CACHE_POST_LIST_CACHE_CONTROL_DEFAULT,
+)
+
+
+class HttpCacheSettings(BaseSettings):
+    # Cache-Control of the public blog reads, responses always carry validators
+    # so clients and CDNs can revalidate them with a conditional request.
+    post_cache_control: str = HTTP_CACHE_POST_CACHE_CONTROL_DEFAULT
+    post_list_cache_control: str = HTTP_CACHE_POST_LIST_CACHE_CONTROL_DEFAULT
+
+    model_config = SettingsConfigDict(env_prefix=HTTP_CACHE_ENV_PREFIX)
+
+
+@lru_cache
+def get_http_cache_settings() -> HttpCacheSettings:
+    return HttpCacheSettings()
@@ -0,0 +1,33 @@
+from enum import Enum
+from functools import lru_cache
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from mini_x.constants import (
+    PASSWORD_HASHING_ENV_PREFIX,
+    PASSWORD_HASHING_EXECUTOR_DEFAULT,
+    PASSWORD_HASHING_MAX_PENDING_DEFAULT,
+    PASSWORD_HASHING_WORKERS_DEFAULT,
+)
+
+
+class PasswordHashingExecutor(str, Enum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class PasswordHashingSettings(BaseSettings):
+    executor: PasswordHashingExecutor = PasswordHashingExecutor(
+        PASSWORD_HASHING_EXECUTOR_DEFAULT
+    )
+    workers: int = Field(default=PASSWORD_HASHING_WORKERS_DEFAULT, ge=1)
+    # Hash/verify calls queued or running at once, beyond that callers get a 503.
+    max_pending: int = Field(default=PASSWORD_HASHING_MAX_PENDING_DEFAULT, ge=1)
+
+    model_config = SettingsConfigDict(env_prefix=PASSWORD_HASHING_ENV_PREFIX)
+
+
+@lru_cache
+def get_password_hashing_settings() -> PasswordHashingSettings:
+    return PasswordHashingSettings()
@@ -1,6 +1,6 @@
 from functools import lru_cache
 
-from pydantic import SecretStr
+from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from mini_x.constants import (
@@ -10,6 +10,17 @@ from mini_x.constants import (
     PG_HOST_DEFAULT,
     PG_PASSWORD_DEFAULT,
     PG_USERNAME_DEFAULT,
+    PG_POOL_SIZE_DEFAULT,
+    PG_MAX_OVERFLOW_DEFAULT,
+    PG_POOL_TIMEOUT_SECONDS_DEFAULT,
+    PG_POOL_RECYCLE_SECONDS_DEFAULT,
+    PG_POOL_PRE_PING_DEFAULT,
+    PG_ECHO_DEFAULT,
+    PG_CONNECTION_BUDGET_DEFAULT,
+    PG_WARM_UP_CONNECTIONS_DEFAULT,
+    PG_WARM_UP_RETRY_SECONDS_DEFAULT,
+    PG_SLOW_QUERY_SECONDS_DEFAULT,
+    PG_REPEATED_QUERY_WARN_COUNT_DEFAULT,
 )
 
 
@@ -20,6 +31,36 @@ class PGDatabaseSettings(BaseSettings):
     port: int = PG_PORT_DEFAULT
     database_name: str = PG_DATABASE_DEFAULT
 
+    # Keep pool_size + max_overflow (times the number of processes) below the
+    # server's max_connections, or set connection_budget instead.
+    pool_size: int = Field(default=PG_POOL_SIZE_DEFAULT, ge=1)
+    max_overflow: int = Field(default=PG_MAX_OVERFLOW_DEFAULT, ge=0)
+    pool_timeout_seconds: float = Field(default=PG_POOL_TIMEOUT_SECONDS_DEFAULT, gt=0)
+    # -1 disables recycling.
+    pool_recycle_seconds: int = PG_POOL_RECYCLE_SECONDS_DEFAULT
+    pool_pre_ping: bool = PG_POOL_PRE_PING_DEFAULT
+    echo: bool = PG_ECHO_DEFAULT
+    # Connections all worker processes may hold together. When set, each worker's
+    # pool_size and max_overflow are cut down to its share of the budget.
+    connection_budget: int | None = Field(default=PG_CONNECTION_BUDGET_DEFAULT, ge=1)
+
+    # Pooled connections opened and primed with the hot statements on startup,
+    # at most pool_size. The app reports ready once they are, until then failed
+    # attempts are retried at the given interval.
+    warm_up_connections: int = Field(default=PG_WARM_UP_CONNECTIONS_DEFAULT, ge=0)
+    warm_up_retry_seconds: float = Field(default=PG_WARM_UP_RETRY_SECONDS_DEFAULT, gt=0)
+
+    # Queries at least this slow are logged, without their parameters. Unset to
+    # turn off.
+    slow_query_seconds: float | None = Field(
+        default=PG_SLOW_QUERY_SECONDS_DEFAULT, gt=0
+    )
+    # A request running one statement this often is logged as a likely N+1.
+    # Unset to turn off.
+    repeated_query_warn_count: int | None = Field(
+        default=PG_REPEATED_QUERY_WARN_COUNT_DEFAULT, ge=2
+    )
+
     model_config = SettingsConfigDict(env_prefix=PG_ENV_PREFIX)
 
 
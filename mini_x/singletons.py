@@ -0,0 +1,14 @@
+from functools import _lru_cache_wrapper
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def get_if_created(getter: "_lru_cache_wrapper[T]") -> T | None:
+    """The singleton of an lru_cached get_* function, None if never created.
+
+    For shutdown and monitoring, which must not create what was never used.
+    """
+    if getter.cache_info().currsize == 0:
+        return None
+    return getter()
@@ -1,10 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
 from unittest.mock import Mock
 
 import pytest
 
+from mini_x.authentication.password_hasher import PasswordHasher
 from mini_x.repositories.blog.blog import BlogRepository
+from mini_x.repositories.follow.follow import FollowRepository
+from mini_x.repositories.timeline.timeline import TimelineRepository
 from mini_x.repositories.user.user import UserRepository
 from mini_x.settings.secrets_settings import SecretSettings
+from tests.query_budget import QueryBudget, query_budget_scope
 
 
 @pytest.fixture
@@ -27,3 +33,25 @@ def mock_user_repo() -> Mock:
 @pytest.fixture
 def mock_blog_repo() -> Mock:
     return Mock(spec=BlogRepository)
+
+
+@pytest.fixture
+def mock_follow_repo() -> Mock:
+    return Mock(spec=FollowRepository)
+
+
+@pytest.fixture
+def mock_timeline_repo() -> Mock:
+    return Mock(spec=TimelineRepository)
+
+
+@pytest.fixture
+def password_hasher() -> Iterator[PasswordHasher]:
+    hasher = PasswordHasher(ThreadPoolExecutor(max_workers=1), max_pending=4)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.fixture
+def query_budget() -> QueryBudget:
+    return query_budget_scope
@@ -0,0 +1,25 @@
+from contextlib import AbstractContextManager, contextmanager
+from typing import Callable, Iterator
+
+from mini_x.infra.db.query_stats import QueryStats, query_stats_scope
+
+QueryBudget = Callable[[int], AbstractContextManager[QueryStats]]
+
+
+@contextmanager
+def query_budget_scope(max_queries: int) -> Iterator[QueryStats]:
+    """Fails the test if the block runs more than `max_queries` queries.
+
+    Queries are counted in the current context, so the app has to run in the
+    test's task, e.g. through httpx.AsyncClient with an ASGITransport rather
+    than TestClient, which runs it in another thread.
+
+        with query_budget(3):
+            await client.get("/api/v1/blogs/posts")
+    """
+    with query_stats_scope() as query_stats:
+        yield query_stats
+    assert query_stats.count <= max_queries, (
+        f"{query_stats.count} queries over the budget of {max_queries}, "
+        f"most repeated: {query_stats.most_repeated()}"
+    )
@@ -0,0 +1,62 @@
+import logging
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from mini_x.api.access_log import AccessLogMiddleware
+from mini_x.logging_config import request_id_var
+
+logged_request_ids: list[str] = []
+
+
+def make_client(sample_rate: float) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(AccessLogMiddleware, sample_rate=sample_rate)
+
+    @app.get("/ok")
+    async def ok() -> dict[str, str]:
+        logged_request_ids.append(request_id_var.get())
+        return {}
+
+    @app.get("/fail")
+    async def fail() -> None:
+        raise HTTPException(status_code=404)
+
+    return TestClient(app)
+
+
+def test_request_id_is_generated_and_echoed() -> None:
+    response = make_client(1.0).get("/ok")
+
+    request_id = response.headers["X-Request-ID"]
+    assert len(request_id) == 32
+    assert logged_request_ids[-1] == request_id
+
+
+def test_request_id_is_taken_from_the_request() -> None:
+    response = make_client(1.0).get("/ok", headers={"X-Request-ID": "abc-123"})
+
+    assert response.headers["X-Request-ID"] == "abc-123"
+
+
+def test_access_log_has_latency(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.INFO, logger="mini_x.access"):
+        make_client(1.0).get("/ok")
+
+    (record,) = caplog.records
+    assert record.status_code == 200  # type: ignore[attr-defined]
+    assert record.path == "/ok"  # type: ignore[attr-defined]
+    assert record.latency_ms >= 0  # type: ignore[attr-defined]
+
+
+def test_only_successful_requests_are_sampled(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    client = make_client(0.0)
+
+    with caplog.at_level(logging.INFO, logger="mini_x.access"):
+        client.get("/ok")
+        client.get("/fail")
+
+    assert [record.status_code for record in caplog.records] == [404]  # type: ignore[attr-defined]
@@ -0,0 +1,59 @@
+import os
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from mini_x.api.metrics import HttpMetrics, MetricsMiddleware, router
+from mini_x.services.blog.post_cache import get_post_cache
+
+
+def test_requests_are_counted_per_route_template() -> None:
+    http_metrics = HttpMetrics()
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, http_metrics=http_metrics)
+
+    @app.get("/posts/{post_id}")
+    async def read_post(post_id: int) -> dict[str, int]:
+        return {"id": post_id}
+
+    client = TestClient(app)
+    client.get("/posts/1")
+    client.get("/posts/2")
+    client.get("/missing")
+
+    routes = http_metrics.routes
+    assert routes[("GET", "/posts/{post_id}")].requests == {200: 2}
+    assert routes[("GET", "/posts/{post_id}")].duration.snapshot().count == 2
+    assert routes[("GET", "unmatched")].requests == {404: 1}
+    assert http_metrics.in_flight == 0
+
+
+def test_metrics_endpoint_renders_text_format() -> None:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(router)
+    client = TestClient(app)
+
+    client.get("/metrics")
+    response = client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    worker = os.getpid()
+    assert (
+        'mini_x_http_requests_total{method="GET",route="/metrics",status="200",'
+        f'worker="{worker}"}}' in response.text
+    )
+
+
+def test_post_cache_errors_are_exported() -> None:
+    app = FastAPI()
+    app.include_router(router)
+    get_post_cache()
+    try:
+        response = TestClient(app).get("/metrics")
+    finally:
+        get_post_cache.cache_clear()
+
+    assert f'mini_x_cache_errors_total{{cache="post",worker="{os.getpid()}"}} 0' in (
+        response.text
+    )
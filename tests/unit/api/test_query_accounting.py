@@ -0,0 +1,76 @@
+import logging
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from mini_x.api.query_accounting import QueryAccountingMiddleware
+from mini_x.infra.db.query_stats import QueryMetrics
+from tests.query_budget import QueryBudget
+
+
+def _app(debug_headers: bool = True, repeated_query_warn_count: int = 3) -> FastAPI:
+    engine = Mock(sync_engine=create_engine("sqlite://"))
+    QueryMetrics().instrument(engine)
+
+    app = FastAPI()
+    app.add_middleware(
+        QueryAccountingMiddleware,
+        debug_headers=debug_headers,
+        repeated_query_warn_count=repeated_query_warn_count,
+    )
+
+    @app.get("/posts")
+    async def list_posts(authors: int = 1) -> dict[str, int]:
+        with engine.sync_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            # One query per author, as an N+1 would.
+            for author in range(authors):
+                connection.execute(text("SELECT :author"), {"author": author})
+        return {"authors": authors}
+
+    return app
+
+
+def test_debug_headers_report_queries_and_duplicates() -> None:
+    response = TestClient(_app()).get("/posts", params={"authors": 2})
+
+    assert response.headers["x-db-queries"] == "3"
+    assert response.headers["x-db-duplicate-queries"] == "1"
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert response.headers["server-timing"].endswith(';desc="3 queries"')
+
+
+def test_debug_headers_are_off_by_default() -> None:
+    response = TestClient(_app(debug_headers=False)).get("/posts")
+
+    assert "x-db-queries" not in response.headers
+    assert "server-timing" not in response.headers
+
+
+def test_repeated_statements_are_logged(caplog: pytest.LogCaptureFixture) -> None:
+    client = TestClient(_app())
+
+    with caplog.at_level(logging.WARNING, logger="mini_x.api.query_accounting"):
+        client.get("/posts", params={"authors": 2})
+        assert "Likely N+1" not in caplog.text
+
+        client.get("/posts", params={"authors": 3})
+
+    assert "Likely N+1 in GET /posts, statement ran 3 times: SELECT ?" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_query_budget(query_budget: QueryBudget) -> None:
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        with query_budget(3) as query_stats:
+            await client.get("/posts", params={"authors": 2})
+        assert query_stats.count == 3
+
+        with pytest.raises(AssertionError, match="4 queries over the budget of 3"):
+            with query_budget(3):
+                await client.get("/posts", params={"authors": 3})
@@ -0,0 +1,106 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import Request, Response
+
+from mini_x.api.v1.conditional import (
+    is_not_modified,
+    post_etag,
+    post_page_etag,
+    set_cache_headers,
+)
+from mini_x.api.v1.models.blog import BlogPostRead
+
+UPDATED_AT = datetime(2024, 6, 1, 12, 0, 0, 500000)
+
+
+def _request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def _post(updated_at: datetime = UPDATED_AT) -> BlogPostRead:
+    return BlogPostRead(
+        id=uuid4(),
+        content="content",
+        user_id=uuid4(),
+        created_at=UPDATED_AT,
+        updated_at=updated_at,
+    )
+
+
+def test_post_etag_changes_with_updated_at() -> None:
+    post = _post()
+    edited = post.model_copy(update={"updated_at": datetime(2024, 6, 2)})
+
+    assert post_etag(post) == post_etag(post.model_copy())
+    assert post_etag(post) != post_etag(edited)
+
+
+def test_post_page_etag_covers_cursor() -> None:
+    posts = [_post(), _post()]
+
+    assert post_page_etag(posts, None) != post_page_etag(posts, "cursor")
+    assert post_page_etag(posts, None) != post_page_etag(posts[:1], None)
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        ('"{etag}"', True),
+        ('W/"{etag}"', True),
+        ('"other", "{etag}"', True),
+        ("*", True),
+        ('"other"', False),
+    ],
+    ids=["strong", "weak", "list", "wildcard", "mismatch"],
+)
+def test_is_not_modified_if_none_match(if_none_match: str, expected: bool) -> None:
+    etag = post_etag(_post())
+    request = _request(if_none_match=if_none_match.format(etag=etag.strip('"')))
+
+    assert is_not_modified(request, etag) is expected
+
+
+@pytest.mark.parametrize(
+    "if_modified_since, expected",
+    [
+        ("Sat, 01 Jun 2024 12:00:00 GMT", True),
+        ("Sat, 01 Jun 2024 11:59:59 GMT", False),
+        ("not a date", False),
+    ],
+    ids=["same_second", "older", "invalid"],
+)
+def test_is_not_modified_if_modified_since(
+    if_modified_since: str, expected: bool
+) -> None:
+    request = _request(if_modified_since=if_modified_since)
+
+    assert is_not_modified(request, post_etag(_post()), UPDATED_AT) is expected
+
+
+def test_is_not_modified_prefers_if_none_match() -> None:
+    request = _request(
+        if_none_match='"other"', if_modified_since="Sat, 01 Jun 2024 12:00:00 GMT"
+    )
+
+    assert not is_not_modified(request, post_etag(_post()), UPDATED_AT)
+
+
+def test_set_cache_headers() -> None:
+    response = Response()
+
+    set_cache_headers(response, '"etag"', "public, max-age=30", UPDATED_AT)
+
+    assert response.headers["ETag"] == '"etag"'
+    assert response.headers["Cache-Control"] == "public, max-age=30"
+    assert response.headers["Last-Modified"] == "Sat, 01 Jun 2024 12:00:00 GMT"
@@ -0,0 +1,376 @@
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, NamedTuple
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.dialects import postgresql
+
+from mini_x.api import router
+from mini_x.api.v1.dependancies import get_current_principal
+from mini_x.authentication.auth_handler import get_password_hash
+from mini_x.authentication.password_hasher import PasswordHasher, get_password_hasher
+from mini_x.authentication.principal import Principal
+from mini_x.infra.db.models.user import User
+from mini_x.infra.db.query_stats import query_stats_var
+from mini_x.infra.db.session import get_session
+from mini_x.services.blog.post_cache import get_post_cache
+from mini_x.settings.cache_settings import CacheSettings, get_cache_settings
+from mini_x.settings.secrets_settings import SecretSettings, get_secret_settings
+from tests.query_budget import QueryBudget
+
+CREATED_AT = datetime(2024, 6, 1, 12, 0)
+
+
+class PostRow(NamedTuple):
+    id: uuid.UUID
+    user_id: uuid.UUID
+    content: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class FakeResult:
+    """The parts of a SQLAlchemy result the repositories read."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+
+    def all(self) -> list[Any]:
+        return self.rows
+
+    def scalars(self) -> "FakeResult":
+        return self
+
+    def first(self) -> Any:
+        return self.rows[0] if self.rows else None
+
+    def one(self) -> Any:
+        return self.rows[0]
+
+    def scalar_one_or_none(self) -> Any:
+        return self.first()
+
+
+class StatementCountingSession:
+    """Stands in for the request's session, without a database.
+
+    Every statement is recorded as the engine's cursor events would record it,
+    so the queries a route issues through the real services and repositories
+    count against the budget. Queries return the rows queued in `results` in
+    turn, then `rows`.
+    """
+
+    def __init__(self, rows: list[PostRow]) -> None:
+        self.rows = rows
+        self.results: list[list[Any]] = []
+        self.info: dict[str, Any] = {}
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> FakeResult:
+        query_stats = query_stats_var.get()
+        if query_stats is not None:
+            compiled = statement.compile(dialect=postgresql.dialect())
+            query_stats.record(str(compiled), 0.0)
+        return FakeResult(self.results.pop(0) if self.results else self.rows)
+
+
+@pytest.fixture
+def principal() -> Principal:
+    return Principal(user_id=uuid.uuid4(), username="test_user")
+
+
+@pytest.fixture
+def user(principal: Principal) -> User:
+    return User(
+        id=principal.user_id,
+        username=principal.username,
+        email="test_user@example.com",
+        hashed_password=get_password_hash("password123"),
+    )
+
+
+@pytest.fixture
+def rows(principal: Principal) -> list[PostRow]:
+    return [
+        PostRow(
+            uuid.uuid4(), principal.user_id, f"Test content {i}", CREATED_AT, CREATED_AT
+        )
+        for i in range(3)
+    ]
+
+
+@pytest.fixture
+def session(rows: list[PostRow]) -> StatementCountingSession:
+    return StatementCountingSession(rows)
+
+
+@pytest.fixture
+def client(
+    session: StatementCountingSession,
+    principal: Principal,
+    secret_settings: SecretSettings,
+    password_hasher: PasswordHasher,
+) -> httpx.AsyncClient:
+    async def get_test_session() -> AsyncIterator[StatementCountingSession]:
+        yield session
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    app.dependency_overrides[get_session] = get_test_session
+    app.dependency_overrides[get_post_cache] = lambda: None
+    app.dependency_overrides[get_cache_settings] = lambda: CacheSettings(
+        user_enabled=False
+    )
+    app.dependency_overrides[get_current_principal] = lambda: principal
+    app.dependency_overrides[get_secret_settings] = lambda: secret_settings
+    app.dependency_overrides[get_password_hasher] = lambda: password_hasher
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_posts_by_ids_is_one_query(
+    client: httpx.AsyncClient, rows: list[PostRow], query_budget: QueryBudget
+) -> None:
+    async with client:
+        with query_budget(1) as query_stats:
+            response = await client.get(
+                "/api/v1/blogs/posts", params={"ids": [str(row.id) for row in rows]}
+            )
+
+    assert response.status_code == 200
+    assert query_stats.count == 1
+    assert len(response.json()["items"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_read_posts_by_user_is_one_query(
+    client: httpx.AsyncClient, rows: list[PostRow], query_budget: QueryBudget
+) -> None:
+    async with client:
+        with query_budget(1) as query_stats:
+            response = await client.get(
+                f"/api/v1/blogs/users/{rows[0].user_id}/posts", params={"limit": 5}
+            )
+
+    assert response.status_code == 200
+    assert query_stats.count == 1
+    assert len(response.json()) == 3
+
+
+@pytest.mark.asyncio
+async def test_read_post_is_one_query(
+    client: httpx.AsyncClient, rows: list[PostRow], query_budget: QueryBudget
+) -> None:
+    async with client:
+        with query_budget(1):
+            response = await client.get(f"/api/v1/blogs/posts/{rows[0].id}")
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_search_posts_is_one_query(
+    client: httpx.AsyncClient, query_budget: QueryBudget
+) -> None:
+    async with client:
+        with query_budget(1):
+            response = await client.get(
+                "/api/v1/blogs/posts/search", params={"q": "content"}
+            )
+
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+
+
+@pytest.mark.asyncio
+async def test_read_home_timeline_is_one_query(
+    client: httpx.AsyncClient, query_budget: QueryBudget
+) -> None:
+    async with client:
+        with query_budget(1):
+            response = await client.get("/api/v1/blogs/timeline")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_post_inserts_and_fans_out(
+    client: httpx.AsyncClient, query_budget: QueryBudget
+) -> None:
+    async with client:
+        with query_budget(2):
+            response = await client.post(
+                "/api/v1/blogs/posts/", json={"content": "Test content"}
+            )
+
+    assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_create_posts_inserts_and_fans_out_once(
+    client: httpx.AsyncClient, query_budget: QueryBudget
+) -> None:
+    items = [{"content": f"Test content {i}"} for i in range(20)]
+
+    async with client:
+        with query_budget(2):
+            response = await client.post(
+                "/api/v1/blogs/posts/batch", json={"items": items}
+            )
+
+    assert response.status_code == 201
+    assert len(response.json()) == 20
+
+
+@pytest.mark.asyncio
+async def test_update_post_is_one_query(
+    client: httpx.AsyncClient, rows: list[PostRow], query_budget: QueryBudget
+) -> None:
+    async with client:
+        with query_budget(1):
+            response = await client.put(
+                f"/api/v1/blogs/posts/{rows[0].id}", json={"content": "Updated"}
+            )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_delete_post_is_one_query(
+    client: httpx.AsyncClient, rows: list[PostRow], query_budget: QueryBudget
+) -> None:
+    async with client:
+        with query_budget(1):
+            response = await client.delete(f"/api/v1/blogs/posts/{rows[0].id}")
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_follow_counts_and_backfills(
+    client: httpx.AsyncClient,
+    session: StatementCountingSession,
+    query_budget: QueryBudget,
+) -> None:
+    followee_id = uuid.uuid4()
+    session.results = [[followee_id], [(1, False)]]
+
+    async with client:
+        with query_budget(3):
+            response = await client.post(f"/api/v1/users/{followee_id}/follow")
+
+    assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_unfollow_counts_and_removes_posts(
+    client: httpx.AsyncClient,
+    session: StatementCountingSession,
+    query_budget: QueryBudget,
+) -> None:
+    followee_id = uuid.uuid4()
+    session.results = [[followee_id], [(0, False)]]
+
+    async with client:
+        with query_budget(3):
+            response = await client.delete(f"/api/v1/users/{followee_id}/follow")
+
+    assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_read_users_me_is_one_query(
+    client: httpx.AsyncClient,
+    session: StatementCountingSession,
+    user: User,
+    query_budget: QueryBudget,
+) -> None:
+    session.results = [[user]]
+
+    async with client:
+        with query_budget(1):
+            response = await client.get("/api/v1/users/me")
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_update_user_me_is_one_query(
+    client: httpx.AsyncClient,
+    session: StatementCountingSession,
+    user: User,
+    query_budget: QueryBudget,
+) -> None:
+    session.results = [[user]]
+
+    async with client:
+        with query_budget(1):
+            response = await client.put("/api/v1/users/me", json={"city": "Berlin"})
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_search_users_is_one_query(
+    client: httpx.AsyncClient,
+    session: StatementCountingSession,
+    user: User,
+    query_budget: QueryBudget,
+) -> None:
+    session.results = [[user]]
+
+    async with client:
+        with query_budget(1):
+            response = await client.get(
+                "/api/v1/users/search", params={"prefix": "test"}
+            )
+
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_register_is_one_query(
+    client: httpx.AsyncClient,
+    session: StatementCountingSession,
+    user: User,
+    query_budget: QueryBudget,
+) -> None:
+    session.results = [[user]]
+
+    async with client:
+        with query_budget(1):
+            response = await client.post(
+                "/api/v1/auth/register",
+                json={
+                    "username": user.username,
+                    "email": user.email,
+                    "password": "password123",
+                },
+            )
+
+    assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_login_is_one_query(
+    client: httpx.AsyncClient,
+    session: StatementCountingSession,
+    user: User,
+    query_budget: QueryBudget,
+) -> None:
+    session.results = [[user]]
+
+    async with client:
+        with query_budget(1):
+            response = await client.post(
+                "/api/v1/auth/login",
+                data={"username": user.username, "password": "password123"},
+            )
+
+    assert response.status_code == 200
+    assert response.json()["token_type"] == "bearer"
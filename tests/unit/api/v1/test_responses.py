@@ -0,0 +1,28 @@
+import json
+from datetime import datetime
+from uuid import uuid4
+
+from mini_x.api.v1.models.blog import BlogPostRead
+from mini_x.api.v1.responses import FastJSONResponse, model_response
+
+
+def test_model_response_serializes_models() -> None:
+    post = BlogPostRead(
+        id=uuid4(),
+        content="content",
+        user_id=uuid4(),
+        created_at=datetime(2024, 6, 1, 12, 0),
+        updated_at=datetime(2024, 6, 1, 12, 0),
+    )
+
+    response = model_response([post], status_code=201)
+
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body) == [json.loads(post.model_dump_json())]
+
+
+def test_fast_json_response_renders_plain_data() -> None:
+    response = FastJSONResponse({"message": "ok", "items": [1, None]})
+
+    assert response.body == b'{"message":"ok","items":[1,null]}'
@@ -1,3 +1,7 @@
+import uuid
+from datetime import datetime, timedelta
+
+import jwt
 import pytest
 from passlib.context import CryptContext
 
@@ -5,9 +9,12 @@ from mini_x.authentication.auth_handler import (
     verify_password,
     get_password_hash,
     create_access_token,
+    create_user_access_token,
     decode_access_token,
+    get_principal_from_token,
     SecretSettings,
 )
+from mini_x.authentication.principal import Principal
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -81,3 +88,35 @@ def test_decode_access_token_with_invalid_algorithm(
     )
     decoded_data = decode_access_token(token, invalid_algorithm_settings)
     assert decoded_data is None
+
+
+def test_get_principal_from_token(secret_settings: SecretSettings) -> None:
+    user_id = uuid.uuid4()
+    token = create_user_access_token(
+        user_id=user_id, username="test_user", secret_settings=secret_settings
+    )
+
+    principal = get_principal_from_token(token, secret_settings)
+
+    assert principal == Principal(user_id=user_id, username="test_user")
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"sub": "test_user", "ver": 1},
+        {"sub": "test_user", "uid": "not-a-uuid", "ver": 1},
+        {"sub": "test_user", "uid": str(uuid.uuid4())},
+    ],
+    ids=["missing_user_id_case", "invalid_user_id_case", "missing_version_case"],
+)
+def test_get_principal_from_token_rejects_claims(
+    secret_settings: SecretSettings, claims: dict[str, str | int]
+) -> None:
+    token = jwt.encode(
+        {**claims, "exp": datetime.utcnow() + timedelta(minutes=5)},
+        secret_settings.key,
+        algorithm=secret_settings.algorithm,
+    )
+
+    assert get_principal_from_token(token, secret_settings) is None
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mini_x.authentication.error import PasswordHashingOverloadedException
+from mini_x.authentication import password_hasher as password_hasher_module
+from mini_x.authentication.password_hasher import PasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify(password_hasher: PasswordHasher) -> None:
+    hashed_password = await password_hasher.hash("password123")
+
+    assert await password_hasher.verify("password123", hashed_password)
+    assert not await password_hasher.verify("differentpassword", hashed_password)
+
+    status = password_hasher.get_status()
+    assert status.pending == 0
+    assert status.completed == 3
+    assert status.queue_wait.count == 3
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_is_full() -> None:
+    password_hasher = PasswordHasher(ThreadPoolExecutor(max_workers=1), max_pending=1)
+    in_flight = asyncio.create_task(password_hasher.hash("password123"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordHashingOverloadedException):
+        await password_hasher.hash("anotherpassword")
+
+    await in_flight
+    status = password_hasher.get_status()
+    assert status.rejected == 1
+    assert status.completed == 1
+    password_hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_stays_pending_until_its_job_is_done(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    release = threading.Event()
+    monkeypatch.setattr(
+        password_hasher_module, "get_password_hash", lambda password: release.wait()
+    )
+    password_hasher = PasswordHasher(ThreadPoolExecutor(max_workers=1), max_pending=1)
+    try:
+        caller = asyncio.create_task(password_hasher.hash("password123"))
+        await asyncio.sleep(0.01)
+
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+        # The job still runs, so the executor is still taken.
+        assert password_hasher.get_status().pending == 1
+        with pytest.raises(PasswordHashingOverloadedException):
+            await password_hasher.hash("anotherpassword")
+    finally:
+        release.set()
+
+    for _ in range(100):
+        if password_hasher.get_status().pending == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert password_hasher.get_status().pending == 0
+    password_hasher.shutdown()
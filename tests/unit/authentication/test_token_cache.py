@@ -0,0 +1,99 @@
+import time
+from datetime import timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from mini_x.authentication import token_cache as token_cache_module
+from mini_x.authentication.auth_handler import create_user_access_token
+from mini_x.authentication.token_cache import VerifiedTokenCache
+from mini_x.infra.cache.ttl_cache import TTLCache
+from mini_x.settings.secrets_settings import SecretSettings
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def token_cache(clock: FakeClock) -> VerifiedTokenCache:
+    return VerifiedTokenCache(
+        TTLCache(max_size=2, ttl_seconds=300, clock=clock),
+        ttl_seconds=300,
+        clock=lambda: time.time() + clock.now,
+    )
+
+
+@pytest.fixture
+def token(secret_settings: SecretSettings) -> str:
+    return create_user_access_token(
+        uuid4(), "alice", secret_settings, expires_delta=timedelta(minutes=1)
+    )
+
+
+def test_repeat_lookups_skip_verification(
+    token_cache: VerifiedTokenCache, token: str, secret_settings: SecretSettings
+) -> None:
+    principal = token_cache.get_principal(token, secret_settings)
+
+    with patch.object(token_cache_module, "decode_access_token") as decode:
+        assert token_cache.get_principal(token, secret_settings) == principal
+        decode.assert_not_called()
+
+    assert principal is not None
+    assert principal.username == "alice"
+    assert token_cache.get_status().hits == 1
+
+
+def test_entries_expire_with_token(
+    token_cache: VerifiedTokenCache,
+    token: str,
+    secret_settings: SecretSettings,
+    clock: FakeClock,
+) -> None:
+    token_cache.get_principal(token, secret_settings)
+
+    clock.now = 61
+
+    with patch.object(
+        token_cache_module, "decode_access_token", return_value=None
+    ) as decode:
+        assert token_cache.get_principal(token, secret_settings) is None
+        decode.assert_called_once()
+    assert token_cache.get_status().expirations == 1
+
+
+def test_invalid_tokens_are_not_cached(
+    token_cache: VerifiedTokenCache, secret_settings: SecretSettings
+) -> None:
+    assert token_cache.get_principal("not-a-token", secret_settings) is None
+    assert token_cache.get_status().size == 0
+
+
+def test_other_key_does_not_match(
+    token_cache: VerifiedTokenCache, token: str, secret_settings: SecretSettings
+) -> None:
+    token_cache.get_principal(token, secret_settings)
+    rotated = secret_settings.model_copy(update={"key": "rotated_secret"})
+
+    assert token_cache.get_principal(token, rotated) is None
+
+
+def test_flush(
+    token_cache: VerifiedTokenCache, token: str, secret_settings: SecretSettings
+) -> None:
+    token_cache.get_principal(token, secret_settings)
+
+    token_cache.flush()
+
+    assert token_cache.get_status().size == 0
@@ -0,0 +1,171 @@
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from mini_x.infra.cache.redis import (
+    RedisCacheBackend,
+    RedisConnectionError,
+    RedisError,
+)
+
+
+class FakeRedisServer:
+    """Just enough of the Redis protocol to serve GET, SET (with PX) and DEL."""
+
+    def __init__(self) -> None:
+        self.data: dict[bytes, bytes] = {}
+        self.commands: list[list[bytes]] = []
+        self.connections = 0
+        # Replies to the next command are cut short and the connection closed.
+        self.close_mid_reply = False
+        # The next reply is an integer that does not parse.
+        self.malformed_reply = False
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while True:
+                header = await reader.readuntil(b"\r\n")
+                args = []
+                for _ in range(int(header[1:-2])):
+                    length = int((await reader.readuntil(b"\r\n"))[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                self.commands.append(args)
+                if self.close_mid_reply:
+                    self.close_mid_reply = False
+                    writer.write(self._reply(args)[:3])
+                    await writer.drain()
+                    writer.close()
+                    return
+                if self.malformed_reply:
+                    self.malformed_reply = False
+                    writer.write(b":not a number\r\n")
+                elif args[0].upper() != b"AUTH":
+                    # AUTH is left unanswered, as by a hung server.
+                    writer.write(self._reply(args))
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    def _reply(self, args: list[bytes]) -> bytes:
+        command = args[0].upper()
+        if command == b"GET":
+            value = self.data.get(args[1])
+            if value is None:
+                return b"$-1\r\n"
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        if command == b"SET":
+            self.data[args[1]] = args[2]
+            return b"+OK\r\n"
+        if command == b"DEL":
+            return b":%d\r\n" % int(self.data.pop(args[1], None) is not None)
+        return b"-ERR unknown command\r\n"
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedisServer:
+    return FakeRedisServer()
+
+
+@pytest_asyncio.fixture
+async def redis_backend(
+    fake_redis: FakeRedisServer,
+) -> AsyncIterator[RedisCacheBackend]:
+    server = await asyncio.start_server(fake_redis.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    backend = RedisCacheBackend(host="127.0.0.1", port=port, pool_size=2)
+
+    yield backend
+
+    await backend.close()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_set_get_delete(
+    redis_backend: RedisCacheBackend, fake_redis: FakeRedisServer
+) -> None:
+    assert await redis_backend.get("key") is None
+
+    await redis_backend.set("key", b"value\r\nwith separators", ttl_seconds=1.5)
+    assert await redis_backend.get("key") == b"value\r\nwith separators"
+
+    await redis_backend.delete("key")
+    assert await redis_backend.get("key") is None
+
+    assert fake_redis.commands[1] == [
+        b"SET",
+        b"key",
+        b"value\r\nwith separators",
+        b"PX",
+        b"1500",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused(
+    redis_backend: RedisCacheBackend, fake_redis: FakeRedisServer
+) -> None:
+    await asyncio.gather(*(redis_backend.get(f"key{i}") for i in range(10)))
+    await redis_backend.get("key")
+
+    assert fake_redis.connections <= 2
+
+
+@pytest.mark.asyncio
+async def test_error_reply_raises(
+    redis_backend: RedisCacheBackend, fake_redis: FakeRedisServer
+) -> None:
+    with pytest.raises(RedisError):
+        await redis_backend._execute(b"UNKNOWN")
+
+    assert await redis_backend.get("key") is None
+    assert fake_redis.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_connection_closed_mid_reply_is_dropped(
+    redis_backend: RedisCacheBackend, fake_redis: FakeRedisServer
+) -> None:
+    await redis_backend.set("key", b"value", ttl_seconds=1)
+    fake_redis.close_mid_reply = True
+
+    with pytest.raises(RedisConnectionError):
+        await redis_backend.get("key")
+
+    assert await redis_backend.get("key") == b"value"
+    assert fake_redis.connections == 2
+
+
+@pytest.mark.asyncio
+async def test_malformed_reply_drops_the_connection(
+    redis_backend: RedisCacheBackend, fake_redis: FakeRedisServer
+) -> None:
+    fake_redis.malformed_reply = True
+
+    with pytest.raises(RedisConnectionError):
+        await redis_backend.get("key")
+
+    assert await redis_backend.get("key") is None
+    assert fake_redis.connections == 2
+
+
+@pytest.mark.asyncio
+async def test_handshake_times_out(fake_redis: FakeRedisServer) -> None:
+    server = await asyncio.start_server(fake_redis.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    backend = RedisCacheBackend(
+        host="127.0.0.1", port=port, password="secret", timeout_seconds=0.05
+    )
+
+    with pytest.raises(TimeoutError):
+        await backend.get("key")
+
+    assert fake_redis.commands == [[b"AUTH", b"secret"]]
+    server.close()
+    await server.wait_closed()
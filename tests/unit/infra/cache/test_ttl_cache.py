@@ -0,0 +1,67 @@
+import pytest
+
+from mini_x.infra.cache.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> TTLCache[str, int]:
+    return TTLCache(max_size=2, ttl_seconds=10, clock=clock)
+
+
+def test_get_hit_and_miss(cache: TTLCache[str, int]) -> None:
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+    status = cache.get_status()
+    assert status.hits == 1
+    assert status.misses == 1
+
+
+def test_entries_expire(cache: TTLCache[str, int], clock: FakeClock) -> None:
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=20)
+
+    clock.now = 10
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get_status().expirations == 1
+
+
+def test_least_recently_used_entry_is_evicted(cache: TTLCache[str, int]) -> None:
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.get_status().evictions == 1
+
+
+def test_pop_and_clear(cache: TTLCache[str, int]) -> None:
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+
+    cache.clear()
+    assert cache.get_status().size == 0
@@ -0,0 +1,68 @@
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from mini_x.infra.db.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolLimits,
+    worker_pool_limits,
+)
+
+
+@pytest.fixture
+def pool() -> InstrumentedAsyncAdaptedQueuePool:
+    return InstrumentedAsyncAdaptedQueuePool(
+        creator=Mock, pool_size=1, max_overflow=0, timeout=0.01
+    )
+
+
+@pytest.mark.asyncio
+async def test_checkout_is_recorded(pool: InstrumentedAsyncAdaptedQueuePool) -> None:
+    connection = await greenlet_spawn(pool.connect)
+
+    status = pool.get_status()
+    assert status.checked_out == 1
+    assert status.checkouts == 1
+    assert status.wait_time.count == 1
+
+    await greenlet_spawn(connection.close)
+    assert pool.get_status().checked_out == 0
+
+
+@pytest.mark.asyncio
+async def test_checkout_timeout_is_counted(
+    pool: InstrumentedAsyncAdaptedQueuePool,
+) -> None:
+    connection = await greenlet_spawn(pool.connect)
+
+    with pytest.raises(PoolTimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    status = pool.get_status()
+    assert status.timeouts == 1
+    assert status.checkouts == 1
+    assert status.overflow == 0
+
+    await greenlet_spawn(connection.close)
+
+
+@pytest.mark.parametrize(
+    ("connection_budget", "workers", "expected"),
+    [
+        (None, 8, PoolLimits(pool_size=5, max_overflow=10)),
+        (120, 8, PoolLimits(pool_size=5, max_overflow=10)),
+        (90, 8, PoolLimits(pool_size=5, max_overflow=6)),
+        (24, 8, PoolLimits(pool_size=3, max_overflow=0)),
+    ],
+)
+def test_worker_pool_limits(
+    connection_budget: int | None, workers: int, expected: PoolLimits
+) -> None:
+    assert worker_pool_limits(5, 10, connection_budget, workers) == expected
+
+
+def test_worker_pool_limits_budget_too_small() -> None:
+    with pytest.raises(ValueError):
+        worker_pool_limits(5, 10, 3, 4)
@@ -0,0 +1,110 @@
+import logging
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.util import greenlet_spawn
+
+from mini_x.infra.db.query_stats import (
+    QueryMetrics,
+    QueryStats,
+    query_stats_scope,
+    query_stats_var,
+)
+from tests.query_budget import QueryBudget
+
+
+@pytest.fixture
+def query_metrics() -> tuple[QueryMetrics, Mock]:
+    query_metrics = QueryMetrics()
+    engine = Mock(sync_engine=create_engine("sqlite://"))
+    query_metrics.instrument(engine)
+    return query_metrics, engine
+
+
+def test_queries_are_timed_and_counted_per_request(
+    query_metrics: tuple[QueryMetrics, Mock],
+) -> None:
+    metrics, engine = query_metrics
+    query_stats = QueryStats()
+    token = query_stats_var.set(query_stats)
+    try:
+        with engine.sync_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+    finally:
+        query_stats_var.reset(token)
+
+    assert query_stats.count == 2
+    assert query_stats.seconds > 0
+    assert metrics.get_status().duration.count == 2
+
+
+def test_failed_queries_are_counted(query_metrics: tuple[QueryMetrics, Mock]) -> None:
+    metrics, engine = query_metrics
+
+    with engine.sync_engine.connect() as connection:
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing"))
+        connection.execute(text("SELECT 1"))
+
+    status = metrics.get_status()
+    assert status.errors == 1
+    assert status.duration.count == 1
+
+
+def test_repeated_statements_are_counted_as_duplicates(
+    query_metrics: tuple[QueryMetrics, Mock],
+) -> None:
+    _, engine = query_metrics
+
+    with query_stats_scope() as outer:
+        with engine.sync_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            with query_stats_scope() as inner:
+                for value in range(3):
+                    connection.execute(text("SELECT :value"), {"value": value})
+
+    assert inner.count == 3
+    assert inner.duplicates == 2
+    assert inner.most_repeated() == ("SELECT ?", 3)
+    assert outer.count == 4
+    assert outer.duplicates == 2
+    assert query_stats_var.get() is None
+
+
+def test_slow_queries_are_logged_without_parameters(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    metrics = QueryMetrics(slow_query_seconds=1e-9)
+    engine = Mock(sync_engine=create_engine("sqlite://"))
+    metrics.instrument(engine)
+
+    with caplog.at_level(logging.WARNING, logger="mini_x.infra.db.query_stats"):
+        with engine.sync_engine.connect() as connection:
+            connection.execute(text("SELECT :secret"), {"secret": "hunter2"})
+
+    assert metrics.get_status().slow_queries == 1
+    assert "Slow query" in caplog.text
+    assert "SELECT ?" in caplog.text
+    assert "hunter2" not in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_events_reach_the_budget_of_the_awaiting_task(
+    query_metrics: tuple[QueryMetrics, Mock], query_budget: QueryBudget
+) -> None:
+    _, engine = query_metrics
+
+    def run_queries() -> None:
+        with engine.sync_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+    # The bridge AsyncEngine runs the sync engine through, the cursor events fire
+    # in a greenlet, not in the awaiting task.
+    with query_budget(2) as query_stats:
+        await greenlet_spawn(run_queries)
+
+    assert query_stats.count == 2
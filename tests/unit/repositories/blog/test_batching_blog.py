@@ -0,0 +1,135 @@
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from mini_x.repositories.blog.batching_blog import PostWriteBatcher
+
+
+class FakeSessionScope:
+    def __init__(self) -> None:
+        self.session = AsyncMock()
+        self.session.execute.side_effect = self._execute
+        self.batches: list[list[str]] = []
+        self.insert_statements: list[str] = []
+        self.fan_outs = 0
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator[AsyncMock]:
+        yield self.session
+
+    async def _execute(
+        self, statement: Any, rows: list[dict[str, Any]] | None = None
+    ) -> None:
+        if rows is None:
+            # The timeline fan-out, an INSERT ... SELECT without rows.
+            self.fan_outs += 1
+            return
+        contents = [row["content"] for row in rows]
+        if "bad" in contents:
+            raise ValueError("bad row")
+        self.batches.append(contents)
+        self.insert_statements.append(
+            str(statement.compile(dialect=postgresql.dialect()))
+        )
+
+
+@pytest.fixture
+def session_scope() -> FakeSessionScope:
+    return FakeSessionScope()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_creates_share_one_insert(
+    session_scope: FakeSessionScope,
+) -> None:
+    batcher = PostWriteBatcher(session_scope, window_seconds=0.01, max_batch_size=10)
+    user_id = uuid.uuid4()
+
+    posts = await asyncio.gather(
+        *(batcher.create_post(user_id, f"post {i}") for i in range(3))
+    )
+
+    assert session_scope.batches == [["post 0", "post 1", "post 2"]]
+    # RETURNING has SQLAlchemy send the batch as one multi-row INSERT.
+    [statement] = session_scope.insert_statements
+    assert "RETURNING" in statement
+    assert [post.content for post in posts] == ["post 0", "post 1", "post 2"]
+    assert len({post.id for post in posts}) == 3
+    status = batcher.get_status()
+    assert status.batches == 1
+    assert status.posts == 3
+    assert status.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_written_without_waiting(
+    session_scope: FakeSessionScope,
+) -> None:
+    batcher = PostWriteBatcher(session_scope, window_seconds=60, max_batch_size=2)
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            *(batcher.create_post(uuid.uuid4(), f"post {i}") for i in range(2))
+        ),
+        timeout=1,
+    )
+
+    assert session_scope.batches == [["post 0", "post 1"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_only_fails_the_bad_row(
+    session_scope: FakeSessionScope,
+) -> None:
+    batcher = PostWriteBatcher(session_scope, window_seconds=0.01, max_batch_size=10)
+
+    results = await asyncio.gather(
+        batcher.create_post(uuid.uuid4(), "good"),
+        batcher.create_post(uuid.uuid4(), "bad"),
+        return_exceptions=True,
+    )
+
+    assert results[0].content == "good"  # type: ignore[union-attr]
+    assert isinstance(results[1], ValueError)
+    assert session_scope.batches == [["good"]]
+    assert batcher.get_status().failed_posts == 1
+
+
+@pytest.mark.asyncio
+async def test_close_writes_pending_posts(session_scope: FakeSessionScope) -> None:
+    batcher = PostWriteBatcher(session_scope, window_seconds=60, max_batch_size=10)
+
+    create = asyncio.create_task(batcher.create_post(uuid.uuid4(), "post"))
+    await asyncio.sleep(0)
+    await batcher.close()
+
+    assert (await create).content == "post"
+    assert session_scope.batches == [["post"]]
+
+
+@pytest.mark.asyncio
+async def test_posts_are_fanned_out_in_the_batch_transaction(
+    session_scope: FakeSessionScope,
+) -> None:
+    batcher = PostWriteBatcher(
+        session_scope,
+        window_seconds=0.01,
+        max_batch_size=10,
+        fan_out=True,
+    )
+    author_ids = [uuid.uuid4(), uuid.uuid4()]
+
+    await asyncio.gather(
+        batcher.create_post(author_ids[0], "post 0"),
+        batcher.create_post(author_ids[1], "post 1"),
+        batcher.create_post(author_ids[0], "post 2"),
+    )
+
+    assert session_scope.batches == [["post 0", "post 1", "post 2"]]
+    # One fan-out per author, in the session that inserted the posts.
+    assert session_scope.fan_outs == 2
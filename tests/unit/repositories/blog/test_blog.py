@@ -0,0 +1,106 @@
+import uuid
+from typing import Any, Sequence
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from mini_x.repositories.blog.blog import BlogRepository, NewPostRow
+
+
+@pytest.fixture
+def driver_connection() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def session(driver_connection: AsyncMock) -> AsyncMock:
+    session = AsyncMock()
+    raw_connection = Mock(driver_connection=driver_connection)
+    session.connection.return_value.get_raw_connection = AsyncMock(
+        return_value=raw_connection
+    )
+    return session
+
+
+@pytest.mark.asyncio
+async def test_create_posts_inserts_small_batches(
+    session: AsyncMock, driver_connection: AsyncMock
+) -> None:
+    user_id = uuid.uuid4()
+    repository = BlogRepository(session, copy_threshold=3)
+
+    posts = await repository.create_posts(user_id, ["a", "b"])
+
+    assert [post.content for post in posts] == ["a", "b"]
+    assert {post.user_id for post in posts} == {user_id}
+    statement, parameters = session.execute.call_args.args
+    assert [row["id"] for row in parameters] == [post.id for post in posts]
+    # Without RETURNING the rows would go out as one INSERT each.
+    assert "RETURNING" in str(statement.compile(dialect=postgresql.dialect()))
+    driver_connection.copy_records_to_table.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_posts_copies_large_batches(
+    session: AsyncMock, driver_connection: AsyncMock
+) -> None:
+    repository = BlogRepository(session, copy_threshold=3)
+
+    posts = await repository.create_posts(uuid.uuid4(), ["a", "b", "c"])
+
+    driver_connection.copy_records_to_table.assert_called_once()
+    call = driver_connection.copy_records_to_table.call_args
+    assert call.args == ("blog_posts",)
+    assert call.kwargs["records"] == posts
+    assert call.kwargs["columns"] == (
+        "id",
+        "user_id",
+        "content",
+        "created_at",
+        "updated_at",
+    )
+
+
+class TransactionalDriverConnection:
+    """Keeps COPYed rows pending while a transaction is open, as Postgres does,
+    and commits them at once when there is none."""
+
+    def __init__(self) -> None:
+        self.in_transaction = False
+        self.pending: list[NewPostRow] = []
+        self.committed: list[NewPostRow] = []
+
+    async def copy_records_to_table(
+        self, table: str, records: Sequence[NewPostRow], **kwargs: Any
+    ) -> None:
+        if self.in_transaction:
+            self.pending.extend(records)
+        else:
+            self.committed.extend(records)
+
+    def begin(self, *args: Any) -> None:
+        self.in_transaction = True
+
+    def rollback(self) -> None:
+        self.in_transaction = False
+        self.pending.clear()
+
+
+@pytest.mark.asyncio
+async def test_copy_is_rolled_back_with_the_session() -> None:
+    driver_connection = TransactionalDriverConnection()
+    session = AsyncMock()
+    # Like SQLAlchemy's asyncpg adapter, the transaction starts with the first
+    # statement run through the session.
+    session.execute.side_effect = driver_connection.begin
+    session.connection.return_value.get_raw_connection = AsyncMock(
+        return_value=Mock(driver_connection=driver_connection)
+    )
+    repository = BlogRepository(session, copy_threshold=1)
+
+    await repository.create_posts(uuid.uuid4(), ["a", "b"])
+    # A failure later in the request rolls the session back.
+    driver_connection.rollback()
+
+    assert driver_connection.committed == []
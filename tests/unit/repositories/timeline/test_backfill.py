@@ -0,0 +1,59 @@
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import Update
+
+from mini_x.repositories.timeline.backfill import TimelineBackfiller
+
+
+class FakeSessionScope:
+    """Unflags the given pages of followers, one per transaction."""
+
+    def __init__(self, pages: list[list[uuid.UUID]]) -> None:
+        self.pages = pages
+        self.transactions = 0
+        self.backfilled: list[list[uuid.UUID]] = []
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator[AsyncMock]:
+        session = AsyncMock()
+        session.execute.side_effect = self._execute
+        yield session
+        self.transactions += 1
+
+    async def _execute(self, statement: Any) -> Mock:
+        if isinstance(statement, Update):
+            page = self.pages.pop(0) if self.pages else []
+            return Mock(scalars=Mock(return_value=Mock(all=Mock(return_value=page))))
+        self.backfilled.append(statement.compile().params["follower_ids"])
+        return Mock()
+
+
+@pytest.mark.asyncio
+async def test_backfills_followers_in_batches() -> None:
+    pages = [[uuid.uuid4(), uuid.uuid4()], [uuid.uuid4()]]
+    session_scope = FakeSessionScope([list(page) for page in pages])
+    backfiller = TimelineBackfiller(session_scope, batch_size=2, backfill_posts=20)
+
+    backfiller.schedule(uuid.uuid4())
+    await asyncio.gather(*backfiller._jobs)
+
+    # A short page is the last one, no empty batch follows it.
+    assert session_scope.transactions == 2
+    assert session_scope.backfilled == pages
+
+
+@pytest.mark.asyncio
+async def test_author_pulled_again_stops_the_job() -> None:
+    session_scope = FakeSessionScope([])
+    backfiller = TimelineBackfiller(session_scope, batch_size=2, backfill_posts=20)
+
+    backfiller.schedule(uuid.uuid4())
+    await asyncio.gather(*backfiller._jobs)
+
+    assert session_scope.transactions == 1
+    assert session_scope.backfilled == []
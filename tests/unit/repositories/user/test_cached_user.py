@@ -0,0 +1,108 @@
+import uuid
+from unittest.mock import Mock
+
+import pytest
+
+from mini_x.infra.cache.ttl_cache import TTLCache
+from mini_x.infra.db.models.user import User
+from mini_x.infra.db.session import AfterCommitHook
+from mini_x.repositories.user.cached_user import CachedUserRepository, UserCache
+
+
+@pytest.fixture
+def user() -> User:
+    return User(id=uuid.uuid4(), username="test_user", email="test@case.com")
+
+
+@pytest.fixture
+def user_cache() -> UserCache:
+    return TTLCache(max_size=10, ttl_seconds=60)
+
+
+@pytest.fixture
+def cached_user_repo(
+    mock_user_repo: Mock, user_cache: UserCache
+) -> CachedUserRepository:
+    return CachedUserRepository(mock_user_repo, user_cache)
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_is_cached(
+    user: User, cached_user_repo: CachedUserRepository, mock_user_repo: Mock
+) -> None:
+    mock_user_repo.get_by_id.return_value = user
+
+    await cached_user_repo.get_by_id(user.id)  # type: ignore[arg-type]
+    cached = await cached_user_repo.get_by_id(user.id)  # type: ignore[arg-type]
+
+    assert cached is not None
+    assert cached.username == user.username
+    mock_user_repo.get_by_id.assert_called_once_with(user.id)
+
+
+@pytest.mark.asyncio
+async def test_get_by_username_shares_the_cached_user(
+    user: User, cached_user_repo: CachedUserRepository, mock_user_repo: Mock
+) -> None:
+    mock_user_repo.get_by_id.return_value = user
+
+    await cached_user_repo.get_by_id(user.id)  # type: ignore[arg-type]
+    cached = await cached_user_repo.get_by_username("test_user")
+
+    assert cached is not None
+    assert cached.id == user.id
+    mock_user_repo.get_by_username.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_missing_user_is_not_cached(
+    cached_user_repo: CachedUserRepository, mock_user_repo: Mock
+) -> None:
+    mock_user_repo.get_by_username.return_value = None
+
+    assert await cached_user_repo.get_by_username("new_user") is None
+    assert await cached_user_repo.get_by_username("new_user") is None
+
+    assert mock_user_repo.get_by_username.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_user_invalidates_both_lookups(
+    user: User, cached_user_repo: CachedUserRepository, mock_user_repo: Mock
+) -> None:
+    mock_user_repo.get_by_username.return_value = user
+    await cached_user_repo.get_by_username("test_user")
+
+    await cached_user_repo.update_user(
+        user.id,  # type: ignore[arg-type]
+        {"full_name": "Updated Test User"},
+    )
+    await cached_user_repo.get_by_id(user.id)  # type: ignore[arg-type]
+    await cached_user_repo.get_by_username("test_user")
+
+    mock_user_repo.update_user.assert_called_once()
+    mock_user_repo.get_by_id.assert_called_once_with(user.id)
+    assert mock_user_repo.get_by_username.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_user_invalidates_again_after_commit(
+    user: User, mock_user_repo: Mock, user_cache: UserCache
+) -> None:
+    after_commit_hooks: list[AfterCommitHook] = []
+    cached_user_repo = CachedUserRepository(
+        mock_user_repo, user_cache, after_commit_hooks.append
+    )
+    await cached_user_repo.update_user(
+        user.id,  # type: ignore[arg-type]
+        {"full_name": "Updated Test User"},
+    )
+    # A concurrent read caches the old user before the update commits.
+    mock_user_repo.get_by_id.return_value = user
+    await cached_user_repo.get_by_id(user.id)  # type: ignore[arg-type]
+
+    for hook in after_commit_hooks:
+        await hook()
+    await cached_user_repo.get_by_id(user.id)  # type: ignore[arg-type]
+
+    assert mock_user_repo.get_by_id.call_count == 2
@@ -0,0 +1,25 @@
+import pytest
+
+from mini_x.repositories.user.user import prefix_upper_bound
+
+
+@pytest.mark.parametrize(
+    ("prefix", "upper_bound"),
+    [
+        ("al", "am"),
+        ("a_%", "a_&"),
+        ("z\ud7ff", "z\ue000"),
+        ("a\U0010ffff", "b"),
+        ("\U0010ffff", None),
+    ],
+)
+def test_prefix_upper_bound(prefix: str, upper_bound: str | None) -> None:
+    assert prefix_upper_bound(prefix) == upper_bound
+
+
+@pytest.mark.parametrize("username", ["al", "alice", "al\U0010ffff", "al_z"])
+def test_prefix_upper_bound_is_above_matches(username: str) -> None:
+    upper_bound = prefix_upper_bound("al")
+
+    assert upper_bound is not None
+    assert username.encode() < upper_bound.encode()
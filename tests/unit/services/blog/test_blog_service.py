@@ -1,49 +1,72 @@
 import uuid
-from unittest.mock import Mock, AsyncMock
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, NamedTuple
+from unittest.mock import Mock
 
 import pytest
+from pydantic import ValidationError
 
-from mini_x.api.v1.models.blog import BlogPostCreate, BlogPostUpdate
+from mini_x.api.v1.models.blog import (
+    BlogPostBatchCreate,
+    BlogPostCreate,
+    BlogPostRead,
+    BlogPostUpdate,
+)
+from mini_x.authentication.principal import Principal
+from mini_x.infra.cache.memory import InMemoryCacheBackend
 from mini_x.infra.db.models.blog import BlogPost
+from mini_x.infra.db.session import AfterCommitHook
 from mini_x.services.blog.blog_service import BlogService
+from mini_x.services.blog.cursor import encode_post_cursor
 from mini_x.services.blog.error import (
+    BlogServiceBatchTooLargeException,
     BlogServiceException,
+    BlogServiceInvalidCursorException,
+    BlogServiceInvalidSearchQueryException,
     BlogServiceUnAuthorizedException,
 )
+from mini_x.services.blog.post_cache import PostCache, PostCacheStatus
+from mini_x.services.timeline.timeline_service import TimelineService
+from mini_x.settings.blog_settings import get_blog_settings
 
+CREATED_AT = datetime(2024, 6, 1, 12, 0)
 
-@pytest.fixture
-def mock_user_service() -> Mock:
-    return AsyncMock()
+
+class SearchHit(NamedTuple):
+    id: uuid.UUID
+    user_id: uuid.UUID
+    content: str
+    created_at: datetime
+    updated_at: datetime
+    rank: float
 
 
 @pytest.fixture
-def blog_service(mock_blog_repo: Mock, mock_user_service: Mock) -> BlogService:
-    return BlogService(blog_repository=mock_blog_repo, user_service=mock_user_service)
+def blog_service(mock_blog_repo: Mock) -> BlogService:
+    return BlogService(blog_repository=mock_blog_repo)
 
 
 @pytest.mark.asyncio
-async def test_create_post(
-    blog_service: BlogService, mock_blog_repo: Mock, mock_user_service: Mock
-) -> None:
+async def test_create_post(blog_service: BlogService, mock_blog_repo: Mock) -> None:
     user_id = uuid.uuid4()
     post_data = BlogPostCreate(content="Test content")
-    user_token = "test_token"
-    current_user = Mock(id=user_id)
+    principal = Principal(user_id=user_id, username="test_user")
 
     blog_post = BlogPost(
         id=uuid.uuid4(),
         user_id=user_id,
         content=post_data.content,
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
     )
 
-    mock_user_service.get_current_user.return_value = current_user
     mock_blog_repo.create_post.return_value = blog_post
 
-    created_post = await blog_service.create_post(post_data, user_token)
+    created_post = await blog_service.create_post(post_data, principal)
 
     assert created_post.content == post_data.content
     assert created_post.user_id == user_id
+    mock_blog_repo.create_post.assert_called_once_with(user_id, post_data.content)
 
 
 @pytest.mark.asyncio
@@ -53,6 +76,8 @@ async def test_get_post_by_id(blog_service: BlogService, mock_blog_repo: Mock) -
         id=post_id,
         user_id=uuid.uuid4(),
         content="Test content",
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
     )
 
     mock_blog_repo.get_post_by_id.return_value = blog_post
@@ -75,149 +100,535 @@ async def test_get_post_by_id_not_found(
         await blog_service.get_post_by_id(post_id)
 
 
+@pytest.mark.asyncio
+async def test_create_post_fans_out(mock_blog_repo: Mock) -> None:
+    timeline_service = Mock(spec=TimelineService)
+    blog_service = BlogService(mock_blog_repo, timeline_service=timeline_service)
+    principal = Principal(user_id=uuid.uuid4(), username="test_user")
+    blog_post = BlogPost(
+        id=uuid.uuid4(),
+        user_id=principal.user_id,
+        content="Test content",
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
+    )
+    mock_blog_repo.create_post.return_value = blog_post
+
+    await blog_service.create_post(BlogPostCreate(content="Test content"), principal)
+
+    timeline_service.fan_out_posts.assert_called_once_with(
+        principal.user_id, [blog_post]
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_post_fanned_out_by_the_repository(mock_blog_repo: Mock) -> None:
+    timeline_service = Mock(spec=TimelineService)
+    blog_service = BlogService(
+        mock_blog_repo,
+        timeline_service=timeline_service,
+        created_post_fanned_out=True,
+    )
+    principal = Principal(user_id=uuid.uuid4(), username="test_user")
+    mock_blog_repo.create_post.return_value = BlogPost(
+        id=uuid.uuid4(),
+        user_id=principal.user_id,
+        content="Test content",
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
+    )
+
+    await blog_service.create_post(BlogPostCreate(content="Test content"), principal)
+
+    timeline_service.fan_out_posts.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_posts(blog_service: BlogService, mock_blog_repo: Mock) -> None:
+    user_id = uuid.uuid4()
+    principal = Principal(user_id=user_id, username="test_user")
+    batch_create = BlogPostBatchCreate(
+        items=[BlogPostCreate(content=f"Test content {i}") for i in range(2)]
+    )
+    mock_blog_repo.create_posts.return_value = [
+        BlogPost(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            content=post_data.content,
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+        )
+        for post_data in batch_create.items
+    ]
+
+    created_posts = await blog_service.create_posts(
+        batch_create, principal, max_items=2
+    )
+
+    assert [post.content for post in created_posts] == [
+        "Test content 0",
+        "Test content 1",
+    ]
+    mock_blog_repo.create_posts.assert_called_once_with(
+        user_id, ["Test content 0", "Test content 1"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_posts_too_many(
+    blog_service: BlogService, mock_blog_repo: Mock
+) -> None:
+    principal = Principal(user_id=uuid.uuid4(), username="test_user")
+    batch_create = BlogPostBatchCreate(
+        items=[BlogPostCreate(content=f"Test content {i}") for i in range(3)]
+    )
+
+    with pytest.raises(BlogServiceBatchTooLargeException):
+        await blog_service.create_posts(batch_create, principal, max_items=2)
+
+    mock_blog_repo.create_posts.assert_not_called()
+
+
+def test_batch_create_over_the_setting_is_invalid() -> None:
+    max_items = get_blog_settings().batch_create_max_items
+
+    with pytest.raises(ValidationError):
+        BlogPostBatchCreate(
+            items=[BlogPostCreate(content="Test content")] * (max_items + 1)
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_posts_by_ids(
+    blog_service: BlogService, mock_blog_repo: Mock
+) -> None:
+    post_ids = [uuid.uuid4() for _ in range(2)]
+    blog_posts = [
+        BlogPost(
+            id=post_id,
+            user_id=uuid.uuid4(),
+            content=f"Test content {i}",
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+        )
+        for i, post_id in enumerate(post_ids)
+    ]
+    missing_id = uuid.uuid4()
+    requested_ids: list[uuid.UUID] = [post_ids[1], missing_id, post_ids[0], post_ids[1]]
+
+    mock_blog_repo.get_posts_by_ids.return_value = blog_posts
+
+    batch = await blog_service.get_posts_by_ids(requested_ids, max_ids=10)
+
+    assert [post.id for post in batch.items] == [post_ids[1], post_ids[0]]
+    assert batch.missing_ids == [missing_id]
+    mock_blog_repo.get_posts_by_ids.assert_called_once_with(requested_ids[:3])
+
+
+@pytest.mark.asyncio
+async def test_get_posts_by_ids_too_many(
+    blog_service: BlogService, mock_blog_repo: Mock
+) -> None:
+    with pytest.raises(BlogServiceBatchTooLargeException):
+        await blog_service.get_posts_by_ids([uuid.uuid4() for _ in range(3)], max_ids=2)
+
+    mock_blog_repo.get_posts_by_ids.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_posts_by_user_id(
     blog_service: BlogService, mock_blog_repo: Mock
 ) -> None:
     user_id = uuid.uuid4()
     blog_posts = [
-        BlogPost(id=uuid.uuid4(), user_id=user_id, content="Test content 1"),
-        BlogPost(id=uuid.uuid4(), user_id=user_id, content="Test content 2"),
+        BlogPost(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            content="Test content 1",
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+        ),
+        BlogPost(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            content="Test content 2",
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+        ),
     ]
 
     mock_blog_repo.get_posts_by_user_id.return_value = blog_posts
 
-    retrieved_posts = await blog_service.get_posts_by_user_id(user_id)
+    retrieved_page = await blog_service.get_posts_by_user_id(user_id)
+
+    assert len(retrieved_page.items) == 2
+    assert retrieved_page.items[0].content == blog_posts[0].content
+    assert retrieved_page.items[1].content == blog_posts[1].content
+    assert retrieved_page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_posts_by_user_id_next_cursor(
+    blog_service: BlogService, mock_blog_repo: Mock
+) -> None:
+    user_id = uuid.uuid4()
+    created_at = CREATED_AT
+    blog_posts = [
+        BlogPost(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            content=f"Test content {i}",
+            created_at=created_at - timedelta(minutes=i),
+            updated_at=CREATED_AT,
+        )
+        for i in range(3)
+    ]
+
+    mock_blog_repo.get_posts_by_user_id.return_value = blog_posts
+
+    first_page = await blog_service.get_posts_by_user_id(user_id, limit=2)
+
+    assert [post.id for post in first_page.items] == [
+        blog_posts[0].id,
+        blog_posts[1].id,
+    ]
+    assert first_page.next_cursor is not None
+    mock_blog_repo.get_posts_by_user_id.assert_called_with(user_id, 0, 3, None)
+
+    mock_blog_repo.get_posts_by_user_id.return_value = blog_posts[2:]
+
+    second_page = await blog_service.get_posts_by_user_id(
+        user_id, limit=2, cursor=first_page.next_cursor
+    )
+
+    assert [post.id for post in second_page.items] == [blog_posts[2].id]
+    assert second_page.next_cursor is None
+    mock_blog_repo.get_posts_by_user_id.assert_called_with(
+        user_id, 0, 3, (blog_posts[1].created_at, blog_posts[1].id)
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_posts_by_user_id_invalid_cursor(
+    blog_service: BlogService, mock_blog_repo: Mock
+) -> None:
+    with pytest.raises(BlogServiceInvalidCursorException):
+        await blog_service.get_posts_by_user_id(uuid.uuid4(), cursor="not-a-cursor")
+
+    mock_blog_repo.get_posts_by_user_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_posts_by_user_id_cursor_with_timezone(
+    blog_service: BlogService, mock_blog_repo: Mock
+) -> None:
+    cursor = encode_post_cursor(CREATED_AT.replace(tzinfo=timezone.utc), uuid.uuid4())
+
+    with pytest.raises(BlogServiceInvalidCursorException):
+        await blog_service.get_posts_by_user_id(uuid.uuid4(), cursor=cursor)
+
+    mock_blog_repo.get_posts_by_user_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_posts_next_cursor(
+    blog_service: BlogService, mock_blog_repo: Mock
+) -> None:
+    hits = [
+        SearchHit(
+            uuid.uuid4(),
+            uuid.uuid4(),
+            f"cat {i}",
+            CREATED_AT,
+            CREATED_AT,
+            0.5 / (i + 1),
+        )
+        for i in range(3)
+    ]
+
+    mock_blog_repo.search_posts.return_value = hits
+
+    first_page = await blog_service.search_posts(" cat ", limit=2)
+
+    assert [post.id for post in first_page.items] == [hits[0].id, hits[1].id]
+    assert first_page.next_cursor is not None
+    mock_blog_repo.search_posts.assert_called_with("cat", 3, None)
+
+    mock_blog_repo.search_posts.return_value = hits[2:]
+
+    second_page = await blog_service.search_posts(
+        "cat", limit=2, cursor=first_page.next_cursor
+    )
 
-    assert len(retrieved_posts) == 2
-    assert retrieved_posts[0].content == blog_posts[0].content
-    assert retrieved_posts[1].content == blog_posts[1].content
+    assert [post.id for post in second_page.items] == [hits[2].id]
+    assert second_page.next_cursor is None
+    mock_blog_repo.search_posts.assert_called_with("cat", 3, (hits[1].rank, hits[1].id))
 
 
 @pytest.mark.asyncio
-async def test_update_post(
-    blog_service: BlogService, mock_blog_repo: Mock, mock_user_service: Mock
+async def test_search_posts_caps_limit(
+    blog_service: BlogService, mock_blog_repo: Mock
 ) -> None:
+    mock_blog_repo.search_posts.return_value = []
+
+    await blog_service.search_posts("cat", limit=1_000, max_limit=20)
+
+    mock_blog_repo.search_posts.assert_called_once_with("cat", 21, None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", ["   ", "x" * 201])
+async def test_search_posts_invalid_query(
+    blog_service: BlogService, mock_blog_repo: Mock, query: str
+) -> None:
+    with pytest.raises(BlogServiceInvalidSearchQueryException):
+        await blog_service.search_posts(query, max_query_length=200)
+
+    mock_blog_repo.search_posts.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stream_posts_by_user_id(
+    blog_service: BlogService, mock_blog_repo: Mock
+) -> None:
+    user_id = uuid.uuid4()
+    blog_posts = [
+        BlogPost(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            content=f"Test content {i}",
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+        )
+        for i in range(3)
+    ]
+
+    async def stream_posts(
+        user_id: uuid.UUID, batch_size: int
+    ) -> AsyncIterator[BlogPost]:
+        for post in blog_posts:
+            yield post
+
+    mock_blog_repo.stream_posts_by_user_id.side_effect = stream_posts
+
+    posts = [post async for post in blog_service.stream_posts_by_user_id(user_id, 2)]
+
+    assert [post.id for post in posts] == [post.id for post in blog_posts]
+    mock_blog_repo.stream_posts_by_user_id.assert_called_once_with(user_id, 2)
+
+
+@pytest.mark.asyncio
+async def test_update_post(blog_service: BlogService, mock_blog_repo: Mock) -> None:
     post_id = uuid.uuid4()
     post_data = BlogPostUpdate(content="Updated content")
-    user_token = "test_token"
     user_id = uuid.uuid4()
-    current_user = Mock(id=user_id)
-    blog_post = BlogPost(
-        id=post_id,
-        user_id=user_id,
-        content="Original content",
-    )
+    principal = Principal(user_id=user_id, username="test_user")
     updated_blog_post = BlogPost(
         id=post_id,
         user_id=user_id,
         content=post_data.content,
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
     )
 
-    mock_user_service.get_current_user.return_value = current_user
-    mock_blog_repo.get_post_by_id.return_value = blog_post
     mock_blog_repo.update_post.return_value = updated_blog_post
 
-    updated_post = await blog_service.update_post(post_id, post_data, user_token)
+    updated_post = await blog_service.update_post(post_id, post_data, principal)
 
     assert updated_post.content == post_data.content
+    mock_blog_repo.update_post.assert_called_once_with(
+        post_id, user_id, post_data.content
+    )
+    mock_blog_repo.get_post_owner_id.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_update_post_not_found(
-    blog_service: BlogService, mock_blog_repo: Mock, mock_user_service: Mock
+    blog_service: BlogService, mock_blog_repo: Mock
 ) -> None:
     post_id = uuid.uuid4()
     post_data = BlogPostUpdate(content="Updated content")
-    user_token = "test_token"
     user_id = uuid.uuid4()
-    current_user = Mock(id=user_id)
+    principal = Principal(user_id=user_id, username="test_user")
 
-    mock_user_service.get_current_user.return_value = current_user
-    mock_blog_repo.get_post_by_id.return_value = None
+    mock_blog_repo.update_post.return_value = None
+    mock_blog_repo.get_post_owner_id.return_value = None
 
     with pytest.raises(BlogServiceException):
-        await blog_service.update_post(post_id, post_data, user_token)
+        await blog_service.update_post(post_id, post_data, principal)
 
 
 @pytest.mark.asyncio
 async def test_update_post_unauthorized(
-    blog_service: BlogService, mock_blog_repo: Mock, mock_user_service: Mock
+    blog_service: BlogService, mock_blog_repo: Mock
 ) -> None:
     post_id = uuid.uuid4()
     post_data = BlogPostUpdate(content="Updated content")
-    user_token = "test_token"
     user_id = uuid.uuid4()
     different_user_id = uuid.uuid4()
-    current_user = Mock(id=user_id)
-    blog_post = BlogPost(
-        id=post_id,
-        user_id=different_user_id,
-        content="Original content",
-    )
+    principal = Principal(user_id=user_id, username="test_user")
 
-    mock_user_service.get_current_user.return_value = current_user
-    mock_blog_repo.get_post_by_id.return_value = blog_post
+    mock_blog_repo.update_post.return_value = None
+    mock_blog_repo.get_post_owner_id.return_value = different_user_id
 
     with pytest.raises(BlogServiceUnAuthorizedException):
-        await blog_service.update_post(post_id, post_data, user_token)
+        await blog_service.update_post(post_id, post_data, principal)
 
 
 @pytest.mark.asyncio
-async def test_delete_post(
-    blog_service: BlogService, mock_blog_repo: Mock, mock_user_service: Mock
-) -> None:
+async def test_delete_post(blog_service: BlogService, mock_blog_repo: Mock) -> None:
     post_id = uuid.uuid4()
-    user_token = "test_token"
     user_id = uuid.uuid4()
-    current_user = Mock(id=user_id)
-    blog_post = BlogPost(
-        id=post_id,
-        user_id=user_id,
-        content="Test content",
-    )
+    principal = Principal(user_id=user_id, username="test_user")
 
-    mock_user_service.get_current_user.return_value = current_user
-    mock_blog_repo.get_post_by_id.return_value = blog_post
+    mock_blog_repo.delete_post.return_value = True
 
-    await blog_service.delete_post(post_id, user_token)
+    await blog_service.delete_post(post_id, principal)
 
-    mock_blog_repo.delete_post.assert_called_once_with(post_id)
+    mock_blog_repo.delete_post.assert_called_once_with(post_id, user_id)
+    mock_blog_repo.get_post_owner_id.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_delete_post_not_found(
-    blog_service: BlogService, mock_blog_repo: Mock, mock_user_service: Mock
+    blog_service: BlogService, mock_blog_repo: Mock
 ) -> None:
     post_id = uuid.uuid4()
-    user_token = "test_token"
     user_id = uuid.uuid4()
-    current_user = Mock(id=user_id)
+    principal = Principal(user_id=user_id, username="test_user")
 
-    mock_user_service.get_current_user.return_value = current_user
-    mock_blog_repo.get_post_by_id.return_value = None
+    mock_blog_repo.delete_post.return_value = False
+    mock_blog_repo.get_post_owner_id.return_value = None
 
     with pytest.raises(BlogServiceException):
-        await blog_service.delete_post(post_id, user_token)
+        await blog_service.delete_post(post_id, principal)
 
 
 @pytest.mark.asyncio
 async def test_delete_post_unauthorized(
-    blog_service: BlogService, mock_blog_repo: Mock, mock_user_service: Mock
+    blog_service: BlogService, mock_blog_repo: Mock
 ) -> None:
     post_id = uuid.uuid4()
-    user_token = "test_token"
     user_id = uuid.uuid4()
     different_user_id = uuid.uuid4()
-    current_user = Mock(id=user_id)
-    blog_post = BlogPost(
+    principal = Principal(user_id=user_id, username="test_user")
+
+    mock_blog_repo.delete_post.return_value = False
+    mock_blog_repo.get_post_owner_id.return_value = different_user_id
+
+    with pytest.raises(BlogServiceUnAuthorizedException):
+        await blog_service.delete_post(post_id, principal)
+
+
+@pytest.fixture
+def post_cache() -> PostCache:
+    return PostCache(InMemoryCacheBackend(max_size=10, ttl_seconds=60), ttl_seconds=60)
+
+
+@pytest.fixture
+def cached_blog_service(mock_blog_repo: Mock, post_cache: PostCache) -> BlogService:
+    return BlogService(blog_repository=mock_blog_repo, post_cache=post_cache)
+
+
+@pytest.mark.asyncio
+async def test_get_post_by_id_is_read_through_cached(
+    cached_blog_service: BlogService, mock_blog_repo: Mock, post_cache: PostCache
+) -> None:
+    post_id = uuid.uuid4()
+    mock_blog_repo.get_post_by_id.return_value = BlogPost(
         id=post_id,
-        user_id=different_user_id,
+        user_id=uuid.uuid4(),
         content="Test content",
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
     )
 
-    mock_user_service.get_current_user.return_value = current_user
-    mock_blog_repo.get_post_by_id.return_value = blog_post
+    first_read = await cached_blog_service.get_post_by_id(post_id)
+    second_read = await cached_blog_service.get_post_by_id(post_id)
 
-    with pytest.raises(BlogServiceUnAuthorizedException):
-        await blog_service.delete_post(post_id, user_token)
+    assert second_read == first_read
+    mock_blog_repo.get_post_by_id.assert_called_once_with(post_id)
+    assert post_cache.get_status() == PostCacheStatus(hits=1, misses=1, errors=0)
+
+
+@pytest.mark.asyncio
+async def test_update_post_invalidates_cached_post(
+    cached_blog_service: BlogService, mock_blog_repo: Mock, post_cache: PostCache
+) -> None:
+    post_id = uuid.uuid4()
+    principal = Principal(user_id=uuid.uuid4(), username="test_user")
+    await post_cache.set(
+        BlogPostRead(
+            id=post_id,
+            user_id=principal.user_id,
+            content="Test content",
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+        )
+    )
+    mock_blog_repo.update_post.return_value = BlogPost(
+        id=post_id,
+        user_id=principal.user_id,
+        content="Updated content",
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
+    )
+
+    await cached_blog_service.update_post(
+        post_id, BlogPostUpdate(content="Updated content"), principal
+    )
+
+    assert await post_cache.get(post_id) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_post_invalidates_cached_post(
+    cached_blog_service: BlogService, mock_blog_repo: Mock, post_cache: PostCache
+) -> None:
+    post_id = uuid.uuid4()
+    principal = Principal(user_id=uuid.uuid4(), username="test_user")
+    await post_cache.set(
+        BlogPostRead(
+            id=post_id,
+            user_id=principal.user_id,
+            content="Test content",
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+        )
+    )
+    mock_blog_repo.delete_post.return_value = True
+
+    await cached_blog_service.delete_post(post_id, principal)
+
+    assert await post_cache.get(post_id) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_post_is_invalidated_after_commit(
+    mock_blog_repo: Mock, post_cache: PostCache
+) -> None:
+    after_commit_hooks: list[AfterCommitHook] = []
+    blog_service = BlogService(
+        blog_repository=mock_blog_repo,
+        post_cache=post_cache,
+        after_commit=after_commit_hooks.append,
+    )
+    post_id = uuid.uuid4()
+    principal = Principal(user_id=uuid.uuid4(), username="test_user")
+    await post_cache.set(
+        BlogPostRead(
+            id=post_id,
+            user_id=principal.user_id,
+            content="Test content",
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+        )
+    )
+    mock_blog_repo.delete_post.return_value = True
+
+    await blog_service.delete_post(post_id, principal)
+    assert await post_cache.get(post_id) is not None
+
+    for hook in after_commit_hooks:
+        await hook()
+    assert await post_cache.get(post_id) is None
@@ -0,0 +1,295 @@
+import base64
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from mini_x.authentication.principal import Principal
+from mini_x.infra.db.models.blog import BlogPost
+from mini_x.infra.db.models.user import User
+from mini_x.infra.db.session import AfterCommitHook
+from mini_x.repositories.follow.follow_abc import Followee
+from mini_x.repositories.timeline.backfill import TimelineBackfiller
+from mini_x.services.blog.cursor import encode_post_cursor
+from mini_x.services.blog.error import BlogServiceInvalidCursorException
+from mini_x.services.timeline.error import (
+    TimelineServiceException,
+    TimelineServiceUserNotFoundException,
+)
+from mini_x.services.timeline.timeline_service import TimelineService
+
+CREATED_AT = datetime(2024, 6, 1, 12, 0)
+
+
+@pytest.fixture
+def principal() -> Principal:
+    return Principal(user_id=uuid.uuid4(), username="test_user")
+
+
+@pytest.fixture
+def backfiller() -> Mock:
+    return Mock(spec=TimelineBackfiller)
+
+
+@pytest.fixture
+def after_commit_hooks() -> list[AfterCommitHook]:
+    return []
+
+
+@pytest.fixture
+def timeline_service(
+    mock_timeline_repo: Mock,
+    mock_follow_repo: Mock,
+    mock_user_repo: Mock,
+    backfiller: Mock,
+    after_commit_hooks: list[AfterCommitHook],
+) -> TimelineService:
+    return TimelineService(
+        mock_timeline_repo,
+        mock_follow_repo,
+        mock_user_repo,
+        backfiller,
+        fan_out_max_followers=100,
+        fan_out_resume_followers=90,
+        backfill_posts=20,
+        after_commit=after_commit_hooks.append,
+    )
+
+
+@pytest.mark.asyncio
+async def test_follow_backfills_timeline(
+    timeline_service: TimelineService,
+    principal: Principal,
+    mock_follow_repo: Mock,
+    mock_timeline_repo: Mock,
+) -> None:
+    followee_id = uuid.uuid4()
+    mock_follow_repo.follow.return_value = Followee(1, False)
+
+    await timeline_service.follow(principal, followee_id)
+
+    mock_follow_repo.follow.assert_called_once_with(principal.user_id, followee_id)
+    mock_timeline_repo.add_author_posts.assert_called_once_with(
+        principal.user_id, followee_id, 20
+    )
+    mock_follow_repo.set_pulled.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_follow_reaching_threshold_pulls_posts(
+    timeline_service: TimelineService,
+    principal: Principal,
+    mock_follow_repo: Mock,
+    mock_timeline_repo: Mock,
+) -> None:
+    followee_id = uuid.uuid4()
+    mock_follow_repo.follow.return_value = Followee(100, False)
+
+    await timeline_service.follow(principal, followee_id)
+
+    mock_follow_repo.set_posts_pulled.assert_called_once_with(followee_id, True)
+    mock_follow_repo.set_pulled.assert_called_once_with(followee_id, True)
+    mock_timeline_repo.add_author_posts.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("follower_count", [95, 101])
+async def test_follow_pulled_account_flags_the_follow(
+    follower_count: int,
+    timeline_service: TimelineService,
+    principal: Principal,
+    mock_follow_repo: Mock,
+    mock_timeline_repo: Mock,
+) -> None:
+    followee_id = uuid.uuid4()
+    mock_follow_repo.follow.return_value = Followee(follower_count, True)
+
+    await timeline_service.follow(principal, followee_id)
+
+    mock_follow_repo.set_pulled.assert_called_once_with(
+        followee_id, True, principal.user_id
+    )
+    mock_follow_repo.set_posts_pulled.assert_not_called()
+    mock_timeline_repo.add_author_posts.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_follow_again_is_a_no_op(
+    timeline_service: TimelineService,
+    principal: Principal,
+    mock_follow_repo: Mock,
+    mock_timeline_repo: Mock,
+    mock_user_repo: Mock,
+) -> None:
+    mock_follow_repo.follow.return_value = None
+    mock_user_repo.get_by_id.return_value = User(id=uuid.uuid4())
+
+    await timeline_service.follow(principal, uuid.uuid4())
+
+    mock_timeline_repo.add_author_posts.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_follow_unknown_user(
+    timeline_service: TimelineService,
+    principal: Principal,
+    mock_follow_repo: Mock,
+    mock_user_repo: Mock,
+) -> None:
+    mock_follow_repo.follow.return_value = None
+    mock_user_repo.get_by_id.return_value = None
+
+    with pytest.raises(TimelineServiceUserNotFoundException):
+        await timeline_service.follow(principal, uuid.uuid4())
+
+
+@pytest.mark.asyncio
+async def test_follow_self(
+    timeline_service: TimelineService, principal: Principal, mock_follow_repo: Mock
+) -> None:
+    with pytest.raises(TimelineServiceException):
+        await timeline_service.follow(principal, principal.user_id)
+
+    mock_follow_repo.follow.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unfollow_removes_posts_from_timeline(
+    timeline_service: TimelineService,
+    principal: Principal,
+    mock_follow_repo: Mock,
+    mock_timeline_repo: Mock,
+) -> None:
+    followee_id = uuid.uuid4()
+    mock_follow_repo.unfollow.return_value = Followee(5, False)
+
+    await timeline_service.unfollow(principal, followee_id)
+
+    mock_timeline_repo.remove_author_posts.assert_called_once_with(
+        principal.user_id, followee_id
+    )
+    mock_follow_repo.set_posts_pulled.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unfollow_between_thresholds_keeps_pulling(
+    timeline_service: TimelineService,
+    principal: Principal,
+    mock_follow_repo: Mock,
+    after_commit_hooks: list[AfterCommitHook],
+) -> None:
+    mock_follow_repo.unfollow.return_value = Followee(99, True)
+
+    await timeline_service.unfollow(principal, uuid.uuid4())
+
+    mock_follow_repo.set_posts_pulled.assert_not_called()
+    assert after_commit_hooks == []
+
+
+@pytest.mark.asyncio
+async def test_unfollow_below_resume_backfills_after_commit(
+    timeline_service: TimelineService,
+    principal: Principal,
+    mock_follow_repo: Mock,
+    backfiller: Mock,
+    after_commit_hooks: list[AfterCommitHook],
+) -> None:
+    followee_id = uuid.uuid4()
+    mock_follow_repo.unfollow.return_value = Followee(89, True)
+
+    await timeline_service.unfollow(principal, followee_id)
+
+    mock_follow_repo.set_posts_pulled.assert_called_once_with(followee_id, False)
+    backfiller.schedule.assert_not_called()
+
+    for hook in after_commit_hooks:
+        await hook()
+
+    backfiller.schedule.assert_called_once_with(followee_id)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_posts(
+    timeline_service: TimelineService, mock_timeline_repo: Mock
+) -> None:
+    author_id = uuid.uuid4()
+    posts = [BlogPost(id=uuid.uuid4(), created_at=CREATED_AT)]
+
+    await timeline_service.fan_out_posts(author_id, posts)  # type: ignore[arg-type]
+
+    mock_timeline_repo.fan_out_posts.assert_called_once_with(author_id, posts)
+
+
+@pytest.mark.asyncio
+async def test_get_home_timeline_pages(
+    timeline_service: TimelineService,
+    principal: Principal,
+    mock_timeline_repo: Mock,
+) -> None:
+    posts = [
+        BlogPost(
+            id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            content=f"Test content {i}",
+            created_at=CREATED_AT - timedelta(minutes=i),
+            updated_at=CREATED_AT,
+        )
+        for i in range(3)
+    ]
+    mock_timeline_repo.get_home_timeline.return_value = posts
+
+    first_page = await timeline_service.get_home_timeline(principal, limit=2)
+
+    assert [post.id for post in first_page.items] == [posts[0].id, posts[1].id]
+    assert first_page.next_cursor is not None
+    mock_timeline_repo.get_home_timeline.assert_called_with(principal.user_id, 3, None)
+
+    mock_timeline_repo.get_home_timeline.return_value = posts[2:]
+
+    second_page = await timeline_service.get_home_timeline(
+        principal, limit=2, cursor=first_page.next_cursor
+    )
+
+    assert [post.id for post in second_page.items] == [posts[2].id]
+    assert second_page.next_cursor is None
+    mock_timeline_repo.get_home_timeline.assert_called_with(
+        principal.user_id, 3, (posts[1].created_at, posts[1].id)
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_home_timeline_caps_limit(
+    timeline_service: TimelineService,
+    principal: Principal,
+    mock_timeline_repo: Mock,
+) -> None:
+    mock_timeline_repo.get_home_timeline.return_value = []
+
+    await timeline_service.get_home_timeline(principal, limit=1000, max_limit=50)
+
+    mock_timeline_repo.get_home_timeline.assert_called_once_with(
+        principal.user_id, 51, None
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        encode_post_cursor(CREATED_AT, uuid.uuid4())[:-4],
+        base64.urlsafe_b64encode(b'["2024-06-01T12:00:00",1]').decode(),
+    ],
+    ids=["garbage", "truncated", "id_not_a_string"],
+)
+async def test_get_home_timeline_invalid_cursor(
+    cursor: str,
+    timeline_service: TimelineService,
+    principal: Principal,
+    mock_timeline_repo: Mock,
+) -> None:
+    with pytest.raises(BlogServiceInvalidCursorException):
+        await timeline_service.get_home_timeline(principal, cursor=cursor)
+
+    mock_timeline_repo.get_home_timeline.assert_not_called()
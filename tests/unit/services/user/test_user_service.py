@@ -1,4 +1,5 @@
 import uuid
+from typing import NamedTuple
 from unittest.mock import patch, Mock
 
 import pytest
@@ -6,6 +7,9 @@ from passlib.context import CryptContext
 from pydantic import SecretStr
 
 from mini_x.api.v1.models.user import UserCreate, UserUpdate
+from mini_x.authentication.auth_handler import get_principal_from_token
+from mini_x.authentication.password_hasher import PasswordHasher
+from mini_x.authentication.principal import Principal
 from mini_x.infra.db.models.user import User
 from mini_x.services.user.error import (
     UserServiceException,
@@ -17,9 +21,23 @@ from mini_x.settings.secrets_settings import SecretSettings
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+class UserSummaryRow(NamedTuple):
+    id: uuid.UUID
+    username: str
+    full_name: str | None
+
+
 @pytest.fixture
-def user_service(mock_user_repo: Mock, secret_settings: SecretSettings) -> UserService:
-    return UserService(user_repository=mock_user_repo, secret_settings=secret_settings)
+def user_service(
+    mock_user_repo: Mock,
+    secret_settings: SecretSettings,
+    password_hasher: PasswordHasher,
+) -> UserService:
+    return UserService(
+        user_repository=mock_user_repo,
+        secret_settings=secret_settings,
+        password_hasher=password_hasher,
+    )
 
 
 @pytest.fixture()
@@ -42,9 +60,14 @@ def hashed_password() -> str:
 
 
 @pytest.fixture()
-def user(hashed_password: str) -> User:
+def user_id() -> uuid.UUID:
+    return uuid.uuid4()
+
+
+@pytest.fixture()
+def user(user_id: uuid.UUID, hashed_password: str) -> User:
     return User(
-        id=uuid.uuid4(),
+        id=user_id,
         username="test_user",
         email="test@case.com",
         hashed_password=hashed_password,
@@ -56,12 +79,17 @@ def user(hashed_password: str) -> User:
     )
 
 
+@pytest.fixture()
+def principal(user_id: uuid.UUID) -> Principal:
+    # Built from plain values, the model's attributes are typed as columns.
+    return Principal(user_id=user_id, username="test_user")
+
+
 @pytest.mark.asyncio
 async def test_register_user(
     user_create: UserCreate, user_service: UserService, mock_user_repo: Mock
 ) -> None:
-    mock_user_repo.get_by_email.return_value = None
-    mock_user_repo.get_by_username.return_value = None
+    mock_user_repo.create_user.side_effect = lambda user: user
 
     with patch(
         "mini_x.authentication.auth_handler.get_password_hash",
@@ -71,17 +99,31 @@ async def test_register_user(
 
     assert user_read.username == user_create.username
     assert user_read.email == user_create.email
+    mock_user_repo.get_by_email.assert_not_called()
+    mock_user_repo.get_by_username.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_register_user_existing_email(
-    user_create: UserCreate, user_service: UserService, mock_user_repo: Mock
+@pytest.mark.parametrize(
+    "existing_email, message",
+    [("existing_user", "Email"), (None, "User")],
+    ids=["email_taken", "username_taken"],
+)
+async def test_register_user_conflict(
+    existing_email: str | None,
+    message: str,
+    user_create: UserCreate,
+    user_service: UserService,
+    mock_user_repo: Mock,
 ) -> None:
-    mock_user_repo.get_by_email.return_value = "existing_user"
+    mock_user_repo.create_user.return_value = None
+    mock_user_repo.get_by_email.return_value = existing_email
 
-    with pytest.raises(UserServiceException):
+    with pytest.raises(UserServiceException, match=message):
         await user_service.register_user(user_create)
 
+    mock_user_repo.get_by_email.assert_called_once_with(user_create.email)
+
 
 @pytest.mark.asyncio
 async def test_authenticate_user(
@@ -120,7 +162,7 @@ async def test_authenticate_user_invalid_password(
 
 @pytest.mark.asyncio
 async def test_login_user(
-    user: User, user_service: UserService, mock_user_repo: Mock
+    user: User, principal: Principal, user_service: UserService, mock_user_repo: Mock
 ) -> None:
     password = "password123"
 
@@ -131,6 +173,10 @@ async def test_login_user(
 
     assert login_response is not None
     assert "access_token" in login_response
+    token_principal = get_principal_from_token(
+        login_response["access_token"], user_service._secret_settings
+    )
+    assert token_principal == principal
 
 
 @pytest.mark.asyncio
@@ -151,9 +197,8 @@ async def test_login_user_invalid_credentials(
 
 @pytest.mark.asyncio
 async def test_update_user_profile(
-    user: User, user_service: UserService, mock_user_repo: Mock
+    user: User, principal: Principal, user_service: UserService, mock_user_repo: Mock
 ) -> None:
-    user_from_token = "test_user"
     user_update = UserUpdate(
         full_name="Updated Test User",
         street_address="123 Updated St",
@@ -175,12 +220,14 @@ async def test_update_user_profile(
         created_at=user.created_at,
     )
 
-    mock_user_repo.get_by_username.return_value = user
-    mock_user_repo.get_by_id.return_value = updated_user
+    mock_user_repo.update_user.return_value = updated_user
+
+    updated_user_read = await user_service.update_user_profile(principal, user_update)
 
-    updated_user_read = await user_service.update_user_profile(
-        user_from_token, user_update
+    mock_user_repo.update_user.assert_called_once_with(
+        user.id, user_update.model_dump()
     )
+    mock_user_repo.get_by_id.assert_not_called()
 
     assert updated_user_read.full_name == user_update.full_name
     assert updated_user_read.street_address == user_update.street_address
@@ -190,25 +237,59 @@ async def test_update_user_profile(
 
 
 @pytest.mark.asyncio
-async def test_get_current_user(
-    user: User, user_service: UserService, mock_user_repo: Mock
+async def test_update_user_profile_skips_empty_fields(
+    user: User, principal: Principal, user_service: UserService, mock_user_repo: Mock
 ) -> None:
-    user_from_token = "test_user"
+    mock_user_repo.update_user.return_value = user
+
+    await user_service.update_user_profile(principal, UserUpdate(city="New City"))
+
+    mock_user_repo.update_user.assert_called_once_with(user.id, {"city": "New City"})
+
+
+@pytest.mark.asyncio
+async def test_update_user_profile_unknown_user(
+    principal: Principal, user_service: UserService, mock_user_repo: Mock
+) -> None:
+    mock_user_repo.update_user.return_value = None
+
+    with pytest.raises(UserServiceUnAuthorizedException):
+        await user_service.update_user_profile(principal, UserUpdate(city="New City"))
 
-    mock_user_repo.get_by_username.return_value = user
 
-    current_user_read = await user_service.get_current_user(user_from_token)
+@pytest.mark.asyncio
+async def test_get_current_user(
+    user: User, principal: Principal, user_service: UserService, mock_user_repo: Mock
+) -> None:
+    mock_user_repo.get_by_id.return_value = user
+
+    current_user_read = await user_service.get_current_user(principal)
 
     assert current_user_read.username == user.username
+    mock_user_repo.get_by_id.assert_called_once_with(user.id)
 
 
 @pytest.mark.asyncio
 async def test_get_current_user_unauthorized(
     user_service: UserService, mock_user_repo: Mock
 ) -> None:
-    user_from_token = "unauthorized_user"
+    principal = Principal(user_id=uuid.uuid4(), username="unauthorized_user")
 
-    mock_user_repo.get_by_username.return_value = None
+    mock_user_repo.get_by_id.return_value = None
 
     with pytest.raises(UserServiceUnAuthorizedException):
-        await user_service.get_current_user(user_from_token)
+        await user_service.get_current_user(principal)
+
+
+@pytest.mark.asyncio
+async def test_search_users(user_service: UserService, mock_user_repo: Mock) -> None:
+    rows = [
+        UserSummaryRow(uuid.uuid4(), "alice", "Alice"),
+        UserSummaryRow(uuid.uuid4(), "alicia", None),
+    ]
+    mock_user_repo.search_by_username.return_value = rows
+
+    users = await user_service.search_users("ali", 5)
+
+    assert [(user.id, user.username, user.full_name) for user in users] == rows
+    mock_user_repo.search_by_username.assert_called_once_with("ali", 5)
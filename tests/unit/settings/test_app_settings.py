@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import pytest
+
+from mini_x.settings.app_settings import get_cgroup_cpu_limit
+
+
+@pytest.mark.parametrize(
+    "cpu_max, cpu_limit",
+    [("max 100000\n", None), ("150000 100000\n", 2), ("50000 100000\n", 1)],
+    ids=["unlimited", "rounded_up", "at_least_one"],
+)
+def test_cgroup_v2_cpu_limit(
+    tmp_path: Path, cpu_max: str, cpu_limit: int | None
+) -> None:
+    (tmp_path / "cpu.max").write_text(cpu_max)
+
+    assert get_cgroup_cpu_limit(tmp_path) == cpu_limit
+
+
+def test_cgroup_v1_cpu_limit(tmp_path: Path) -> None:
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("400000\n")
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+
+    assert get_cgroup_cpu_limit(tmp_path) == 4
+
+
+def test_no_cgroup_no_cpu_limit(tmp_path: Path) -> None:
+    assert get_cgroup_cpu_limit(tmp_path) is None
@@ -0,0 +1,95 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI
+
+from mini_x.api.v1.routes.health import ready
+from mini_x import lifespan as lifespan_module
+from mini_x.lifespan import lifespan
+from mini_x.readiness import Readiness
+from mini_x.settings.pg_database_settings import PGDatabaseSettings
+
+
+@pytest.fixture
+def readiness(monkeypatch: pytest.MonkeyPatch) -> Readiness:
+    readiness = Readiness()
+    monkeypatch.setattr(lifespan_module, "get_readiness", lambda: readiness)
+    return readiness
+
+
+@pytest.fixture
+def dispose_engine(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    dispose_engine = AsyncMock()
+    monkeypatch.setattr(lifespan_module, "dispose_engine", dispose_engine)
+    return dispose_engine
+
+
+@pytest.mark.asyncio
+async def test_warm_up_retries_until_ready(
+    monkeypatch: pytest.MonkeyPatch, readiness: Readiness
+) -> None:
+    warm_up_pool = AsyncMock(side_effect=[OSError("connection refused"), None])
+    monkeypatch.setattr(lifespan_module, "warm_up_pool", warm_up_pool)
+
+    await lifespan_module._warm_up(
+        readiness, PGDatabaseSettings(warm_up_retry_seconds=0.001)
+    )
+
+    assert readiness.ready
+    assert warm_up_pool.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_created_resources_only(
+    monkeypatch: pytest.MonkeyPatch, readiness: Readiness, dispose_engine: AsyncMock
+) -> None:
+    monkeypatch.setattr(lifespan_module, "warm_up_pool", AsyncMock())
+    created = Mock(return_value=None)
+    created.cache_info.return_value.currsize = 1
+    not_created = Mock()
+    not_created.cache_info.return_value.currsize = 0
+    monkeypatch.setattr(lifespan_module, "get_post_write_batcher", created)
+    monkeypatch.setattr(lifespan_module, "get_post_cache", created)
+    monkeypatch.setattr(lifespan_module, "get_password_hasher", not_created)
+
+    async with lifespan(FastAPI()):
+        pass
+
+    assert not readiness.ready
+    dispose_engine.assert_awaited_once()
+    not_created.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_stops_warm_up_before_disposing(
+    monkeypatch: pytest.MonkeyPatch, readiness: Readiness, dispose_engine: AsyncMock
+) -> None:
+    events: list[str] = []
+
+    async def hanging_warm_up_pool(*args: object) -> None:
+        try:
+            await asyncio.Event().wait()
+        finally:
+            # Yields once more, as closing a half open connection would.
+            await asyncio.sleep(0)
+            events.append("warm-up stopped")
+
+    monkeypatch.setattr(lifespan_module, "warm_up_pool", hanging_warm_up_pool)
+    dispose_engine.side_effect = lambda: events.append("disposed")
+
+    async with lifespan(FastAPI()):
+        await asyncio.sleep(0)
+
+    assert events == ["warm-up stopped", "disposed"]
+
+
+@pytest.mark.asyncio
+async def test_ready_once_warmed_up() -> None:
+    readiness = Readiness()
+
+    assert (await ready(readiness)).status_code == 503
+
+    readiness.set_ready(True)
+
+    assert (await ready(readiness)).status_code == 200
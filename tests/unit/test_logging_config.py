@@ -0,0 +1,57 @@
+import json
+import logging
+import queue
+
+from mini_x.logging_config import DroppingQueueHandler, JsonFormatter
+
+
+def test_json_formatter_includes_extra_fields() -> None:
+    record = logging.LogRecord(
+        "mini_x.access", logging.INFO, __file__, 1, "GET %s", ("/ok",), None
+    )
+    record.request_id = "abc"
+    record.latency_ms = 1.5
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "GET /ok"
+    assert entry["level"] == "INFO"
+    assert entry["request_id"] == "abc"
+    assert entry["latency_ms"] == 1.5
+    assert entry["timestamp"].endswith("Z")
+
+
+def test_queue_handler_drops_when_full() -> None:
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(1)
+    handler = DroppingQueueHandler(log_queue)
+    logger = logging.getLogger("test_queue_handler_drops_when_full")
+    logger.addHandler(handler)
+    logger.propagate = False
+
+    logger.warning("first")
+    logger.warning("second")
+
+    assert log_queue.qsize() == 1
+    assert handler.dropped == 1
+
+
+def test_exceptions_are_formatted_by_the_listener() -> None:
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    handler = DroppingQueueHandler(log_queue)
+    logger = logging.getLogger("test_exceptions_are_formatted_by_the_listener")
+    logger.addHandler(handler)
+    logger.propagate = False
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("Failed for %s", "alice")
+
+    record = log_queue.get_nowait()
+    assert record.exc_info is not None
+    assert record.exc_text is None
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "Failed for alice"
+    assert "ValueError: boom" in entry["exc_info"]
@@ -0,0 +1,59 @@
+import pytest
+
+from mini_x.metrics import Histogram, MetricsWriter
+
+
+@pytest.mark.parametrize(
+    "value, bucket_index",
+    [(0.5, 0), (1.0, 0), (1.5, 1), (3.0, 2)],
+    ids=["below_first_bound", "on_bound", "between_bounds", "above_last_bound"],
+)
+def test_histogram_observe(value: float, bucket_index: int) -> None:
+    histogram = Histogram(buckets=(1.0, 2.0))
+
+    histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot.counts[bucket_index] == 1
+    assert snapshot.count == 1
+    assert snapshot.sum == value
+
+
+def test_metrics_writer_renders_cumulative_buckets() -> None:
+    histogram = Histogram(buckets=(1.0, 2.0))
+    for value in (0.5, 1.5, 3.0):
+        histogram.observe(value)
+    writer = MetricsWriter()
+
+    writer.histogram(
+        "latency_seconds", "Latency.", [({"route": "/"}, histogram.snapshot())]
+    )
+
+    assert writer.render().splitlines() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/",le="1.0"} 1',
+        'latency_seconds_bucket{route="/",le="2.0"} 2',
+        'latency_seconds_bucket{route="/",le="+Inf"} 3',
+        'latency_seconds_sum{route="/"} 5.0',
+        'latency_seconds_count{route="/"} 3',
+    ]
+
+
+def test_metrics_writer_escapes_label_values() -> None:
+    writer = MetricsWriter()
+
+    writer.counter("requests_total", "Requests.", [({"path": 'a"b\\c\n'}, 1)])
+
+    assert writer.render().splitlines()[-1] == 'requests_total{path="a\\"b\\\\c\\n"} 1'
+
+
+def test_writer_adds_const_labels() -> None:
+    writer = MetricsWriter(const_labels={"worker": "7"})
+
+    writer.gauge("in_flight", "In flight.", [({}, 1), ({"route": "/"}, 2)])
+
+    assert writer.render().splitlines()[-2:] == [
+        'in_flight{worker="7"} 1',
+        'in_flight{route="/",worker="7"} 2',
+    ]